@@ -1,34 +1,258 @@
 from __future__ import annotations
 
-from common_types import ExecutionReport, OrderIntent, Streams
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+
+from common_types import EventBus, ExecutionReport, OrderIntent, Streams
 from exchange_adapters import ExchangeAdapter
+from feature_store import DedupStore, MemoryDedupStore
+
+logger = logging.getLogger(__name__)
+
+PlaceFn = Callable[[OrderIntent], Awaitable[list[tuple[str, dict]]]]
+PublishFn = Callable[[str, dict], Awaitable[object]]
+FailFn = Callable[[OrderIntent, Exception], Awaitable[list[tuple[str, dict]]]]
+ClaimFn = Callable[[OrderIntent], Awaitable[bool]]
+
+
+class OrderDispatcher:
+    def __init__(
+        self,
+        place: PlaceFn,
+        publish: PublishFn,
+        max_concurrency: int = 8,
+        max_pending: int = 1000,
+        on_failure: FailFn | None = None,
+        max_retries: int = 2,
+        retry_backoff_sec: float = 0.2,
+        claim: ClaimFn | None = None,
+    ):
+        self._place = place
+        self._publish = publish
+        self._on_failure = on_failure
+        self._claim = claim
+        self.max_retries = max(0, max_retries)
+        self.retry_backoff_sec = retry_backoff_sec
+        self.max_concurrency = max(1, max_concurrency)
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+        self._capacity = asyncio.Semaphore(max(1, max_pending))
+        # One FIFO lane per (symbol, market); a lane task exists only while its queue is non-empty.
+        self._lanes: dict[tuple[str, str], deque[OrderIntent]] = {}
+        self._lane_tasks: dict[tuple[str, str], asyncio.Task] = {}
+        self.in_flight = 0
+        self.queued = 0
+        self.completed = 0
+        self.retried = 0
+        self.failed = 0
+        self.duplicates = 0
+
+    async def submit(self, intent: OrderIntent) -> None:
+        await self._capacity.acquire()
+        key = (intent.symbol, intent.market)
+        self._lanes.setdefault(key, deque()).append(intent)
+        self.queued += 1
+        if key not in self._lane_tasks:
+            self._lane_tasks[key] = asyncio.create_task(self._run_lane(key))
+
+    async def _run_lane(self, key: tuple[str, str]) -> None:
+        lane = self._lanes[key]
+        try:
+            while lane:
+                intent = lane[0]
+                async with self._slots:
+                    lane.popleft()
+                    self.queued -= 1
+                    self.in_flight += 1
+                    try:
+                        # Claimed only now: an intent still queued when the process dies stays unclaimed for the replay.
+                        if self._claim is not None and not await self._claim(intent):
+                            self.duplicates += 1
+                        else:
+                            for stream, payload in await self._dispatch(intent):
+                                await self._publish(stream, payload)
+                    except Exception:
+                        logger.exception("order dispatch publish failed intent_id=%s symbol=%s market=%s", intent.intent_id, *key)
+                    finally:
+                        self.in_flight -= 1
+                        self._capacity.release()
+        finally:
+            del self._lanes[key]
+            del self._lane_tasks[key]
+
+    async def _dispatch(self, intent: OrderIntent) -> list[tuple[str, dict]]:
+        # The intent is claimed and its stream entry acked, so nothing upstream retries it.
+        # Retries stay in the lane to keep its order.
+        for attempt in range(self.max_retries + 1):
+            try:
+                outputs = await self._place(intent)
+            except Exception as exc:
+                if attempt < self.max_retries:
+                    self.retried += 1
+                    logger.warning("order dispatch retry intent_id=%s attempt=%d: %s", intent.intent_id, attempt + 1, exc)
+                    await asyncio.sleep(self.retry_backoff_sec * (attempt + 1))
+                    continue
+                self.failed += 1
+                logger.exception("order dispatch failed intent_id=%s symbol=%s market=%s", intent.intent_id, intent.symbol, intent.market)
+                return await self._on_failure(intent, exc) if self._on_failure is not None else []
+            self.completed += 1
+            return outputs
+
+    async def drain(self) -> None:
+        while self._lane_tasks:
+            await asyncio.gather(*list(self._lane_tasks.values()))
+
+    def metrics(self) -> dict:
+        return {
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "lanes": len(self._lanes),
+            "max_concurrency": self.max_concurrency,
+            "completed": self.completed,
+            "retried": self.retried,
+            "failed": self.failed,
+            "duplicates": self.duplicates,
+        }
 
 
 class ExecutionService:
-    def __init__(self, adapter: ExchangeAdapter):
+    def __init__(
+        self,
+        adapter: ExchangeAdapter,
+        dedup: DedupStore | None = None,
+        dedup_ttl_sec: int = 86400,
+        dedup_max_items: int = 100_000,
+        bus: EventBus | None = None,
+        max_concurrency: int = 1,
+        max_pending: int = 1000,
+    ):
         self.adapter = adapter
-        self._processed_intents: set[str] = set()
-        self._seen_execution_keys: set[tuple[str, str, float]] = set()
+        self.dedup = dedup if dedup is not None else MemoryDedupStore(max_items=dedup_max_items)
+        self.dedup_ttl_sec = dedup_ttl_sec
+        # Exchange events arrive on a synchronous path and only need suppression within this process.
+        self._seen_execution_keys = MemoryDedupStore(max_items=dedup_max_items)
+        self.dispatcher: OrderDispatcher | None = None
+        if bus is not None and max_concurrency > 1:
+            # The dispatcher retries in place and reports the intent once it gives up.
+            self.dispatcher = OrderDispatcher(
+                lambda intent: self._place(intent, release_claim=False),
+                bus.publish,
+                max_concurrency,
+                max_pending,
+                on_failure=self._placement_failed,
+                claim=self._claim,
+            )
 
     def _is_duplicate_report(self, report: ExecutionReport) -> bool:
-        key = (report.order_id, report.status, round(report.filled_qty, 10))
-        if key in self._seen_execution_keys:
-            return True
-        self._seen_execution_keys.add(key)
-        return False
+        key = f"{report.order_id}|{report.status}|{round(report.filled_qty, 10)}"
+        return self._seen_execution_keys.seen_or_add_nowait(key, self.dedup_ttl_sec)
+
+    async def _claim(self, intent: OrderIntent) -> bool:
+        return not await self.dedup.seen_or_add(f"intent:{intent.intent_id}", self.dedup_ttl_sec)
+
+    async def _place(self, intent: OrderIntent, release_claim: bool = True) -> list[tuple[str, dict]]:
+        try:
+            report: ExecutionReport = await self.adapter.place_order(intent)
+        except Exception:
+            # Release the claim so the intent can be retried once the failure is resolved.
+            if release_claim:
+                await self.dedup.discard(f"intent:{intent.intent_id}")
+            raise
+        if self._is_duplicate_report(report):
+            return []
+        return [(Streams.EXECUTION_REPORT, report.model_dump(mode="json"))]
+
+    async def _placement_failed(self, intent: OrderIntent, exc: Exception) -> list[tuple[str, dict]]:
+        # The report is terminal, so the claim stays: a replay must not place an order downstream already saw rejected.
+        logger.error("order placement failed intent_id=%s symbol=%s market=%s: %s", intent.intent_id, intent.symbol, intent.market, exc)
+        report = ExecutionReport(
+            order_id=f"{intent.market}:{intent.symbol}:failed:{intent.intent_id}",
+            intent_id=intent.intent_id,
+            symbol=intent.symbol,
+            market=intent.market,
+            side=intent.side,
+            status="rejected",
+            filled_qty=0.0,
+            avg_price=0.0,
+            fee=0.0,
+            ts=datetime.now(timezone.utc),
+        )
+        alert = {
+            "schema_version": "1.0",
+            "message": f"Order placement failed intent_id={intent.intent_id} symbol={intent.symbol} market={intent.market}: {exc}",
+            "severity": "error",
+            "source": "execution-service",
+        }
+        return [(Streams.EXECUTION_REPORT, report.model_dump(mode="json")), (Streams.RISK_ALERT, alert)]
 
     async def handle(self, payload: dict) -> list[tuple[str, dict]]:
         intent = OrderIntent.model_validate(payload)
-        if intent.intent_id in self._processed_intents:
+        if self.dispatcher is not None:
+            await self.dispatcher.submit(intent)
             return []
-        report: ExecutionReport = await self.adapter.place_order(intent)
-        self._processed_intents.add(intent.intent_id)
-        if self._is_duplicate_report(report):
+        if not await self._claim(intent):
             return []
-        return [(Streams.EXECUTION_REPORT, report.model_dump(mode="json"))]
+        return await self._place(intent)
+
+    async def handle_batch(self, payloads: list[dict]) -> list[tuple[str, dict]]:
+        intents = [OrderIntent.model_validate(payload) for payload in payloads]
+        if self.dispatcher is not None:
+            # Lanes place one order at a time, so perp coalescing below only applies without the dispatcher.
+            for intent in intents:
+                await self.dispatcher.submit(intent)
+            return []
+        seen = await self.dedup.seen_or_add_many([f"intent:{intent.intent_id}" for intent in intents], self.dedup_ttl_sec)
+        claimed = [intent for intent, duplicate in zip(intents, seen) if not duplicate]
+        # Perp intents that arrive together go out in as few exchange calls as the adapter allows.
+        batched = [intent for intent in claimed if intent.market == "perp"]
+        if len(batched) < 2:
+            batched = []
+        sequential = [intent for intent in claimed if intent.market != "perp"] if batched else claimed
+        outputs: list[tuple[str, dict]] = []
+        if batched:
+            try:
+                results = await self.adapter.place_orders(batched)
+            except Exception:
+                for pending in claimed:
+                    await self.dedup.discard(f"intent:{pending.intent_id}")
+                raise
+            failed: list[tuple[OrderIntent, Exception]] = []
+            for intent, result in zip(batched, results):
+                if isinstance(result, Exception):
+                    failed.append((intent, result))
+                elif not self._is_duplicate_report(result):
+                    outputs.append((Streams.EXECUTION_REPORT, result.model_dump(mode="json")))
+            if len(failed) == len(batched):
+                for pending in claimed:
+                    await self.dedup.discard(f"intent:{pending.intent_id}")
+                raise failed[0][1]
+            for intent, exc in failed:
+                outputs.extend(await self._placement_failed(intent, exc))
+        placed = bool(batched)
+        for idx, intent in enumerate(sequential):
+            try:
+                outputs.extend(await self._place(intent, release_claim=False))
+                placed = True
+            except Exception as exc:
+                if placed:
+                    # A replay would skip the orders already placed and lose their reports; report this one instead.
+                    outputs.extend(await self._placement_failed(intent, exc))
+                    continue
+                # Nothing went out yet: the worker replays the whole batch, so every claim must be free again.
+                for pending in sequential[idx:]:
+                    await self.dedup.discard(f"intent:{pending.intent_id}")
+                raise
+        return outputs
+
+    def metrics(self) -> dict:
+        if self.dispatcher is None:
+            return {}
+        return self.dispatcher.metrics()
 
-    def normalize_adapter_event(self, payload: dict) -> ExecutionReport | None:
-        report = ExecutionReport.model_validate(payload)
+    def normalize_adapter_event(self, payload: dict | ExecutionReport) -> ExecutionReport | None:
+        report = payload if isinstance(payload, ExecutionReport) else ExecutionReport.model_validate(payload)
         if self._is_duplicate_report(report):
             return None
         return report
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import json
 import logging
+import re
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timezone
 
 try:
@@ -21,13 +24,42 @@ except ModuleNotFoundError:  # pragma: no cover
         del args, kwargs
         return None
 
-from common_types import AppSettings, EntityEvent, SignalEvent, Streams
+from common_types import AppSettings, EntityEvent, SignalEvent, SignalRationale, Streams
+from common_types.bus import EventBus
 
 logger = logging.getLogger(__name__)
 
 POSITIVE_KEYWORDS = {"approval", "surge", "adoption", "partnership", "listing", "inflow", "upgrade"}
 NEGATIVE_KEYWORDS = {"hack", "exploit", "lawsuit", "ban", "outflow", "delist", "investigation"}
 
+# The prompt asks for horizon_min ahead of the rationale, so waiting for it costs a few tokens, not the rationale.
+CORE_SIGNAL_FIELDS = ("side", "strength", "confidence", "horizon_min")
+# Provisional signals already on the bus, remembered so a replayed record does not publish them twice.
+_MAX_PUBLISHED_PROVISIONAL = 10_000
+_NUMERIC_FIELD_RE = re.compile(r'"(side|strength|confidence|horizon_min)"\s*:\s*"?(-?\d+(?:\.\d+)?)"?\s*[,}\n]')
+
+
+class IncrementalSignalParser:
+    def __init__(self):
+        self._buffer = ""
+        self._scan_from = 0
+        self.fields: dict[str, float] = {}
+
+    def feed(self, chunk: str) -> None:
+        self._buffer += chunk
+        # Only numeric fields are extracted early; a match needs its terminator so the number is complete.
+        for match in _NUMERIC_FIELD_RE.finditer(self._buffer, self._scan_from):
+            self.fields.setdefault(match.group(1), float(match.group(2)))
+            self._scan_from = match.end()
+
+    @property
+    def has_core(self) -> bool:
+        return all(name in self.fields for name in CORE_SIGNAL_FIELDS)
+
+    @property
+    def text(self) -> str:
+        return self._buffer
+
 
 class LLMProvider:
     def __init__(self, settings: AppSettings):
@@ -46,15 +78,10 @@ class LLMProvider:
         if self._client is None:
             return self._heuristic(title, content)
 
-        prompt = (
-            "You are a crypto event analyst. Return strict JSON with keys: "
-            "side (-1,0,1), strength (0..1), confidence (0..1), horizon_min (int), rationale (short)."
-            f"\nSymbol: {symbol}\nTitle: {title}\nContent: {content[:1500]}"
-        )
         try:
             response = await self._client.chat.completions.create(
                 model=self.settings.openai_model,
-                messages=[{"role": "user", "content": prompt}],
+                messages=[{"role": "user", "content": self._prompt(title, content, symbol)}],
                 temperature=0.1,
             )
             text = (response.choices[0].message.content or "").strip()
@@ -66,6 +93,126 @@ class LLMProvider:
             logger.exception("openai inference failed, fallback heuristic")
             return self._heuristic(title, content)
 
+    async def infer_stream(
+        self,
+        title: str,
+        content: str,
+        symbol: str,
+        on_core: Callable[[dict], Awaitable[None]],
+    ) -> dict:
+        if self._client is None:
+            return self._heuristic(title, content)
+
+        parser = IncrementalSignalParser()
+        core_emitted = False
+        try:
+            stream = await self._client.chat.completions.create(
+                model=self.settings.openai_model,
+                messages=[{"role": "user", "content": self._prompt(title, content, symbol)}],
+                temperature=0.1,
+                stream=True,
+            )
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                parser.feed(delta)
+                if not core_emitted and parser.has_core:
+                    core_emitted = True
+                    await on_core(dict(parser.fields))
+
+            parsed = self._parse_json_text(parser.text.strip())
+            if parsed is None:
+                if not core_emitted:
+                    raise ValueError("model output is not valid json")
+                parsed = {**parser.fields, "rationale": ""}
+            return parsed
+        except Exception:
+            if core_emitted:
+                logger.exception("openai stream broke after core fields, keeping provisional signal")
+                return {**parser.fields, "rationale": ""}
+            logger.exception("openai streaming inference failed, fallback heuristic")
+            return self._heuristic(title, content)
+
+    def _prompt(self, title: str, content: str, symbol: str) -> str:
+        return (
+            "You are a crypto event analyst. Return strict JSON with keys in this order: "
+            "side (-1,0,1), strength (0..1), confidence (0..1), horizon_min (int), rationale (short)."
+            f"\nSymbol: {symbol}\nTitle: {title}\nContent: {content[:1500]}"
+        )
+
+    async def infer_batch(self, events: list[EntityEvent]) -> dict[tuple[str, str], dict]:
+        results: dict[tuple[str, str], dict] = {}
+        if self._client is not None and events:
+            try:
+                items = await self._complete_batch(events)
+                wanted = {(event.event_id, symbol) for event in events for symbol in event.symbols}
+                for item in items:
+                    if not isinstance(item, dict):
+                        continue
+                    key = (str(item.get("event_id", "")), str(item.get("symbol", "")).upper())
+                    if key in wanted:
+                        results[key] = item
+            except Exception:
+                logger.exception("openai batch inference failed, fallback heuristic")
+
+        for event in events:
+            for symbol in event.symbols:
+                key = (event.event_id, symbol)
+                if key not in results:
+                    results[key] = self._heuristic(event.title, event.content)
+        return results
+
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=0.5, min=0.5, max=4), reraise=True)
+    async def _complete_batch(self, events: list[EntityEvent]) -> list:
+        # Raises so tenacity retries errors and unparseable replies; infer_batch falls back once it gives up.
+        response = await self._client.chat.completions.create(
+            model=self.settings.openai_model,
+            messages=[{"role": "user", "content": self._batch_prompt(events)}],
+            temperature=0.1,
+        )
+        text = (response.choices[0].message.content or "").strip()
+        items = self._parse_json_array_text(text)
+        if items is None:
+            raise ValueError("model output is not a valid json array")
+        return items
+
+    def _batch_prompt(self, events: list[EntityEvent]) -> str:
+        lines = [
+            "You are a crypto event analyst. Return a strict JSON array with one object per (event_id, symbol) pair "
+            "below. Each object has keys: event_id, symbol, side (-1,0,1), strength (0..1), confidence (0..1), "
+            "horizon_min (int), rationale (short)."
+        ]
+        for event in events:
+            lines.append(
+                f"\nevent_id: {event.event_id}\nSymbols: {', '.join(event.symbols)}"
+                f"\nTitle: {event.title}\nContent: {event.content[:800]}"
+            )
+        return "\n".join(lines)
+
+    def _parse_json_array_text(self, text: str) -> list | None:
+        if not text:
+            return None
+
+        try:
+            parsed = json.loads(text)
+        except json.JSONDecodeError:
+            start = text.find("[")
+            end = text.rfind("]")
+            if start == -1 or end == -1 or end <= start:
+                return None
+            try:
+                parsed = json.loads(text[start : end + 1])
+            except json.JSONDecodeError:
+                return None
+
+        # Some models wrap the array in an object, e.g. {"results": [...]}.
+        if isinstance(parsed, dict):
+            parsed = next((value for value in parsed.values() if isinstance(value, list)), None)
+        return parsed if isinstance(parsed, list) else None
+
     def _parse_json_text(self, text: str) -> dict | None:
         if not text:
             return None
@@ -112,27 +259,84 @@ class LLMProvider:
 
 
 class LLMSignalService:
-    def __init__(self, settings: AppSettings, provider: LLMProvider):
+    def __init__(self, settings: AppSettings, provider: LLMProvider, bus: EventBus | None = None):
         self.settings = settings
         self.provider = provider
+        self.bus = bus
+        self._published_provisional: OrderedDict[tuple[str, str], SignalEvent] = OrderedDict()
 
     async def handle(self, payload: dict) -> list[tuple[str, dict]]:
         event = EntityEvent.model_validate(payload)
         outputs: list[tuple[str, dict]] = []
+        if self.settings.llm_streaming:
+            for symbol in event.symbols:
+                await self._infer_streaming(event, symbol, outputs)
+            return outputs
 
         for symbol in event.symbols:
             inference = await self.provider.infer(event.title, event.content, symbol)
-            signal = SignalEvent(
-                event_id=event.event_id,
-                symbol=symbol,
-                side=int(inference.get("side", 0)),
-                strength=float(inference.get("strength", 0.0)),
-                confidence=float(inference.get("confidence", 0.0)),
-                horizon_min=int(inference.get("horizon_min", 60)),
-                ttl_sec=self.settings.default_event_ttl_sec,
-                rationale=str(inference.get("rationale", "")),
-                generated_at=datetime.now(timezone.utc),
-            )
+            signal = self._build_signal(event.event_id, symbol, inference)
             outputs.append((Streams.SIGNAL_RAW, signal.model_dump(mode="json")))
 
         return outputs
+
+    async def handle_batch(self, payloads: list[dict]) -> list[tuple[str, dict]]:
+        events = [EntityEvent.model_validate(payload) for payload in payloads]
+        inferences = await self.provider.infer_batch(events)
+        outputs: list[tuple[str, dict]] = []
+
+        for event in events:
+            for symbol in event.symbols:
+                signal = self._build_signal(event.event_id, symbol, inferences[(event.event_id, symbol)])
+                outputs.append((Streams.SIGNAL_RAW, signal.model_dump(mode="json")))
+
+        return outputs
+
+    async def _infer_streaming(self, event: EntityEvent, symbol: str, outputs: list[tuple[str, dict]]) -> None:
+        provisional: SignalEvent | None = None
+
+        async def on_core(fields: dict) -> None:
+            nonlocal provisional
+            key = (event.event_id, symbol)
+            if key in self._published_provisional:
+                # A replay of a record whose handler failed after publishing; the signal is already out.
+                provisional = self._published_provisional[key]
+                return
+            provisional = self._build_signal(event.event_id, symbol, {**fields, "rationale": "provisional"})
+            payload = provisional.model_dump(mode="json")
+            # Publish straight away when a bus is attached; the worker would only publish after the full reply.
+            if self.bus is not None:
+                await self.bus.publish(Streams.SIGNAL_RAW, payload)
+                self._published_provisional[key] = provisional
+                if len(self._published_provisional) > _MAX_PUBLISHED_PROVISIONAL:
+                    self._published_provisional.popitem(last=False)
+            else:
+                outputs.append((Streams.SIGNAL_RAW, payload))
+
+        inference = await self.provider.infer_stream(event.title, event.content, symbol, on_core)
+        if provisional is None:
+            signal = self._build_signal(event.event_id, symbol, inference)
+            outputs.append((Streams.SIGNAL_RAW, signal.model_dump(mode="json")))
+            return
+
+        rationale = SignalRationale(
+            event_id=event.event_id,
+            symbol=symbol,
+            rationale=str(inference.get("rationale", "")),
+            signal_generated_at=provisional.generated_at,
+            horizon_min=int(inference.get("horizon_min", provisional.horizon_min)),
+        )
+        outputs.append((Streams.SIGNAL_RATIONALE, rationale.model_dump(mode="json")))
+
+    def _build_signal(self, event_id: str, symbol: str, inference: dict) -> SignalEvent:
+        return SignalEvent(
+            event_id=event_id,
+            symbol=symbol,
+            side=int(inference.get("side", 0)),
+            strength=float(inference.get("strength", 0.0)),
+            confidence=float(inference.get("confidence", 0.0)),
+            horizon_min=int(inference.get("horizon_min", 60)),
+            ttl_sec=self.settings.default_event_ttl_sec,
+            rationale=str(inference.get("rationale", "")),
+            generated_at=datetime.now(timezone.utc),
+        )
@@ -2,8 +2,12 @@ from __future__ import annotations
 
 from uuid import uuid4
 
+import numpy as np
+
 from common_types import AppSettings, OrderIntent, SignalEvent, Streams
 
+MIN_ORDER_USD = 10.0
+
 
 class PortfolioService:
     def __init__(self, settings: AppSettings):
@@ -12,7 +16,7 @@ class PortfolioService:
     async def handle(self, payload: dict) -> list[tuple[str, dict]]:
         signal = SignalEvent.model_validate(payload)
         base_risk_capital = self.settings.account_equity_usd * self.settings.risk_per_trade_pct
-        qty_usd = max(10.0, base_risk_capital * max(0.2, signal.strength))
+        qty_usd = max(MIN_ORDER_USD, base_risk_capital * max(0.2, signal.strength))
 
         market = "spot" if signal.side > 0 else "perp"
 
@@ -27,3 +31,49 @@ class PortfolioService:
             reason=f"signal strength={signal.strength:.3f} conf={signal.confidence:.3f}",
         )
         return [(Streams.ORDER_INTENT, intent.model_dump(mode="json"))]
+
+    async def handle_batch(self, payloads: list[dict]) -> list[tuple[str, dict]]:
+        signals = [SignalEvent.model_validate(payload) for payload in payloads]
+        if not signals:
+            return []
+
+        symbols: dict[str, int] = {}
+        rows = np.fromiter((symbols.setdefault(s.symbol, len(symbols)) for s in signals), dtype=np.intp, count=len(signals))
+        sides = np.fromiter((s.side for s in signals), dtype=np.float64, count=len(signals))
+        strengths = np.fromiter((s.strength for s in signals), dtype=np.float64, count=len(signals))
+
+        base_risk_capital = self.settings.account_equity_usd * self.settings.risk_per_trade_pct
+        sized = sides * np.maximum(MIN_ORDER_USD, base_risk_capital * np.maximum(0.2, strengths))
+        net = np.bincount(rows, weights=sized, minlength=len(symbols))
+        counts = np.bincount(rows, minlength=len(symbols))
+
+        # Scale every net position down together when the batch would exceed the risk budget.
+        budget = self.settings.account_equity_usd * self.settings.portfolio_batch_risk_budget_pct
+        gross = float(np.abs(net).sum())
+        if budget > 0 and gross > budget:
+            net *= budget / gross
+
+        # The largest contributor on the net side supplies the event id the intent is traced back to.
+        aligned = np.where(np.sign(sized) == np.sign(net[rows]), np.abs(sized), -1.0)
+        order = np.lexsort((-aligned, rows))
+        lead = order[np.unique(rows[order], return_index=True)[1]]
+
+        outputs: list[tuple[str, dict]] = []
+        for symbol, row in symbols.items():
+            qty_usd = abs(float(net[row]))
+            if qty_usd < MIN_ORDER_USD:
+                continue
+            side = 1 if net[row] > 0 else -1
+            signal = signals[lead[row]]
+            intent = OrderIntent(
+                intent_id=uuid4().hex[:20],
+                event_id=signal.event_id,
+                symbol=symbol,
+                market="spot" if side > 0 else "perp",
+                side=side,
+                qty_usd=qty_usd,
+                max_slippage_bps=self.settings.max_slippage_bps,
+                reason=f"net n={int(counts[row])} strength={signal.strength:.3f} conf={signal.confidence:.3f}",
+            )
+            outputs.append((Streams.ORDER_INTENT, intent.model_dump(mode="json")))
+        return outputs
@@ -1,46 +1,268 @@
 from __future__ import annotations
 
-from collections import defaultdict
+import asyncio
+import logging
+import math
+import time
+from array import array
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timezone
 
+import numpy as np
+
 from common_types import ExecutionReport, PnLSnapshot, Streams
+from exchange_adapters import MarketDataCache
 
+logger = logging.getLogger(__name__)
 
-class PositionPnLService:
+MARKETS = ("spot", "perp")
+# Remainders below this fraction of the position size are rounding noise, not an open position.
+_FLAT = 1e-9
+# Orders whose cumulative fills are remembered, so a late or repeated report for one of them adds nothing.
+_MAX_TRACKED_ORDERS = 100_000
+
+
+class PositionBook:
     def __init__(self):
-        self.positions = defaultdict(float)
-        self.avg_cost = {}
-        self.realized = 0.0
+        self._slots: dict[tuple[str, str], int] = {}
+        self._keys: list[tuple[str, str] | None] = []
+        self._free: list[int] = []
+        self.qty = array("d")
+        self.avg_cost = array("d")
+        self.mark = array("d")
+        # Aggregates are valued at average cost and move by each fill's delta instead of being re-summed.
+        self.gross = 0.0
+        self.net = 0.0
+        self.market_gross = [0.0, 0.0]
+        # Running unrealized PnL, moved by each mark and fill; unrealized() recomputes it exactly.
+        self.upnl = 0.0
 
-    async def handle(self, payload: dict) -> list[tuple[str, dict]]:
-        report = ExecutionReport.model_validate(payload)
-        key = (report.market, report.symbol)
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def position(self, market: str, symbol: str) -> tuple[float, float]:
+        slot = self._slots.get((market, symbol))
+        if slot is None:
+            return 0.0, 0.0
+        return self.qty[slot], self.avg_cost[slot]
+
+    def positions(self) -> dict[tuple[str, str], float]:
+        return {key: self.qty[slot] for key, slot in self._slots.items()}
 
-        qty = report.filled_qty if report.side > 0 else -report.filled_qty
-        prev_qty = self.positions[key]
+    def _open_slot(self, key: tuple[str, str]) -> int:
+        if self._free:
+            slot = self._free.pop()
+            self._keys[slot] = key
+        else:
+            slot = len(self.qty)
+            self._keys.append(key)
+            self.qty.append(0.0)
+            self.avg_cost.append(0.0)
+            self.mark.append(0.0)
+        self._slots[key] = slot
+        return slot
+
+    def _close_slot(self, key: tuple[str, str], slot: int) -> None:
+        del self._slots[key]
+        self._keys[slot] = None
+        self.qty[slot] = 0.0
+        self.avg_cost[slot] = 0.0
+        self.mark[slot] = 0.0
+        self._free.append(slot)
+
+    def set_mark(self, market: str, symbol: str, price: float) -> bool:
+        slot = self._slots.get((market, symbol))
+        if slot is None or self.mark[slot] == price:
+            return False
+        self.upnl += self.qty[slot] * (price - self.mark[slot])
+        self.mark[slot] = price
+        return True
+
+    def apply(self, market: str, symbol: str, qty: float, price: float) -> float:
+        key = (market, symbol)
+        slot = self._slots.get(key)
+        if slot is None:
+            if qty == 0:
+                return 0.0
+            slot = self._open_slot(key)
+        prev_qty = self.qty[slot]
+        prev_cost = self.avg_cost[slot]
         new_qty = prev_qty + qty
+        self.upnl -= prev_qty * (self.mark[slot] - prev_cost)
 
-        if prev_qty == 0 or (prev_qty > 0 and qty > 0) or (prev_qty < 0 and qty < 0):
-            prev_cost = self.avg_cost.get(key, report.avg_price)
-            weighted_qty = abs(prev_qty) + abs(qty)
-            self.avg_cost[key] = (prev_cost * abs(prev_qty) + report.avg_price * abs(qty)) / max(weighted_qty, 1e-9)
+        realized = 0.0
+        if prev_qty == 0 or (prev_qty > 0) == (qty > 0):
+            cost = (prev_cost * abs(prev_qty) + price * abs(qty)) / max(abs(new_qty), 1e-12)
         else:
-            entry = self.avg_cost.get(key, report.avg_price)
             closing = min(abs(prev_qty), abs(qty))
-            direction = 1 if prev_qty > 0 else -1
-            pnl = direction * (report.avg_price - entry) * closing
-            self.realized += pnl
+            realized = (price - prev_cost) * closing * (1 if prev_qty > 0 else -1)
+            # A fill that flips the position opens the remainder at the fill price.
+            cost = prev_cost if abs(qty) <= abs(prev_qty) else price
+
+        flat = abs(new_qty) <= max(abs(prev_qty), abs(qty)) * _FLAT
+        if flat:
+            new_qty, cost = 0.0, 0.0
+        m = MARKETS.index(market)
+        gross_delta = abs(new_qty) * cost - abs(prev_qty) * prev_cost
+        self.gross += gross_delta
+        self.market_gross[m] += gross_delta
+        self.net += new_qty * cost - prev_qty * prev_cost
+
+        if flat:
+            self._close_slot(key, slot)
+            if not self._slots:
+                # Nothing open: drop the float residue the running sums picked up along the way.
+                self.gross, self.net, self.market_gross, self.upnl = 0.0, 0.0, [0.0, 0.0], 0.0
+        else:
+            self.qty[slot] = new_qty
+            self.avg_cost[slot] = cost
+            # The fill is the freshest price seen for this position until the next tick.
+            self.mark[slot] = price
+            self.upnl += new_qty * (price - cost)
+        return realized
+
+    def unrealized(self) -> float:
+        if not self._slots:
+            return 0.0
+        # Zero-copy views over the slot arrays; free slots hold zeros and contribute nothing.
+        qty = np.frombuffer(self.qty, dtype=np.float64)
+        cost = np.frombuffer(self.avg_cost, dtype=np.float64)
+        mark = np.frombuffer(self.mark, dtype=np.float64)
+        return float(np.dot(qty, mark - cost))
 
-        self.positions[key] = new_qty
-        exposure = sum(abs(v) for v in self.positions.values())
-        drawdown = max(0.0, -self.realized / 100000.0)
 
-        snapshot = PnLSnapshot(
+class MarkToMarket:
+    def __init__(self, book: PositionBook, starting_equity: float):
+        self.book = book
+        self.starting_equity = starting_equity
+        self.peak_equity = starting_equity
+        self.unrealized = 0.0
+        self.equity = starting_equity
+        self.drawdown = 0.0
+        self.revaluations = 0
+
+    def revalue(self, realized: float, exact: bool = True) -> None:
+        if exact:
+            # The full pass also drops the float drift the running sum picked up.
+            self.book.upnl = self.book.unrealized()
+            self.revaluations += 1
+        self.unrealized = self.book.upnl
+        self.equity = self.starting_equity + realized + self.unrealized
+        self.peak_equity = max(self.peak_equity, self.equity)
+        self.drawdown = max(0.0, 1 - self.equity / self.peak_equity) if self.peak_equity > 0 else 0.0
+
+
+class PositionPnLService:
+    def __init__(
+        self,
+        starting_equity: float = 100000.0,
+        account: str = "paper",
+        snapshot_interval_sec: float = 0.0,
+        drawdown_step: float = 0.001,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.book = PositionBook()
+        self.mtm = MarkToMarket(self.book, starting_equity)
+        self.account = account
+        self.realized = 0.0
+        self.fees = 0.0
+        # order_id -> cumulative (filled_qty, notional, fee) already booked.
+        self._orders: dict[str, tuple[float, float, float]] = {}
+        self.snapshot_interval_sec = snapshot_interval_sec
+        self.drawdown_step = drawdown_step
+        self._clock = clock
+        self._last_emit_at = -math.inf
+        self._last_drawdown = 0.0
+        self._dirty = False
+        self._marks_moved = False
+        self.emitted = 0
+        self.coalesced = 0
+
+    @property
+    def positions(self) -> dict[tuple[str, str], float]:
+        return self.book.positions()
+
+    def on_price(self, market: str, symbol: str, price: float) -> None:
+        # A tick only writes the mark; the next revaluation picks it up for every position at once.
+        if self.book.set_mark(market, symbol, price):
+            self._marks_moved = True
+
+    def watch(self, cache: MarketDataCache) -> None:
+        def _on_update(market: str, symbol: str) -> None:
+            price = cache.price(market, symbol)
+            if price is not None and self.book.set_mark(market, symbol, price):
+                self._marks_moved = True
+
+        cache.subscribe(_on_update)
+
+    def snapshot(self) -> PnLSnapshot:
+        realized = self.realized - self.fees
+        self.mtm.revalue(realized)
+        return PnLSnapshot(
             ts=datetime.now(timezone.utc),
-            account="paper",
-            unrealized=0.0,
-            realized=self.realized - report.fee,
-            exposure=exposure,
-            drawdown=drawdown,
+            account=self.account,
+            unrealized=self.mtm.unrealized,
+            realized=realized,
+            exposure=self.book.gross,
+            drawdown=self.mtm.drawdown,
         )
+
+    def _apply(self, payload: dict) -> None:
+        report = ExecutionReport.model_validate(payload)
+        # Reports carry cumulative fills per order (the placement response, then each stream update); book only what is new.
+        prev_qty, prev_notional, prev_fee = self._orders.pop(report.order_id, (0.0, 0.0, 0.0))
+        if report.filled_qty < prev_qty:
+            self._orders[report.order_id] = (prev_qty, prev_notional, prev_fee)
+            return
+        notional = report.filled_qty * report.avg_price
+        fee = max(report.fee, prev_fee)
+        self._orders[report.order_id] = (report.filled_qty, notional, fee)
+        if len(self._orders) > _MAX_TRACKED_ORDERS:
+            del self._orders[next(iter(self._orders))]
+        filled = report.filled_qty - prev_qty
+        if filled > report.filled_qty * _FLAT:
+            qty = filled if report.side > 0 else -filled
+            self.realized += self.book.apply(report.market, report.symbol, qty, (notional - prev_notional) / filled)
+        self.fees += fee - prev_fee
+
+    def _coalesce(self, pending: bool) -> list[tuple[str, dict]]:
+        # The running unrealized sum keeps this check O(1); only a snapshot that goes out pays for a full revaluation.
+        self.mtm.revalue(self.realized - self.fees, exact=False)
+        now = self._clock()
+        # A drawdown jump goes out at once; anything else waits for the interval and is superseded by later state.
+        jumped = self.mtm.drawdown - self._last_drawdown >= self.drawdown_step
+        if not jumped and now - self._last_emit_at < self.snapshot_interval_sec:
+            if pending:
+                self._dirty = True
+                self.coalesced += 1
+            return []
+        snapshot = self.snapshot()
+        self._last_emit_at = now
+        self._last_drawdown = snapshot.drawdown
+        self._dirty = False
+        self._marks_moved = False
+        self.emitted += 1
         return [(Streams.PNL_SNAPSHOT, snapshot.model_dump(mode="json"))]
+
+    async def handle(self, payload: dict) -> list[tuple[str, dict]]:
+        self._apply(payload)
+        return self._coalesce(pending=True)
+
+    async def handle_batch(self, payloads: list[dict]) -> list[tuple[str, dict]]:
+        for payload in payloads:
+            self._apply(payload)
+        return self._coalesce(pending=True)
+
+    async def run_snapshots(self, publish: Callable[[str, dict], Awaitable[object]]) -> None:
+        # Flushes coalesced fills and revalues open positions between fills, so risk sees unrealized losses too.
+        while True:
+            due = self._last_emit_at + self.snapshot_interval_sec - self._clock()
+            await asyncio.sleep(min(max(due, 0.05), max(self.snapshot_interval_sec, 0.05)))
+            # With no new fill and no mark movement the snapshot would repeat the last one.
+            if not self._dirty and not (self._marks_moved and len(self.book)):
+                continue
+            try:
+                for stream, payload in self._coalesce(pending=False):
+                    await publish(stream, payload)
+            except Exception:
+                logger.exception("pnl snapshot publish failed")
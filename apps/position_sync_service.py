@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from collections.abc import Callable
 
 from common_types import AppSettings, Streams
 from common_types.bus import EventBus
@@ -19,11 +21,28 @@ def _safe_notional(position: dict) -> float:
 
 
 class PositionSyncService:
-    def __init__(self, settings: AppSettings, adapter: ExchangeAdapter, state: TradingStateStore, bus: EventBus):
+    def __init__(
+        self,
+        settings: AppSettings,
+        adapter: ExchangeAdapter,
+        state: TradingStateStore,
+        bus: EventBus,
+        clock: Callable[[], float] = time.time,
+    ):
         self.settings = settings
         self.adapter = adapter
         self.state = state
         self.bus = bus
+        self._clock = clock
+        # Exchange-side view kept between audits: (market, symbol) -> (qty, notional), plus its aggregates.
+        self._positions: dict[tuple[str, str], tuple[float, float]] = {}
+        self._unit_prices: dict[tuple[str, str], float] = {}
+        self._snapshot = self.build_snapshot([])
+        self._lock = asyncio.Lock()
+        self._audit_started_ms = 0
+        self._audit_requested = asyncio.Event()
+        self.events_applied = 0
+        self.events_stale = 0
 
     def build_snapshot(self, positions: list[dict]) -> dict:
         symbol_exposure: dict[str, float] = {}
@@ -57,10 +76,93 @@ class PositionSyncService:
             "total_exposure": total_exposure,
         }
 
+    def _reset(self, positions: list[dict], snapshot: dict) -> None:
+        self._positions.clear()
+        for pos in positions:
+            self._track(pos)
+        self._snapshot = snapshot
+
+    def _track(self, pos: dict) -> tuple[str, str] | None:
+        symbol = str(pos.get("symbol", "")).upper()
+        market = str(pos.get("market", "")).lower()
+        if not symbol or not market:
+            return None
+        key = (market, symbol)
+        qty = float(pos.get("qty", 0.0))
+        if pos.get("notional_usd") is None and key in self._unit_prices:
+            # Spot balance events carry no price; value them at the last audited unit price.
+            pos = {**pos, "notional_usd": abs(qty) * self._unit_prices[key]}
+        elif pos.get("notional_usd") is None and qty:
+            # A coin quantity is not a USD notional; leave the key to the audit, which prices it.
+            self._audit_requested.set()
+            return None
+        notional = _safe_notional(pos)
+        if qty and pos.get("notional_usd") is not None:
+            self._unit_prices[key] = notional / abs(qty)
+        if notional <= 0:
+            self._positions.pop(key, None)
+        else:
+            self._positions[key] = (qty, notional)
+        return key
+
+    def _move(self, key: tuple[str, str], before: tuple[float, float] | None) -> None:
+        market, symbol = key
+        for sign, entry in ((-1.0, before), (1.0, self._positions.get(key))):
+            if entry is None:
+                continue
+            qty, notional = entry
+            delta = sign * notional
+            symbols = self._snapshot["symbol_exposure"]
+            symbols[symbol] = symbols.get(symbol, 0.0) + delta
+            if abs(symbols[symbol]) < 1e-9:
+                symbols.pop(symbol)
+            markets = self._snapshot["market_exposure"]
+            markets[market] = markets.get(market, 0.0) + delta
+            self._snapshot["side_exposure"]["long" if qty >= 0 else "short"] += delta
+            self._snapshot["total_exposure"] += delta
+
+    async def apply_account_event(self, event: dict) -> dict:
+        async with self._lock:
+            if int(event.get("event_ms", 0)) < self._audit_started_ms:
+                # Already covered by the audit that ran while this event was queued.
+                self.events_stale += 1
+                return {"applied": False, "reason": "before_audit"}
+
+            changed: set[str] = set()
+            for pos in event.get("positions", []):
+                key = (str(pos.get("market", "")).lower(), str(pos.get("symbol", "")).upper())
+                before = self._positions.get(key)
+                if self._track(pos) is None:
+                    continue
+                self._move(key, before)
+                changed.add(key[1])
+            if not changed:
+                return {"applied": False, "reason": "no_positions"}
+
+            # Changed symbols and the aggregates are brought to the exchange view, as the audit would; other keys are left alone.
+            view = await self.state.get_exposure_view(changed)
+            snapshot = self._snapshot
+            symbol_deltas = {s: snapshot["symbol_exposure"].get(s, 0.0) - view.symbol.get(s, 0.0) for s in changed}
+            market_deltas = {m: snapshot["market_exposure"].get(m, 0.0) - view.market.get(m, 0.0) for m in view.market}
+            side_deltas = {side: snapshot["side_exposure"][side] - view.side.get(side, 0.0) for side in ("long", "short")}
+            await self.state.apply_exposure_deltas(
+                symbol_deltas={k: v for k, v in symbol_deltas.items() if v},
+                market_deltas={k: v for k, v in market_deltas.items() if v},
+                side_deltas={k: v for k, v in side_deltas.items() if v},
+                total_delta=snapshot["total_exposure"] - view.total,
+            )
+            self.events_applied += 1
+            return {"applied": True, "symbols": sorted(changed), "total_exposure": snapshot["total_exposure"]}
+
     async def run_once(self) -> dict:
         if self.settings.execution_mode.lower() != "live":
             return {"skipped": True, "reason": "execution_mode_not_live"}
+        async with self._lock:
+            return await self._audit()
 
+    async def _audit(self) -> dict:
+        self._audit_requested.clear()
+        self._audit_started_ms = int(self._clock() * 1000)
         positions = await self.adapter.fetch_positions()
         snapshot = self.build_snapshot(positions)
 
@@ -90,6 +192,7 @@ class PositionSyncService:
             side_exposure=snapshot["side_exposure"],
             total_exposure=snapshot["total_exposure"],
         )
+        self._reset(positions, snapshot)
 
         return {
             "skipped": False,
@@ -98,11 +201,44 @@ class PositionSyncService:
             "drift_pct": drift_pct,
         }
 
-    async def run_forever(self) -> None:
+    def _account_stream(self):
+        if not self.settings.position_sync_events or self.settings.execution_mode.lower() != "live":
+            return None
+        return getattr(self.adapter, "stream_account_events", None)
+
+    async def consume_account_events(self, stream) -> None:
+        async for event in stream():
+            if event.get("event_type") == "alert":
+                # The stream reconnected and may have missed updates in between.
+                logger.warning("account stream alert: %s", event.get("message"))
+                self._audit_requested.set()
+                continue
+            try:
+                result = await self.apply_account_event(event)
+                logger.debug("position sync event result=%s", result)
+            except Exception:
+                logger.exception("position sync event failed")
+                self._audit_requested.set()
+
+    async def run_audits(self, interval_sec: float) -> None:
         while True:
             try:
                 result = await self.run_once()
                 logger.info("position sync result=%s", result)
             except Exception:
                 logger.exception("position sync failed")
-            await asyncio.sleep(max(5, self.settings.position_sync_interval_sec))
+            try:
+                await asyncio.wait_for(self._audit_requested.wait(), timeout=interval_sec)
+                # Let a burst of triggers settle into one audit.
+                await asyncio.sleep(1)
+            except asyncio.TimeoutError:
+                pass
+
+    async def run_forever(self) -> None:
+        stream = self._account_stream()
+        if stream is None:
+            await self.run_audits(max(5, self.settings.position_sync_interval_sec))
+            return
+        # Events keep state current; the full poll is only a safety net.
+        interval = max(5, self.settings.position_sync_interval_sec, self.settings.position_sync_audit_interval_sec)
+        await asyncio.gather(self.consume_account_events(stream), self.run_audits(interval))
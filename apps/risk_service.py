@@ -1,79 +1,206 @@
 from __future__ import annotations
 
+import logging
+from array import array
+from dataclasses import dataclass
+
+from pydantic import ValidationError
+
 from common_types import AppSettings, OrderIntent, PnLSnapshot, RiskDecision, Streams
-from feature_store import TradingStateStore
+from common_types.universe import UniverseSnapshot
+from feature_store import ExposureView, TradingStateStore
+
+logger = logging.getLogger(__name__)
+
+MARKETS = ("spot", "perp")
+SIDES = ("long", "short")
+
+
+@dataclass(frozen=True, slots=True)
+class RiskLimits:
+    symbol: float
+    total: float
+    market: tuple[float, float]
+    side: tuple[float, float]
+
+    @classmethod
+    def from_settings(cls, settings: AppSettings) -> "RiskLimits":
+        equity = settings.account_equity_usd
+        return cls(
+            symbol=equity * settings.max_symbol_exposure_pct,
+            total=equity * settings.max_total_exposure_pct,
+            market=(equity * settings.max_spot_exposure_pct, equity * settings.max_perp_exposure_pct),
+            side=(equity * settings.max_long_exposure_pct, equity * settings.max_short_exposure_pct),
+        )
+
+
+class RiskEngine:
+    def __init__(self, limits: RiskLimits):
+        self.limits = limits
+        self._slots: dict[str, int] = {}
+        self._symbol_exposure = array("d")
+        self._market_exposure = [0.0, 0.0]
+        self._side_exposure = [0.0, 0.0]
+        self.total_exposure = 0.0
+        self._symbol_deltas: dict[str, float] = {}
+        self._market_deltas = [0.0, 0.0]
+        self._side_deltas = [0.0, 0.0]
+        self._total_delta = 0.0
+
+    def _slot(self, symbol: str) -> int:
+        slot = self._slots.get(symbol)
+        if slot is None:
+            slot = len(self._symbol_exposure)
+            self._slots[symbol] = slot
+            self._symbol_exposure.append(0.0)
+        return slot
+
+    def load(self, view: ExposureView) -> None:
+        for symbol, exposure in view.symbol.items():
+            self._symbol_exposure[self._slot(symbol)] = exposure
+        self._market_exposure[0] = view.market.get("spot", 0.0)
+        self._market_exposure[1] = view.market.get("perp", 0.0)
+        self._side_exposure[0] = view.side.get("long", 0.0)
+        self._side_exposure[1] = view.side.get("short", 0.0)
+        self.total_exposure = view.total
+
+    def exposure(self, symbol: str) -> float:
+        slot = self._slots.get(symbol)
+        return self._symbol_exposure[slot] if slot is not None else 0.0
+
+    def evaluate(self, symbol: str, market: str, side: int, qty_usd: float) -> tuple[float, str | None]:
+        limits = self.limits
+        m = 0 if market == "spot" else 1
+        s = 0 if side > 0 else 1
+        allowed_by_symbol = limits.symbol - self._symbol_exposure[self._slot(symbol)]
+        allowed_by_market = limits.market[m] - self._market_exposure[m]
+        allowed_by_side = limits.side[s] - self._side_exposure[s]
+        allowed_by_total = limits.total - self.total_exposure
+        cap = min(qty_usd, allowed_by_symbol, allowed_by_total, allowed_by_market, allowed_by_side)
+        if cap > 0:
+            return cap, None
+        if allowed_by_symbol <= 0:
+            return 0.0, "SYMBOL_EXPOSURE_LIMIT"
+        if allowed_by_market <= 0:
+            return 0.0, "MARKET_EXPOSURE_LIMIT"
+        if allowed_by_side <= 0:
+            return 0.0, "SIDE_EXPOSURE_LIMIT"
+        return 0.0, "TOTAL_EXPOSURE_LIMIT"
+
+    def commit(self, symbol: str, market: str, side: int, qty_usd: float) -> None:
+        m = 0 if market == "spot" else 1
+        s = 0 if side > 0 else 1
+        self._symbol_exposure[self._slot(symbol)] += qty_usd
+        self._market_exposure[m] += qty_usd
+        self._side_exposure[s] += qty_usd
+        self.total_exposure += qty_usd
+        self._symbol_deltas[symbol] = self._symbol_deltas.get(symbol, 0.0) + qty_usd
+        self._market_deltas[m] += qty_usd
+        self._side_deltas[s] += qty_usd
+        self._total_delta += qty_usd
+
+    def drain_deltas(self) -> dict | None:
+        if not self._symbol_deltas:
+            return None
+        deltas = {
+            "symbol_deltas": self._symbol_deltas,
+            "market_deltas": {name: delta for name, delta in zip(MARKETS, self._market_deltas) if delta},
+            "side_deltas": {name: delta for name, delta in zip(SIDES, self._side_deltas) if delta},
+            "total_delta": self._total_delta,
+        }
+        self._symbol_deltas = {}
+        self._market_deltas = [0.0, 0.0]
+        self._side_deltas = [0.0, 0.0]
+        self._total_delta = 0.0
+        return deltas
 
 
 class RiskService:
-    def __init__(self, settings: AppSettings, state: TradingStateStore):
+    def __init__(self, settings: AppSettings, state: TradingStateStore, universe: UniverseSnapshot | None = None):
         self.settings = settings
         self.state = state
+        self.universe = universe
+        self.engine = RiskEngine(RiskLimits.from_settings(settings))
         self.kill_switch = False
         self._last_snapshot_realized = 0.0
+        self._last_unrealized = 0.0
 
     async def _daily_drawdown_breached(self) -> bool:
         realized = await self.state.get_daily_realized_pnl()
         drawdown_limit = self.settings.account_equity_usd * self.settings.max_daily_drawdown_pct
-        return realized <= -drawdown_limit
+        # Open losses count toward the limit as soon as they are marked, not only once the position is closed.
+        return realized + min(0.0, self._last_unrealized) <= -drawdown_limit
+
+    def apply_universe(self, snapshot: UniverseSnapshot) -> None:
+        if self.universe is None or snapshot.version >= self.universe.version:
+            self.universe = snapshot
+
+    @staticmethod
+    def _reject(intent: OrderIntent, reason_code: str) -> tuple[str, dict]:
+        decision = RiskDecision(
+            intent_id=intent.intent_id,
+            allow=False,
+            reason_code=reason_code,
+            capped_qty_usd=0.0,
+        )
+        return (Streams.ORDER_REJECTED, decision.model_dump(mode="json"))
 
     async def handle_order_intent(self, payload: dict) -> list[tuple[str, dict]]:
-        intent = OrderIntent.model_validate(payload)
-        if self.kill_switch or await self._daily_drawdown_breached():
+        return await self._evaluate([OrderIntent.model_validate(payload)])
+
+    async def handle_order_intents(self, payloads: list[dict]) -> list[tuple[str, dict]]:
+        intents = []
+        for payload in payloads:
+            try:
+                intents.append(OrderIntent.model_validate(payload))
+            except ValidationError:
+                logger.exception("dropping invalid order intent payload")
+        return await self._evaluate(intents)
+
+    async def _evaluate(self, intents: list[OrderIntent]) -> list[tuple[str, dict]]:
+        if not intents:
+            return []
+        if not self.kill_switch and await self._daily_drawdown_breached():
             self.kill_switch = True
-            decision = RiskDecision(
-                intent_id=intent.intent_id,
-                allow=False,
-                reason_code="DAILY_DRAWDOWN_BREACH",
-                capped_qty_usd=0.0,
-            )
-            return [(Streams.ORDER_REJECTED, decision.model_dump(mode="json"))]
-
-        symbol_limit = self.settings.account_equity_usd * self.settings.max_symbol_exposure_pct
-        total_limit = self.settings.account_equity_usd * self.settings.max_total_exposure_pct
-        market_limit_pct = self.settings.max_spot_exposure_pct if intent.market == "spot" else self.settings.max_perp_exposure_pct
-        market_limit = self.settings.account_equity_usd * market_limit_pct
-        side_limit_pct = self.settings.max_long_exposure_pct if intent.side > 0 else self.settings.max_short_exposure_pct
-        side_limit = self.settings.account_equity_usd * side_limit_pct
-
-        current_symbol = await self.state.get_symbol_exposure(intent.symbol)
-        current_total = await self.state.get_total_exposure()
-        current_market = await self.state.get_market_exposure(intent.market)
-        current_side = await self.state.get_side_exposure(intent.side)
-
-        allowed_by_symbol = max(0.0, symbol_limit - current_symbol)
-        allowed_by_total = max(0.0, total_limit - current_total)
-        allowed_by_market = max(0.0, market_limit - current_market)
-        allowed_by_side = max(0.0, side_limit - current_side)
-        cap = min(intent.qty_usd, allowed_by_symbol, allowed_by_total, allowed_by_market, allowed_by_side)
-
-        if cap <= 0:
-            if allowed_by_symbol <= 0:
-                reason_code = "SYMBOL_EXPOSURE_LIMIT"
-            elif allowed_by_market <= 0:
-                reason_code = "MARKET_EXPOSURE_LIMIT"
-            elif allowed_by_side <= 0:
-                reason_code = "SIDE_EXPOSURE_LIMIT"
-            else:
-                reason_code = "TOTAL_EXPOSURE_LIMIT"
-            decision = RiskDecision(
-                intent_id=intent.intent_id,
-                allow=False,
-                reason_code=reason_code,
-                capped_qty_usd=0.0,
-            )
-            return [(Streams.ORDER_REJECTED, decision.model_dump(mode="json"))]
-
-        approved = intent.model_copy(update={"qty_usd": cap})
-        await self.state.add_symbol_exposure(intent.symbol, cap)
-        await self.state.add_total_exposure(cap)
-        await self.state.add_market_exposure(intent.market, cap)
-        await self.state.add_side_exposure(intent.side, cap)
-        return [(Streams.ORDER_APPROVED, approved.model_dump(mode="json"))]
+
+        engine = self.engine
+        engine.load(await self.state.get_exposure_view({intent.symbol.upper() for intent in intents}))
+        outputs: list[tuple[str, dict]] = []
+        # Intents are capped in arrival order so later intents in a batch see earlier approvals.
+        for intent in intents:
+            if self.universe is not None and not self.universe.is_tradable(intent.symbol, intent.market):
+                outputs.append(self._reject(intent, "SYMBOL_NOT_TRADING"))
+                continue
+            if self.kill_switch:
+                outputs.append(self._reject(intent, "DAILY_DRAWDOWN_BREACH"))
+                continue
+
+            symbol = intent.symbol.upper()
+            cap, reason_code = engine.evaluate(symbol, intent.market, intent.side, intent.qty_usd)
+            if reason_code is not None:
+                outputs.append(self._reject(intent, reason_code))
+                continue
+
+            entry = self.universe.entry(intent.symbol) if self.universe is not None else None
+            rules = entry.rules(intent.market) if entry is not None else None
+            if rules is not None and cap < rules.min_notional:
+                outputs.append(self._reject(intent, "BELOW_MIN_NOTIONAL"))
+                continue
+
+            engine.commit(symbol, intent.market, intent.side, cap)
+            approved = intent.model_copy(update={"qty_usd": cap})
+            outputs.append((Streams.ORDER_APPROVED, approved.model_dump(mode="json")))
+
+        deltas = engine.drain_deltas()
+        if deltas is not None:
+            await self.state.apply_exposure_deltas(**deltas)
+        return outputs
 
     async def handle_pnl_snapshot(self, payload: dict) -> list[tuple[str, dict]]:
         snapshot = PnLSnapshot.model_validate(payload)
         delta_realized = snapshot.realized - self._last_snapshot_realized
         self._last_snapshot_realized = snapshot.realized
+        self._last_unrealized = snapshot.unrealized
         await self.state.add_daily_realized_pnl(delta_realized)
         if await self._daily_drawdown_breached():
             self.kill_switch = True
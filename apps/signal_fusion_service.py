@@ -4,15 +4,32 @@ from datetime import datetime, timezone
 
 from common_types import AppSettings, SignalEvent, Streams
 from common_types.models import is_stale
+from feature_store import ConsistentHashRing, FusionStateStore, MemoryFusionStateStore
 
 
 class SignalFusionService:
-    def __init__(self, settings: AppSettings):
+    def __init__(self, settings: AppSettings, store: FusionStateStore | None = None):
         self.settings = settings
-        self._last_signal: dict[str, SignalEvent] = {}
-        self._conflict_window_sec = 30 * 60
+        self.store = store or MemoryFusionStateStore(
+            capacity=settings.fusion_buffer_size,
+            half_life_sec=settings.fusion_half_life_sec,
+            evict_epsilon=settings.fusion_evict_epsilon,
+        )
+        replicas = [r.strip() for r in settings.fusion_replicas.split(",") if r.strip()]
+        if replicas and settings.fusion_replica_id not in replicas:
+            raise ValueError(f"FUSION_REPLICA_ID={settings.fusion_replica_id!r} is not listed in FUSION_REPLICAS")
+        self._ring = ConsistentHashRing(replicas) if replicas else None
+        self._replica_id = settings.fusion_replica_id
+
+    def owns(self, symbol: str) -> bool:
+        if self._ring is None:
+            return True
+        return self._ring.owner(symbol.upper()) == self._replica_id
 
     async def handle(self, payload: dict) -> list[tuple[str, dict]]:
+        # Every replica reads the whole stream; skip symbols owned by other replicas before validation.
+        if not self.owns(str(payload.get("symbol", ""))):
+            return []
         signal = SignalEvent.model_validate(payload)
 
         if signal.side == 0:
@@ -22,19 +39,20 @@ class SignalFusionService:
         if is_stale(signal):
             return []
 
-        prev = self._last_signal.get(signal.symbol)
-        if prev:
-            delta = (signal.generated_at - prev.generated_at).total_seconds()
-            opposite = signal.side != prev.side
-            close_strength = abs(signal.strength - prev.strength) < 0.2
-            if opposite and delta <= self._conflict_window_sec and close_strength:
-                return []
+        contribution = signal.side * signal.strength * (0.8 + 0.2 * signal.confidence)
+        view = await self.store.update(signal.symbol, signal.generated_at.timestamp(), contribution)
+
+        net = view.net
+        if net == 0 or (net > 0) != (signal.side > 0):
+            return []
+        # Opposing signals still in the buffer: only trade once the net view clears the conflict margin.
+        conflicted = view.gross - abs(net) > 1e-9
+        if conflicted and abs(net) < self.settings.fusion_conflict_margin:
+            return []
 
-        fused_strength = min(1.0, signal.strength * (0.8 + 0.2 * signal.confidence))
         fused = signal.model_copy(update={
-            "strength": fused_strength,
+            "strength": min(1.0, abs(net)),
             "generated_at": datetime.now(timezone.utc),
-            "rationale": f"fused: {signal.rationale}",
+            "rationale": f"fused n={view.size}: {signal.rationale}",
         })
-        self._last_signal[signal.symbol] = fused
         return [(Streams.SIGNAL_TRADEABLE, fused.model_dump(mode="json"))]
@@ -1,16 +1,96 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import logging
+from collections.abc import Awaitable, Callable
+
 from common_types import AppSettings, SignalEvent, Streams
+from common_types.universe import MarketRules, UniverseSnapshot
+from exchange_adapters.exchange_info import build_universe_snapshot
+from feature_store.universe import UniverseStore
+
+logger = logging.getLogger(__name__)
+
+RulesFetcher = Callable[[], Awaitable[tuple[dict[str, MarketRules], dict[str, MarketRules]]]]
 
 
 class UniverseService:
-    def __init__(self, settings: AppSettings):
+    def __init__(self, settings: AppSettings, snapshot: UniverseSnapshot | None = None):
         self.settings = settings
+        self.snapshot = snapshot or UniverseSnapshot.from_symbols(settings.universe)
+
+    def apply_snapshot(self, snapshot: UniverseSnapshot) -> None:
+        if snapshot.version >= self.snapshot.version:
+            self.snapshot = snapshot
 
     async def handle(self, payload: dict) -> list[tuple[str, dict]]:
         signal = SignalEvent.model_validate(payload)
         if not signal.symbol.endswith("USDT"):
             return []
-        if signal.symbol not in self.settings.universe:
+        if not self.snapshot.is_tradable(signal.symbol):
             return []
         return [(Streams.SIGNAL_UNIVERSE, signal.model_dump(mode="json"))]
+
+
+class UniverseRefresher:
+    def __init__(self, settings: AppSettings, store: UniverseStore, fetch_rules: RulesFetcher | None = None):
+        self.settings = settings
+        self.store = store
+        self.fetch_rules = fetch_rules
+        self._current: UniverseSnapshot | None = None
+
+    async def refresh_once(self) -> UniverseSnapshot:
+        if self._current is None:
+            self._current = await self.store.load()
+        version = (self._current.version if self._current else 0) + 1
+        whitelist = await self.store.load_whitelist() or self.settings.universe
+
+        if self.fetch_rules is None:
+            candidate = UniverseSnapshot.from_symbols(whitelist, version=version)
+        else:
+            spot_rules, perp_rules = await self.fetch_rules()
+            candidate = build_universe_snapshot(whitelist, spot_rules, perp_rules, version=version)
+
+        if candidate.same_content(self._current):
+            return self._current
+        await self.store.publish(candidate)
+        self._current = candidate
+        logger.info("universe snapshot published version=%s symbols=%s", candidate.version, len(candidate.symbols))
+        return candidate
+
+    async def run_forever(self) -> None:
+        config_changed = asyncio.Event()
+
+        async def _listen() -> None:
+            async for message in self.store.watch():
+                if message.startswith("config:"):
+                    config_changed.set()
+
+        listener = asyncio.create_task(_listen())
+        try:
+            while True:
+                try:
+                    await self.refresh_once()
+                except Exception:
+                    logger.exception("universe refresh failed; keeping previous snapshot")
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(config_changed.wait(), timeout=max(5, self.settings.universe_refresh_interval_sec))
+                config_changed.clear()
+        finally:
+            listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await listener
+
+
+async def follow_universe(store: UniverseStore, apply: Callable[[UniverseSnapshot], None]) -> None:
+    current = await store.load()
+    if current is not None:
+        apply(current)
+    while True:
+        try:
+            async for snapshot in store.watch_snapshots():
+                apply(snapshot)
+        except Exception:
+            logger.exception("universe subscription dropped; reconnecting")
+            await asyncio.sleep(2)
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import time
+
+from benchmarks.binance_standin import add_config_args, config_from_args, point_adapter, serve_in_thread
+from benchmarks.llm_load_test import percentile
+from common_types.models import ExecutionReport, OrderIntent
+from exchange_adapters.binance import BinanceExchangeAdapter
+from exchange_adapters.rate_limit import BinanceRateLimiter
+
+SYMBOLS = ("BTCUSDT", "ETHUSDT", "SOLUSDT", "BNBUSDT")
+PRICES = {"BTCUSDT": 65000.0, "ETHUSDT": 3200.0, "SOLUSDT": 150.0, "BNBUSDT": 580.0}
+
+
+def _intents(count: int, markets: list[str]) -> list[OrderIntent]:
+    return [
+        OrderIntent(
+            intent_id=f"bench-{idx}",
+            event_id=f"event-{idx}",
+            symbol=SYMBOLS[idx % len(SYMBOLS)],
+            market=markets[idx % len(markets)],
+            side=1 if idx % 3 else -1,
+            qty_usd=100.0,
+            max_slippage_bps=20,
+            reason="bench",
+        )
+        for idx in range(count)
+    ]
+
+
+def _error_kind(exc: Exception) -> str:
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None) or getattr(exc, "status", None)
+    return f"{type(exc).__name__}:{status}" if status else type(exc).__name__
+
+
+class EventRecorder:
+    def __init__(self):
+        self.lags_ms: list[float] = []
+        self.filled_at: dict[str, float] = {}
+        self.events = 0
+        self.alerts = 0
+
+    async def consume(self, adapter: BinanceExchangeAdapter) -> None:
+        async for event in adapter.stream_execution_events():
+            received = time.time()
+            if not isinstance(event, ExecutionReport):
+                self.alerts += 1
+                continue
+            self.events += 1
+            # E has millisecond resolution, so lags below 1 ms read as 0 to 1 ms.
+            self.lags_ms.append((received - event.ts.timestamp()) * 1000)
+            if event.status == "filled":
+                self.filled_at.setdefault(event.intent_id, time.perf_counter())
+
+
+async def _wait_for(predicate, timeout_sec: float) -> bool:
+    deadline = time.perf_counter() + timeout_sec
+    while not predicate():
+        if time.perf_counter() > deadline:
+            return False
+        await asyncio.sleep(0.005)
+    return True
+
+
+async def run(args) -> dict:
+    config = config_from_args(args)
+    config.prices = dict(PRICES)
+    markets = ["spot", "perp"] if args.market == "both" else [args.market]
+    with serve_in_thread(config, port=args.port) as (exchange, rest_base, ws_base):
+        adapter = BinanceExchangeAdapter("bench-key", "bench-secret", use_testnet=True, order_transport=args.transport)
+        point_adapter(adapter, rest_base, ws_base)
+        if not args.exchange_limits:
+            # The stand-in enforces nothing, so lift the client-side caps unless the limiter itself is under test.
+            adapter.rate_limiters = {
+                market: BinanceRateLimiter(weight_limits={"1m": 10**9}, order_limits={"10s": 10**9})
+                for market in ("spot", "perp")
+            }
+        if args.warmup:
+            await adapter.warmup()
+        first_intent = OrderIntent(
+            intent_id="bench-first", event_id="event-first", symbol=SYMBOLS[0], market=markets[0],
+            side=1, qty_usd=100.0, max_slippage_bps=20, reason="bench",
+        )
+        # The first order pays connection setup unless warmup opened the pool already.
+        first_started = time.perf_counter()
+        first_error = None
+        try:
+            await adapter.place_order(first_intent)
+        except Exception as exc:
+            first_error = _error_kind(exc)
+        first_place_ms = (time.perf_counter() - first_started) * 1000
+        await adapter.refresh_market_rules()
+        for symbol, price in PRICES.items():
+            adapter.market_data.update_mark("perp", symbol, price, at=float("inf"))
+
+        recorder = EventRecorder()
+        consumer = asyncio.create_task(recorder.consume(adapter))
+        streams_ready = await _wait_for(lambda: exchange.subscribers() >= 2, 5.0)
+
+        sent_at: dict[str, float] = {}
+        place_ms: list[float] = []
+        errors: dict[str, int] = {}
+        statuses: dict[str, int] = {}
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def _place(intent: OrderIntent) -> None:
+            async with semaphore:
+                started = time.perf_counter()
+                sent_at[intent.intent_id] = started
+                try:
+                    report = await adapter.place_order(intent)
+                except Exception as exc:
+                    sent_at.pop(intent.intent_id, None)
+                    errors[_error_kind(exc)] = errors.get(_error_kind(exc), 0) + 1
+                    return
+                place_ms.append((time.perf_counter() - started) * 1000)
+                statuses[report.status] = statuses.get(report.status, 0) + 1
+
+        async def _place_batch(batch: list[OrderIntent]) -> None:
+            async with semaphore:
+                started = time.perf_counter()
+                for intent in batch:
+                    sent_at[intent.intent_id] = started
+                results = await adapter.place_orders(batch)
+                elapsed_ms = (time.perf_counter() - started) * 1000
+            for intent, result in zip(batch, results):
+                if isinstance(result, Exception):
+                    sent_at.pop(intent.intent_id, None)
+                    errors[_error_kind(result)] = errors.get(_error_kind(result), 0) + 1
+                    continue
+                place_ms.append(elapsed_ms)
+                statuses[result.status] = statuses.get(result.status, 0) + 1
+
+        intents = _intents(args.orders, markets)
+        if args.batch_size > 1:
+            batches = [intents[idx : idx + args.batch_size] for idx in range(0, len(intents), args.batch_size)]
+            work = [_place_batch(batch) for batch in batches]
+        else:
+            work = [_place(intent) for intent in intents]
+        try:
+            started = time.perf_counter()
+            await asyncio.gather(*work)
+            place_elapsed = time.perf_counter() - started
+            all_filled = await _wait_for(lambda: set(sent_at) <= set(recorder.filled_at), args.drain_timeout)
+            fill_ms = [(recorder.filled_at[i] - t) * 1000 for i, t in sent_at.items() if i in recorder.filled_at]
+
+            positions_ms: list[float] = []
+            for _ in range(args.position_polls):
+                poll_started = time.perf_counter()
+                await adapter.fetch_positions()
+                positions_ms.append((time.perf_counter() - poll_started) * 1000)
+            connections = adapter.connection_metrics()
+        finally:
+            consumer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await consumer
+            await adapter.close()
+
+        return {
+            "config": {k: v for k, v in vars(args).items()},
+            "streams_ready": streams_ready,
+            "orders": {
+                "first_place_ms": first_place_ms,
+                "first_error": first_error,
+                "sent": len(intents),
+                "accepted": len(place_ms),
+                "orders_per_sec": len(intents) / place_elapsed,
+                "place_p50_ms": percentile(place_ms, 50),
+                "place_p99_ms": percentile(place_ms, 99),
+                "report_statuses": statuses,
+                "errors": errors,
+                "injected": dict(exchange.outcomes),
+            },
+            "user_stream": {
+                "events": recorder.events,
+                "alerts": recorder.alerts,
+                "all_filled": all_filled,
+                "missing_fills": len(set(sent_at) - set(recorder.filled_at)),
+                "send_to_fill_p50_ms": percentile(fill_ms, 50),
+                "send_to_fill_p99_ms": percentile(fill_ms, 99),
+                "event_lag_p50_ms": percentile(recorder.lags_ms, 50),
+                "event_lag_p99_ms": percentile(recorder.lags_ms, 99),
+            },
+            "fetch_positions": {
+                "polls": len(positions_ms),
+                "p50_ms": percentile(positions_ms, 50),
+                "p99_ms": percentile(positions_ms, 99),
+            },
+            "server_requests": exchange.requests,
+            "rate_limits": adapter.rate_limit_metrics(),
+            "connections": connections,
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="End-to-end BinanceExchangeAdapter benchmark against a local stand-in.")
+    parser.add_argument("--orders", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--market", default="both", choices=["spot", "perp", "both"])
+    parser.add_argument("--transport", default="rest", choices=["rest", "ws"])
+    parser.add_argument("--batch-size", type=int, default=1, help="Intents per place_orders call; 1 places them one by one.")
+    parser.add_argument("--position-polls", type=int, default=20)
+    parser.add_argument("--drain-timeout", type=float, default=10.0, help="Seconds to wait for outstanding fill events.")
+    parser.add_argument("--warmup", action="store_true", help="Pre-open connections and sync the clock before trading.")
+    parser.add_argument("--exchange-limits", action="store_true", help="Keep the production client-side rate limits.")
+    parser.add_argument("--port", type=int, default=8090)
+    add_config_args(parser)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
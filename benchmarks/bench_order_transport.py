@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+
+from benchmarks.binance_standin import BinanceStandInConfig, point_adapter, serve_in_background
+from benchmarks.llm_load_test import percentile
+from common_types.models import OrderIntent
+from exchange_adapters.binance import BinanceExchangeAdapter
+from exchange_adapters.rate_limit import BinanceRateLimiter
+
+
+def make_adapter(transport: str, rest_base: str, ws_base: str) -> BinanceExchangeAdapter:
+    adapter = BinanceExchangeAdapter("bench-key", "bench-secret", use_testnet=True, order_transport=transport)
+    point_adapter(adapter, rest_base, ws_base)
+    # The stand-in enforces nothing, so lift the client-side order caps to measure transport cost alone.
+    adapter.rate_limiters = {
+        market: BinanceRateLimiter(weight_limits={"1m": 10**9}, order_limits={"10s": 10**9}) for market in ("spot", "perp")
+    }
+    return adapter
+
+
+def _intent(idx: int, market: str) -> OrderIntent:
+    return OrderIntent(
+        intent_id=f"bench-{idx}",
+        event_id=f"event-{idx}",
+        symbol="BTCUSDT",
+        market=market,
+        side=1,
+        qty_usd=100.0,
+        max_slippage_bps=20,
+        reason="bench",
+    )
+
+
+async def run_transport(transport: str, rest_base: str, ws_base: str, orders: int, concurrency: int, market: str) -> dict:
+    adapter = make_adapter(transport, rest_base, ws_base)
+    adapter.market_data.update_mark("perp", "BTCUSDT", 100.0, at=float("inf"))
+    latencies_ms: list[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(idx: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await adapter.place_order(_intent(idx, market))
+            latencies_ms.append((time.perf_counter() - started) * 1000)
+
+    try:
+        # The first order pays connection setup on either transport; keep it out of the steady-state numbers.
+        await adapter.place_order(_intent(-1, market))
+        started = time.perf_counter()
+        await asyncio.gather(*(_one(idx) for idx in range(orders)))
+        elapsed = time.perf_counter() - started
+    finally:
+        await adapter.close()
+    return {
+        "transport": transport,
+        "orders": orders,
+        "concurrency": concurrency,
+        "orders_per_sec": orders / elapsed,
+        "p50_ms": percentile(latencies_ms, 50),
+        "p99_ms": percentile(latencies_ms, 99),
+        "ws_fallbacks": adapter.ws_fallbacks,
+    }
+
+
+async def run(args) -> dict:
+    config = BinanceStandInConfig(latency_ms=args.latency_ms, latency_jitter_ms=args.latency_jitter_ms, seed=args.seed)
+    async with serve_in_background(config, port=args.port) as (_, rest_base, ws_base):
+        results = []
+        for concurrency in (int(c) for c in args.concurrency.split(",")):
+            for transport in ("rest", "ws"):
+                results.append(await run_transport(transport, rest_base, ws_base, args.orders, concurrency, args.market))
+    return {"config": vars(args), "results": results}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="REST vs WebSocket API order round-trip benchmark against a local stand-in.")
+    parser.add_argument("--orders", type=int, default=500)
+    parser.add_argument("--concurrency", default="1,8")
+    parser.add_argument("--market", default="perp", choices=["spot", "perp"])
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Server-side delay added to every request.")
+    parser.add_argument("--latency-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
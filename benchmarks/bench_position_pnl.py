@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+
+from apps.position_pnl_service import PositionPnLService
+
+_order_ids = itertools.count(1)
+
+
+class LegacyPositions:
+    # The per-fill bookkeeping this replaces: a dict that never shrinks and exposure re-summed on every fill.
+    def __init__(self):
+        self.positions = defaultdict(float)
+        self.avg_cost: dict[tuple[str, str], float] = {}
+        self.realized = 0.0
+
+    def apply(self, market: str, symbol: str, qty: float, price: float) -> float:
+        key = (market, symbol)
+        prev_qty = self.positions[key]
+        if prev_qty == 0 or (prev_qty > 0 and qty > 0) or (prev_qty < 0 and qty < 0):
+            prev_cost = self.avg_cost.get(key, price)
+            weighted_qty = abs(prev_qty) + abs(qty)
+            self.avg_cost[key] = (prev_cost * abs(prev_qty) + price * abs(qty)) / max(weighted_qty, 1e-9)
+        else:
+            entry = self.avg_cost.get(key, price)
+            self.realized += (1 if prev_qty > 0 else -1) * (price - entry) * min(abs(prev_qty), abs(qty))
+        self.positions[key] = prev_qty + qty
+        return sum(abs(v) for v in self.positions.values())
+
+
+def _fills(positions: int, fills: int, close_share: float, seed: int) -> tuple[list[tuple], list[tuple]]:
+    rng = random.Random(seed)
+    keys = [("perp" if idx % 2 else "spot", f"SYM{idx}USDT") for idx in range(positions)]
+    opening = [(market, symbol, rng.choice((-1, 1)) * rng.uniform(0.1, 10), rng.uniform(1, 1000)) for market, symbol in keys]
+    open_qty = {(market, symbol): qty for market, symbol, qty, _ in opening}
+    stream = []
+    for _ in range(fills):
+        key = rng.choice(keys)
+        if rng.random() < close_share and open_qty[key] != 0:
+            qty = -open_qty[key]
+        else:
+            qty = rng.choice((-1, 1)) * rng.uniform(0.1, 10)
+        open_qty[key] += qty
+        stream.append((*key, qty, rng.uniform(1, 1000)))
+    return opening, stream
+
+
+def _report(market: str, symbol: str, qty: float, price: float) -> dict:
+    return {
+        "order_id": f"{market}:{symbol}:{next(_order_ids)}",
+        "intent_id": "bench",
+        "symbol": symbol,
+        "market": market,
+        "side": 1 if qty > 0 else -1,
+        "status": "filled",
+        "filled_qty": abs(qty),
+        "avg_price": price,
+        "fee": 0.0,
+        "ts": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def _time_book(book, opening: list[tuple], stream: list[tuple]) -> float:
+    for fill in opening:
+        book.apply(*fill)
+    started = time.perf_counter()
+    for fill in stream:
+        book.apply(*fill)
+    return time.perf_counter() - started
+
+
+async def _time_service(
+    opening: list[tuple], stream: list[tuple], interval_sec: float, fill_rate: float
+) -> tuple[float, PositionPnLService]:
+    # Fills arrive on a simulated clock, so the timing includes the snapshots that would really go out.
+    now = [0.0]
+    service = PositionPnLService(snapshot_interval_sec=interval_sec, clock=lambda: now[0])
+    for fill in opening:
+        await service.handle(_report(*fill))
+    reports = [_report(*fill) for fill in stream]
+    started = time.perf_counter()
+    for report in reports:
+        now[0] += 1 / fill_rate
+        await service.handle(report)
+    return time.perf_counter() - started, service
+
+
+async def _count_snapshots(opening: list[tuple], stream: list[tuple], interval_sec: float, fill_rate: float, batch: int) -> dict:
+    # Replays the fills on a simulated clock at the given arrival rate to count what reaches pnl.snapshot.
+    now = [0.0]
+    service = PositionPnLService(snapshot_interval_sec=interval_sec, clock=lambda: now[0])
+    published = 0
+    for fill in opening:
+        published += len(await service.handle(_report(*fill)))
+    reports = [_report(*fill) for fill in stream]
+    next_flush = interval_sec
+    for start in range(0, len(reports), batch):
+        now[0] = start / fill_rate
+        while interval_sec > 0 and now[0] >= next_flush:
+            published += len(service._coalesce(pending=False))
+            next_flush += interval_sec
+        chunk = reports[start : start + batch]
+        published += len(await (service.handle_batch(chunk) if batch > 1 else service.handle(chunk[0])))
+    fills = len(opening) + len(reports)
+    return {
+        "fills": fills,
+        "snapshots": published,
+        "fills_per_snapshot": fills / max(published, 1),
+        "coalesced": service.coalesced,
+    }
+
+
+def _time_marking(opening: list[tuple], ticks: int, revaluations: int, seed: int) -> dict:
+    service = PositionPnLService()
+    for fill in opening:
+        service.book.apply(*fill)
+    rng = random.Random(seed)
+    keys = [(market, symbol) for market, symbol, _, _ in opening]
+    prices = {(market, symbol): price for market, symbol, _, price in opening}
+    tape = []
+    for _ in range(ticks):
+        key = rng.choice(keys)
+        prices[key] *= 1 + rng.gauss(0.0, 0.001)
+        tape.append((*key, prices[key]))
+
+    started = time.perf_counter()
+    for market, symbol, price in tape:
+        service.on_price(market, symbol, price)
+    tick_sec = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(revaluations):
+        snapshot = service.snapshot()
+    revalue_sec = time.perf_counter() - started
+
+    # What a per-position Python loop would cost for the same revaluation.
+    book = service.book
+    started = time.perf_counter()
+    for _ in range(revaluations):
+        looped = sum(book.qty[slot] * (book.mark[slot] - book.avg_cost[slot]) for slot in book._slots.values())
+    loop_sec = time.perf_counter() - started
+    return {
+        "ticks_per_sec": ticks / tick_sec,
+        "revalue_us": revalue_sec / revaluations * 1e6,
+        "python_loop_revalue_us": loop_sec / revaluations * 1e6,
+        "unrealized": snapshot.unrealized,
+        "loop_matches": abs(looped - snapshot.unrealized) <= 1e-6 * max(1.0, abs(looped)),
+    }
+
+
+def run(args) -> dict:
+    opening, stream = _fills(args.positions, args.fills, args.close_share, args.seed)
+    legacy = LegacyPositions()
+    legacy_sec = _time_book(legacy, opening, stream[: args.legacy_fills])
+    service_sec, service = asyncio.run(_time_service(opening, stream, args.snapshot_interval_sec, args.fill_rate))
+    book_sec = _time_book(PositionPnLService().book, opening, stream)
+    return {
+        "config": vars(args),
+        "legacy_us_per_fill": legacy_sec / min(args.legacy_fills, len(stream)) * 1e6,
+        "legacy_entries": len(legacy.positions),
+        "book_us_per_fill": book_sec / len(stream) * 1e6,
+        "service_us_per_fill": service_sec / len(stream) * 1e6,
+        "service_fills_per_sec": len(stream) / service_sec,
+        "open_positions": len(service.book),
+        "gross_exposure": service.book.gross,
+        "mark_to_market": _time_marking(opening, args.ticks, args.revaluations, args.seed),
+        "snapshot_publishing": asyncio.run(
+            _count_snapshots(opening, stream, args.snapshot_interval_sec, args.fill_rate, args.batch_size)
+        ),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="PositionPnLService per-fill and mark-to-market cost with many open positions.")
+    parser.add_argument("--positions", type=int, default=10_000)
+    parser.add_argument("--fills", type=int, default=100_000)
+    parser.add_argument("--legacy-fills", type=int, default=5_000, help="The re-summing baseline is slow; time fewer fills.")
+    parser.add_argument("--close-share", type=float, default=0.2, help="Share of fills that flatten a position.")
+    parser.add_argument("--ticks", type=int, default=1_000_000, help="Price ticks applied across the open positions.")
+    parser.add_argument("--revaluations", type=int, default=1_000)
+    parser.add_argument("--snapshot-interval-sec", type=float, default=1.0, help="0 publishes a snapshot per fill.")
+    parser.add_argument("--fill-rate", type=float, default=1_000.0, help="Simulated fill arrivals per second.")
+    parser.add_argument("--batch-size", type=int, default=1, help="Reports handled per batch, as PNL_BATCH_MAX_REPORTS.")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    print(json.dumps(run(args), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+
+from apps.risk_service import RiskEngine, RiskLimits, RiskService
+from benchmarks.llm_load_test import percentile
+from benchmarks.workloads import synthetic_intents
+from common_types import AppSettings
+from feature_store import MemoryTradingStateStore
+
+
+def bench_engine(intents: list[dict], settings: AppSettings) -> dict:
+    engine = RiskEngine(RiskLimits.from_settings(settings))
+    rows = [(i["symbol"], i["market"], i["side"], i["qty_usd"]) for i in intents]
+    approved = 0
+    started = time.perf_counter()
+    for symbol, market, side, qty_usd in rows:
+        cap, reason_code = engine.evaluate(symbol, market, side, qty_usd)
+        if reason_code is None:
+            engine.commit(symbol, market, side, cap)
+            approved += 1
+    elapsed = time.perf_counter() - started
+    return {
+        "intents": len(rows),
+        "approved": approved,
+        "us_per_intent": elapsed / len(rows) * 1e6,
+        "intents_per_sec": len(rows) / elapsed,
+    }
+
+
+async def bench_service(intents: list[dict], settings: AppSettings, batch_size: int) -> dict:
+    service = RiskService(settings, MemoryTradingStateStore())
+    per_intent_us: list[float] = []
+    started = time.perf_counter()
+    for offset in range(0, len(intents), batch_size):
+        batch = intents[offset : offset + batch_size]
+        batch_started = time.perf_counter()
+        if batch_size == 1:
+            await service.handle_order_intent(batch[0])
+        else:
+            await service.handle_order_intents(batch)
+        per_intent_us.append((time.perf_counter() - batch_started) / len(batch) * 1e6)
+    elapsed = time.perf_counter() - started
+    return {
+        "batch_size": batch_size,
+        "intents_per_sec": len(intents) / elapsed,
+        "us_per_intent_p50": percentile(per_intent_us, 50),
+        "us_per_intent_p99": percentile(per_intent_us, 99),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pre-trade RiskEngine / RiskService throughput benchmark.")
+    parser.add_argument("--intents", type=int, default=10_000)
+    parser.add_argument("--symbols", type=int, default=200)
+    parser.add_argument("--batch-sizes", default="1,32,256")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    # Generous limits so the benchmark measures the approve path rather than early rejections.
+    settings = AppSettings(
+        bus_backend="memory",
+        account_equity_usd=1e12,
+        max_symbol_exposure_pct=0.05,
+        max_total_exposure_pct=0.5,
+    )
+    intents = synthetic_intents(args.intents, args.symbols, args.seed)
+    result = {
+        "config": vars(args),
+        "engine": bench_engine(intents, settings),
+        "service": [
+            asyncio.run(bench_service(intents, settings, int(size))) for size in args.batch_sizes.split(",") if size.strip()
+        ],
+    }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
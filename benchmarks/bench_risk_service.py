@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from apps.risk_service import RiskService
+from benchmarks.llm_load_test import percentile
+from benchmarks.redis_standin import RedisStandIn
+from benchmarks.workloads import synthetic_intents
+from common_types import AppSettings
+from feature_store import MemoryTradingStateStore, RedisTradingStateStore, TradingStateStore
+
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "risk_service.json"
+# p99 over a few thousand in-process samples swings with the scheduler, so it is reported but not gated.
+CHECKED_METRICS = ("p50_us", "p90_us", "alloc_bytes_per_decision")
+# Options that change the workload; a baseline recorded with other values measures something else.
+WORKLOAD_KEYS = ("intents", "symbols", "seed", "rtt_ms", "backends", "batch_sizes")
+
+
+def _calibrate(rounds: int = 5) -> float:
+    # Fixed pure-Python workload used to scale latency baselines across machines.
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        acc = {}
+        for idx in range(200_000):
+            acc[idx & 255] = acc.get(idx & 255, 0.0) + idx * 0.5
+        best = min(best, time.perf_counter() - started)
+    return best * 1e6
+
+
+def _settings() -> AppSettings:
+    return AppSettings(
+        bus_backend="memory",
+        account_equity_usd=1e12,
+        max_symbol_exposure_pct=0.05,
+        max_total_exposure_pct=0.5,
+    )
+
+
+def _make_state(backend: str, rtt_ms: float) -> TradingStateStore:
+    if backend == "memory":
+        return MemoryTradingStateStore()
+    return RedisTradingStateStore("redis://standin", client=RedisStandIn(rtt_ms=rtt_ms))
+
+
+async def _replay(service: RiskService, intents: list[dict], batch_size: int) -> list[float]:
+    per_decision_us: list[float] = []
+    for offset in range(0, len(intents), batch_size):
+        batch = intents[offset : offset + batch_size]
+        started = time.perf_counter()
+        if batch_size == 1:
+            await service.handle_order_intent(batch[0])
+        else:
+            await service.handle_order_intents(batch)
+        per_decision_us.append((time.perf_counter() - started) / len(batch) * 1e6)
+    return per_decision_us
+
+
+async def run_case(backend: str, batch_size: int, intents: list[dict], rtt_ms: float, repeat: int) -> dict:
+    settings = _settings()
+    warmup = intents[: min(len(intents), 500)]
+    await _replay(RiskService(settings, _make_state(backend, rtt_ms)), warmup, batch_size)
+
+    # Best-of-N runs keeps scheduler noise out of the regression gate.
+    p50s, p90s, p99s = [], [], []
+    for _ in range(max(1, repeat)):
+        latencies = await _replay(RiskService(settings, _make_state(backend, rtt_ms)), intents, batch_size)
+        p50s.append(percentile(latencies, 50))
+        p90s.append(percentile(latencies, 90))
+        p99s.append(percentile(latencies, 99))
+
+    service = RiskService(settings, _make_state(backend, rtt_ms))
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline_bytes, _ = tracemalloc.get_traced_memory()
+    await _replay(service, intents, batch_size)
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "p50_us": min(p50s),
+        "p90_us": min(p90s),
+        "p99_us": min(p99s),
+        "alloc_bytes_per_decision": max(0, peak_bytes - baseline_bytes) / len(intents),
+    }
+
+
+async def run_suite(args) -> dict:
+    intents = synthetic_intents(args.intents, args.symbols, args.seed)
+    cases = {}
+    for backend in args.backends.split(","):
+        for size in args.batch_sizes.split(","):
+            cases[f"{backend}/batch={int(size)}"] = await run_case(
+                backend.strip(), int(size), intents, args.rtt_ms, args.repeat
+            )
+    return cases
+
+
+def compare(current: dict, baseline: dict, tolerance: float, scale: float) -> list[str]:
+    mismatched = [key for key in WORKLOAD_KEYS if current["config"].get(key) != baseline["config"].get(key)]
+    if mismatched:
+        return [
+            f"config {key}={current['config'].get(key)!r} does not match baseline {baseline['config'].get(key)!r}"
+            for key in mismatched
+        ]
+    failures = []
+    for name, metrics in current["cases"].items():
+        reference = baseline["cases"].get(name)
+        if reference is None:
+            continue
+        for metric in CHECKED_METRICS:
+            # Latencies are scaled by the relative machine speed; allocations are machine independent.
+            factor = scale if metric.endswith("_us") else 1.0
+            limit = reference[metric] * factor * (1 + tolerance)
+            if metrics[metric] > limit:
+                failures.append(f"{name} {metric}={metrics[metric]:.2f} exceeds {limit:.2f} (baseline {reference[metric]:.2f})")
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="RiskService latency/allocation regression benchmark.")
+    parser.add_argument("--intents", type=int, default=5_000)
+    parser.add_argument("--symbols", type=int, default=200)
+    parser.add_argument("--backends", default="memory,redis")
+    parser.add_argument("--batch-sizes", default="1,32")
+    parser.add_argument("--rtt-ms", type=float, default=0.0, help="Simulated Redis round-trip time for the stand-in.")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=1.0, help="Allowed relative regression before failing.")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    # Calibrating on both sides of the suite keeps a slow moment at startup from skewing the scale.
+    calibration_us = _calibrate()
+    cases = asyncio.run(run_suite(args))
+    calibration_us = min(calibration_us, _calibrate())
+    result = {
+        "config": {k: v for k, v in vars(args).items() if k not in {"baseline", "update_baseline", "tolerance"}},
+        "calibration_us": calibration_us,
+        "cases": cases,
+    }
+    print(json.dumps(result, indent=2))
+
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+        print(f"baseline written to {args.baseline}", file=sys.stderr)
+        return 0
+    if not args.baseline.exists():
+        print(f"no baseline at {args.baseline}; run with --update-baseline", file=sys.stderr)
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    failures = compare(result, baseline, args.tolerance, calibration_us / baseline["calibration_us"])
+    for failure in failures:
+        print(f"REGRESSION {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
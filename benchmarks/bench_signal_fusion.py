@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+from apps.signal_fusion_service import SignalFusionService
+from common_types import AppSettings
+from feature_store import FusionBook
+
+
+def _synthetic_stream(symbols: int, rate: float, duration_sec: float, seed: int) -> list[tuple[str, float, int, float, float]]:
+    rng = random.Random(seed)
+    names = [f"SYM{idx:05d}USDT" for idx in range(symbols)]
+    total = int(rate * duration_sec)
+    out = []
+    for idx in range(total):
+        out.append(
+            (
+                rng.choice(names),
+                idx / rate,
+                rng.choice((-1, 1)),
+                rng.uniform(0.3, 0.95),
+                rng.uniform(0.65, 0.95),
+            )
+        )
+    return out
+
+
+def _new_book(settings: AppSettings) -> FusionBook:
+    return FusionBook(
+        capacity=settings.fusion_buffer_size,
+        half_life_sec=settings.fusion_half_life_sec,
+        evict_epsilon=settings.fusion_evict_epsilon,
+    )
+
+
+def bench_book(stream, settings: AppSettings) -> dict:
+    book = _new_book(settings)
+    started = time.perf_counter()
+    for symbol, ts, side, strength, confidence in stream:
+        book.update(symbol, ts, side * strength * (0.8 + 0.2 * confidence))
+    elapsed = time.perf_counter() - started
+    tracked = len(book)
+    # After a quiet period every buffer has decayed below epsilon and should be gone.
+    book.evict_decayed(stream[-1][1] + 24 * settings.fusion_half_life_sec)
+
+    tracemalloc.start()
+    sized = _new_book(settings)
+    for symbol, ts, side, strength, confidence in stream:
+        sized.update(symbol, ts, side * strength * (0.8 + 0.2 * confidence))
+    current_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "updates": len(stream),
+        "updates_per_sec": len(stream) / elapsed,
+        "us_per_update": elapsed / len(stream) * 1e6,
+        "tracked_symbols": tracked,
+        "tracked_after_quiet_period": len(book),
+        "state_mb": current_bytes / 1e6,
+    }
+
+
+async def bench_service(stream, settings: AppSettings) -> dict:
+    service = SignalFusionService(settings)
+    base = datetime.now(timezone.utc)
+    payloads = [
+        {
+            "event_id": f"bench-{idx}",
+            "symbol": symbol,
+            "side": side,
+            "strength": strength,
+            "confidence": confidence,
+            "horizon_min": 60,
+            "ttl_sec": 3600,
+            "rationale": "bench",
+            "generated_at": (base + timedelta(seconds=ts)).isoformat(),
+        }
+        for idx, (symbol, ts, side, strength, confidence) in enumerate(stream)
+    ]
+    emitted = 0
+    started = time.perf_counter()
+    for payload in payloads:
+        emitted += len(await service.handle(payload))
+    elapsed = time.perf_counter() - started
+    return {
+        "signals": len(payloads),
+        "signals_per_sec": len(payloads) / elapsed,
+        "us_per_signal": elapsed / len(payloads) * 1e6,
+        "emitted": emitted,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SignalFusionService decay-weighted ring-buffer benchmark.")
+    parser.add_argument("--symbols", type=int, default=10_000)
+    parser.add_argument("--rate", type=float, default=100.0, help="Signals per second of simulated time.")
+    parser.add_argument("--duration", type=float, default=3600.0, help="Simulated seconds.")
+    parser.add_argument("--service-signals", type=int, default=50_000, help="Signals replayed through handle().")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    settings = AppSettings(bus_backend="memory")
+    stream = _synthetic_stream(args.symbols, args.rate, args.duration, args.seed)
+    result = {
+        "config": vars(args),
+        "book": bench_book(stream, settings),
+        "service": asyncio.run(bench_service(stream[: args.service_signals], settings)),
+    }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
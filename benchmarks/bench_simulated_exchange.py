@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from benchmarks.llm_load_test import percentile
+from common_types.models import OrderIntent
+from exchange_adapters import SimulatedExchangeAdapter
+from exchange_adapters.simulated import DEFAULT_BASE_PRICES
+
+
+class SimClock:
+    def __init__(self, start: float = 0.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _intents(count: int, seed: int, min_usd: float, max_usd: float, slippage_bps: int) -> list[OrderIntent]:
+    rng = random.Random(seed)
+    symbols = list(DEFAULT_BASE_PRICES)
+    return [
+        OrderIntent(
+            intent_id=f"bench-{idx}",
+            event_id=f"event-{idx}",
+            symbol=rng.choice(symbols),
+            market=rng.choice(("spot", "perp")),
+            side=rng.choice((-1, 1)),
+            qty_usd=rng.uniform(min_usd, max_usd),
+            max_slippage_bps=slippage_bps,
+            reason="bench",
+        )
+        for idx in range(count)
+    ]
+
+
+async def run(args) -> dict:
+    clock = SimClock()
+    adapter = SimulatedExchangeAdapter(
+        seed=args.seed,
+        fee_bps=args.fee_bps,
+        level_depth_usd=args.level_depth_usd,
+        volatility_bps=args.volatility_bps,
+        resilience_sec=args.resilience_sec,
+        clock=clock,
+    )
+    intents = _intents(args.orders, args.seed, args.min_usd, args.max_usd, args.slippage_bps)
+    step = 1.0 / args.rate
+    slippage_bps: list[float] = []
+    statuses: dict[str, int] = {}
+
+    started = time.perf_counter()
+    for intent in intents:
+        clock.now += step
+        mid = adapter.mid_price(intent.symbol)
+        report = await adapter.place_order(intent)
+        statuses[report.status] = statuses.get(report.status, 0) + 1
+        if report.filled_qty > 0:
+            slippage_bps.append((report.avg_price / mid - 1) * intent.side * 10_000)
+    elapsed = time.perf_counter() - started
+
+    resting = adapter.poll()
+    poll_started = time.perf_counter()
+    polls = 0
+    while resting and polls < 10_000:
+        clock.now += 0.1
+        resting = adapter.poll()
+        polls += 1
+    poll_elapsed = time.perf_counter() - poll_started
+
+    return {
+        "config": vars(args),
+        "orders_per_sec": len(intents) / elapsed,
+        "us_per_order": elapsed / len(intents) * 1e6,
+        "statuses": statuses,
+        "slippage_p50_bps": percentile(slippage_bps, 50),
+        "slippage_p99_bps": percentile(slippage_bps, 99),
+        "resting_after_drain": resting,
+        "drain_sim_sec": polls * 0.1,
+        "drain_wall_ms": poll_elapsed * 1000,
+        "stream_events": adapter._events.qsize(),
+        "dropped_events": adapter.dropped_events,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SimulatedExchangeAdapter order throughput and fill-quality benchmark.")
+    parser.add_argument("--orders", type=int, default=100_000)
+    parser.add_argument("--rate", type=float, default=50.0, help="Simulated orders per second of book time.")
+    parser.add_argument("--min-usd", type=float, default=100.0)
+    parser.add_argument("--max-usd", type=float, default=50_000.0)
+    parser.add_argument("--slippage-bps", type=int, default=5)
+    parser.add_argument("--fee-bps", type=float, default=4.0)
+    parser.add_argument("--level-depth-usd", type=float, default=250_000.0)
+    parser.add_argument("--volatility-bps", type=float, default=1.0)
+    parser.add_argument("--resilience-sec", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
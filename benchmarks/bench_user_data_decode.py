@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from common_types.models import ExecutionReport
+from exchange_adapters import user_data
+from exchange_adapters.user_data import EXECUTION_EVENTS, decode_user_data_frame, parse_status
+
+SAMPLES = Path(__file__).parent / "data" / "binance_user_data_frames.jsonl"
+
+
+def load_frames(path: Path, count: int, execution_share: float, seed: int) -> list[tuple[str, str]]:
+    samples = [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+    executions = [(s["market"], s["frame"]) for s in samples if f'"{EXECUTION_EVENTS[s["market"]]}"' in s["frame"]]
+    others = [(s["market"], s["frame"]) for s in samples if (s["market"], s["frame"]) not in executions]
+    rng = random.Random(seed)
+    return [rng.choice(executions if rng.random() < execution_share else others) for _ in range(count)]
+
+
+def legacy_decode(market: str, frame: str) -> ExecutionReport | str | None:
+    # The path this replaces: full decode, an intermediate dict with an ISO timestamp, then pydantic validation.
+    data = json.loads(frame)
+    if data.get("e") == "listenKeyExpired":
+        return "listenKeyExpired"
+    if data.get("e") != EXECUTION_EVENTS[market]:
+        return None
+    order = data if market == "spot" else data.get("o", {})
+    filled_qty = float(order.get("z", 0.0) or 0.0)
+    if market == "spot":
+        avg_price = float(order.get("Z", 0.0) or 0.0) / filled_qty if filled_qty > 0 else 0.0
+    else:
+        avg_price = float(order.get("ap", 0.0) or 0.0)
+    payload = {
+        "order_id": f"{market}:{order.get('s')}:{order.get('i')}",
+        "intent_id": str(order.get("c", "")),
+        "symbol": order.get("s"),
+        "market": market,
+        "side": 1 if order.get("S") == "BUY" else -1,
+        "status": parse_status(str(order.get("X", "new"))),
+        "filled_qty": filled_qty,
+        "avg_price": avg_price,
+        "fee": 0.0,
+        "ts": datetime.fromtimestamp(int(data["E"]) / 1000, tz=timezone.utc).isoformat(),
+        "event_type": "execution",
+    }
+    return ExecutionReport.model_validate(payload)
+
+
+def _time(decode, frames: list[tuple[str, str]], repeats: int) -> tuple[float, list]:
+    best = float("inf")
+    out: list = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        out = [decode(market, frame) for market, frame in frames]
+        best = min(best, time.perf_counter() - started)
+    return best, out
+
+
+def run(args) -> dict:
+    frames = load_frames(Path(args.samples), args.frames, args.execution_share, args.seed)
+    legacy_sec, legacy = _time(legacy_decode, frames, args.repeats)
+    fast_sec, fast = _time(decode_user_data_frame, frames, args.repeats)
+    mismatches = sum(
+        1
+        for a, b in zip(legacy, fast)
+        if (a.model_dump() if isinstance(a, ExecutionReport) else a) != (b.model_dump() if isinstance(b, ExecutionReport) else b)
+    )
+    return {
+        "config": vars(args),
+        "json_backend": "orjson" if user_data.orjson is not None else "json",
+        "frames": len(frames),
+        "executions": sum(isinstance(item, ExecutionReport) for item in fast),
+        "legacy_us_per_frame": legacy_sec / len(frames) * 1e6,
+        "fast_us_per_frame": fast_sec / len(frames) * 1e6,
+        "speedup": legacy_sec / fast_sec,
+        "mismatches": mismatches,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Binance user-data frame decoding: legacy dict path vs fast path.")
+    parser.add_argument("--samples", default=str(SAMPLES), help="JSONL of recorded frames: {market, frame}.")
+    parser.add_argument("--frames", type=int, default=100_000)
+    parser.add_argument("--execution-share", type=float, default=0.5, help="Fraction of frames that are order updates.")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    print(json.dumps(run(args), indent=2))
+
+
+if __name__ == "__main__":
+    main()
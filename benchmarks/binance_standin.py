@@ -0,0 +1,602 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import itertools
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from uuid import uuid4
+
+import uvicorn
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse
+
+_QUOTE_ASSETS = ("USDT", "BUSD", "USDC")
+# Weights of the endpoints the adapter calls, mirrored in the x-mbx-used-weight-1m header.
+_WEIGHTS = {
+    ("GET", "/api/v3/account"): 20,
+    ("GET", "/api/v3/exchangeInfo"): 20,
+    ("GET", "/fapi/v2/positionRisk"): 5,
+    ("POST", "/fapi/v1/batchOrders"): 5,
+}
+_ERRORS = {
+    "error": (503, {"code": -1001, "msg": "Internal error; unable to process your request. Please try again."}),
+    "rejected": (400, {"code": -2010, "msg": "Account has insufficient balance for requested action."}),
+    "stale_timestamp": (400, {"code": -1021, "msg": "Timestamp for this request is outside of the recvWindow."}),
+    "rate_limited": (429, {"code": -1003, "msg": "Too many requests; please use the websocket for live updates."}),
+}
+
+
+@dataclass
+class BinanceStandInConfig:
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    event_latency_ms: float = 0.0
+    partial_fill_rate: float = 0.0
+    fill_steps: int = 3
+    fill_interval_ms: float = 5.0
+    error_rate: float = 0.0
+    reject_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    listen_key_ttl_sec: float = 0.0
+    # Server clock ahead of the host clock; signed orders outside recvWindow are rejected with -1021.
+    clock_offset_ms: float = 0.0
+    default_price: float = 100.0
+    prices: dict[str, float] = field(default_factory=dict)
+    quote_balance: float = 1_000_000.0
+    seed: int | None = None
+
+
+class StandInExchange:
+    def __init__(self, config: BinanceStandInConfig):
+        self.config = config
+        self._rng = random.Random(config.seed)
+        self._order_ids = itertools.count(1)
+        self.orders: dict[tuple[str, int], dict] = {}
+        self.prices: dict[str, float] = dict(config.prices)
+        self.balances: dict[str, float] = {"USDT": config.quote_balance}
+        self.positions: dict[str, float] = {}
+        self.listen_keys: dict[str, str] = {}
+        self._subscribers: dict[str, set[asyncio.Queue]] = {"spot": set(), "perp": set()}
+        self._fill_tasks: set[asyncio.Task] = set()
+        self.requests = 0
+        self.events_sent = 0
+        self.outcomes: dict[str, int] = {}
+        self._weight_window = 0
+        self.used_weight = 0
+
+    async def delay(self) -> None:
+        cfg = self.config
+        latency_ms = cfg.latency_ms
+        if cfg.latency_jitter_ms:
+            latency_ms += self._rng.uniform(-cfg.latency_jitter_ms, cfg.latency_jitter_ms)
+        if latency_ms > 0:
+            await asyncio.sleep(latency_ms / 1000)
+
+    def pick_outcome(self) -> str:
+        roll = self._rng.random()
+        for outcome, rate in (
+            ("error", self.config.error_rate),
+            ("rejected", self.config.reject_rate),
+            ("rate_limited", self.config.rate_limit_rate),
+        ):
+            if roll < rate:
+                self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+                return outcome
+            roll -= rate
+        return "ok"
+
+    def check_timestamp(self, params: dict) -> str | None:
+        if "timestamp" not in params:
+            return None
+        server_ms = time.time() * 1000 + self.config.clock_offset_ms
+        if abs(server_ms - int(params["timestamp"])) > int(params.get("recvWindow", 5000)):
+            self.outcomes["stale_timestamp"] = self.outcomes.get("stale_timestamp", 0) + 1
+            return "stale_timestamp"
+        return None
+
+    def price(self, symbol: str) -> float:
+        return self.prices.get(symbol, self.config.default_price)
+
+    def use_weight(self, weight: int = 1) -> int:
+        window = int(time.time() // 60)
+        if window != self._weight_window:
+            self._weight_window = window
+            self.used_weight = 0
+        self.used_weight += weight
+        return self.used_weight
+
+    def weight_headers(self, weight: int = 1) -> dict[str, str]:
+        return {"x-mbx-used-weight-1m": str(self.use_weight(weight))}
+
+    def subscribers(self, market: str | None = None) -> int:
+        markets = (market,) if market else tuple(self._subscribers)
+        return sum(len(self._subscribers[m]) for m in markets)
+
+    def create_listen_key(self, market: str) -> str:
+        key = uuid4().hex
+        self.listen_keys[key] = market
+        return key
+
+    def subscribe(self, market: str) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers[market].add(queue)
+        return queue
+
+    def unsubscribe(self, market: str, queue: asyncio.Queue) -> None:
+        self._subscribers[market].discard(queue)
+
+    def _publish(self, market: str, event: dict) -> None:
+        for queue in list(self._subscribers[market]):
+            queue.put_nowait(event)
+            self.events_sent += 1
+
+    def _event(self, order: dict, market: str, last_qty: float) -> dict:
+        now_ms = int(time.time() * 1000)
+        price = self.price(order["symbol"])
+        executed = order["_executed"]
+        common = {
+            "s": order["symbol"],
+            "c": order["clientOrderId"],
+            "S": order["side"],
+            "o": order["type"],
+            "X": order["status"],
+            "i": order["orderId"],
+            "z": f"{executed:.8f}",
+            "l": f"{last_qty:.8f}",
+            "L": f"{price:.8f}",
+            "n": f"{last_qty * price * 0.001:.8f}",
+            "T": now_ms,
+        }
+        if market == "spot":
+            return {"e": "executionReport", "E": now_ms, "x": "TRADE", "Z": f"{executed * price:.8f}", **common}
+        return {"e": "ORDER_TRADE_UPDATE", "E": now_ms, "T": now_ms, "o": {**common, "x": "TRADE", "ap": f"{price:.8f}"}}
+
+    def _account_event(self, market: str, symbol: str) -> dict:
+        now_ms = int(time.time() * 1000)
+        if market == "perp":
+            # Entry is reported at the current price, so the position carries no unrealized PnL.
+            qty, price = self.positions.get(symbol, 0.0), self.price(symbol)
+            pos = {"s": symbol, "pa": f"{qty:.8f}", "ep": f"{price:.8f}", "up": "0", "mt": "cross", "ps": "BOTH"}
+            return {"e": "ACCOUNT_UPDATE", "E": now_ms, "T": now_ms, "a": {"m": "ORDER", "B": [], "P": [pos]}}
+        base = symbol[: -len("USDT")] if symbol.endswith("USDT") else symbol
+        balances = [{"a": asset, "f": f"{self.balances.get(asset, 0.0):.8f}", "l": "0"} for asset in (base, "USDT")]
+        return {"e": "outboundAccountPosition", "E": now_ms, "u": now_ms, "B": balances}
+
+    def _apply_fill(self, market: str, order: dict, qty: float) -> None:
+        symbol = order["symbol"]
+        signed_qty = qty if order["side"] == "BUY" else -qty
+        if market == "perp":
+            self.positions[symbol] = self.positions.get(symbol, 0.0) + signed_qty
+            return
+        base = symbol[: -len("USDT")] if symbol.endswith("USDT") else symbol
+        self.balances[base] = self.balances.get(base, 0.0) + signed_qty
+        self.balances["USDT"] = self.balances.get("USDT", 0.0) - signed_qty * self.price(symbol)
+
+    def _fill(self, market: str, order: dict, qty: float) -> None:
+        executed = order["_executed"] + qty
+        order["_executed"] = executed
+        order["executedQty"] = f"{executed:.8f}"
+        order["cummulativeQuoteQty"] = f"{executed * self.price(order['symbol']):.8f}"
+        order["status"] = "FILLED" if executed >= order["_qty"] * (1 - 1e-9) else "PARTIALLY_FILLED"
+        order["updateTime"] = int(time.time() * 1000)
+        self._apply_fill(market, order, qty)
+        # Binance pushes the order update and then the account change it caused.
+        events = [self._event(order, market, qty), self._account_event(market, order["symbol"])]
+        if self.config.event_latency_ms > 0:
+            self._spawn(self._publish_later(market, events))
+        else:
+            for event in events:
+                self._publish(market, event)
+
+    async def _publish_later(self, market: str, events: list[dict]) -> None:
+        await asyncio.sleep(self.config.event_latency_ms / 1000)
+        for event in events:
+            self._publish(market, event)
+
+    async def _fill_rest(self, market: str, order: dict, steps: list[float]) -> None:
+        for qty in steps:
+            await asyncio.sleep(self.config.fill_interval_ms / 1000)
+            if order["status"] == "CANCELED":
+                return
+            self._fill(market, order, qty)
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._fill_tasks.add(task)
+        task.add_done_callback(self._fill_tasks.discard)
+
+    def place(self, market: str, params: dict) -> dict:
+        symbol = str(params["symbol"])
+        price = self.price(symbol)
+        if "quoteOrderQty" in params:
+            qty = float(params["quoteOrderQty"]) / price
+        else:
+            qty = float(params.get("quantity", 0.0))
+        order_id = next(self._order_ids)
+        order = {
+            "symbol": symbol,
+            "orderId": order_id,
+            "clientOrderId": params.get("newClientOrderId", f"standin-{order_id}"),
+            "side": params.get("side", "BUY"),
+            "type": params.get("type", "MARKET"),
+            "status": "NEW",
+            "executedQty": "0",
+            "cummulativeQuoteQty": "0",
+            "updateTime": int(time.time() * 1000),
+            "_qty": qty,
+            "_executed": 0.0,
+        }
+        self.orders[(market, order_id)] = order
+
+        steps = [qty]
+        if self.config.fill_steps > 1 and self._rng.random() < self.config.partial_fill_rate:
+            steps = [qty / self.config.fill_steps] * self.config.fill_steps
+        # The first slice trades inside the request, like a market order sweeping the top level; the rest trickles in.
+        self._fill(market, order, steps[0])
+        if len(steps) > 1:
+            self._spawn(self._fill_rest(market, order, steps[1:]))
+
+        body = self.public(order)
+        if market == "spot":
+            body["fills"] = [{"price": f"{price:.8f}", "qty": f"{steps[0]:.8f}", "commission": f"{steps[0] * price * 0.001:.8f}"}]
+        else:
+            body["avgPrice"] = f"{price:.8f}"
+        return body
+
+    @staticmethod
+    def public(order: dict) -> dict:
+        return {k: v for k, v in order.items() if not k.startswith("_")}
+
+    def lookup(self, market: str, params: dict) -> dict | None:
+        order = self.orders.get((market, int(params.get("orderId", 0))))
+        return self.public(order) if order is not None else None
+
+    def cancel(self, market: str, params: dict) -> dict | None:
+        order = self.orders.get((market, int(params.get("orderId", 0))))
+        if order is None:
+            return None
+        if order["status"] not in {"FILLED", "CANCELED"}:
+            order["status"] = "CANCELED"
+        return self.public(order)
+
+    def account(self) -> dict:
+        balances = [{"asset": asset, "free": f"{qty:.8f}", "locked": "0"} for asset, qty in self.balances.items()]
+        return {"canTrade": True, "balances": balances}
+
+    def position_risk(self) -> list[dict]:
+        return [
+            {
+                "symbol": symbol,
+                "positionAmt": f"{qty:.8f}",
+                "markPrice": f"{self.price(symbol):.8f}",
+                "notional": f"{qty * self.price(symbol):.8f}",
+            }
+            for symbol, qty in self.positions.items()
+        ]
+
+    def tickers(self, symbol: str | None) -> dict | list[dict]:
+        if symbol:
+            return {"symbol": symbol, "price": f"{self.price(symbol):.8f}"}
+        symbols = set(self.prices) | {f"{asset}USDT" for asset in self.balances if asset not in _QUOTE_ASSETS}
+        return [{"symbol": s, "price": f"{self.price(s):.8f}"} for s in sorted(symbols)]
+
+    def exchange_info(self, market: str) -> dict:
+        symbols = []
+        for symbol in sorted(set(self.prices) | set(self.positions)):
+            item = {
+                "symbol": symbol,
+                "status": "TRADING",
+                "quoteAssetPrecision": 8,
+                "filters": [
+                    {"filterType": "LOT_SIZE", "minQty": "0.00001", "maxQty": "9000", "stepSize": "0.00001"},
+                    {"filterType": "PRICE_FILTER", "tickSize": "0.01"},
+                    {"filterType": "NOTIONAL" if market == "spot" else "MIN_NOTIONAL", "minNotional": "5"},
+                ],
+            }
+            if market == "perp":
+                item["contractType"] = "PERPETUAL"
+            symbols.append(item)
+        return {"symbols": symbols}
+
+    async def close(self) -> None:
+        for queues in self._subscribers.values():
+            for queue in queues:
+                queue.put_nowait(None)
+        for task in list(self._fill_tasks):
+            task.cancel()
+        await asyncio.gather(*self._fill_tasks, return_exceptions=True)
+
+
+def _error_response(outcome: str, headers: dict[str, str]) -> JSONResponse:
+    status, body = _ERRORS[outcome]
+    if outcome == "rate_limited":
+        headers = {**headers, "retry-after": "1"}
+    return JSONResponse(body, status_code=status, headers=headers)
+
+
+def _unknown_order() -> dict:
+    return {"code": -2013, "msg": "Order does not exist."}
+
+
+def build_app(config: BinanceStandInConfig) -> FastAPI:
+    exchange = StandInExchange(config)
+    app = FastAPI(title="binance stand-in")
+    app.state.exchange = exchange
+
+    def _rest_order_route(market: str):
+        async def handler(request: Request):
+            exchange.requests += 1
+            await exchange.delay()
+            params = dict(request.query_params)
+            headers = exchange.weight_headers()
+            if request.method == "POST":
+                outcome = exchange.check_timestamp(params) or exchange.pick_outcome()
+                if outcome != "ok":
+                    return _error_response(outcome, headers)
+                return JSONResponse(exchange.place(market, params), headers=headers)
+            order = exchange.cancel(market, params) if request.method == "DELETE" else exchange.lookup(market, params)
+            if order is None:
+                return JSONResponse(_unknown_order(), status_code=400, headers=headers)
+            return JSONResponse(order, headers=headers)
+
+        return handler
+
+    @app.get("/api/v3/time")
+    @app.get("/fapi/v1/time")
+    async def server_time():
+        exchange.requests += 1
+        await exchange.delay()
+        return JSONResponse({"serverTime": int(time.time() * 1000 + exchange.config.clock_offset_ms)}, headers=exchange.weight_headers())
+
+    app.add_api_route("/api/v3/order", _rest_order_route("spot"), methods=["POST", "DELETE", "GET"])
+    app.add_api_route("/fapi/v1/order", _rest_order_route("perp"), methods=["POST", "DELETE", "GET"])
+
+    @app.post("/fapi/v1/batchOrders")
+    async def batch_orders(request: Request):
+        exchange.requests += 1
+        await exchange.delay()
+        headers = exchange.weight_headers(_WEIGHTS[("POST", "/fapi/v1/batchOrders")])
+        stale = exchange.check_timestamp(dict(request.query_params))
+        if stale is not None:
+            return _error_response(stale, headers)
+        results = []
+        for params in json.loads(request.query_params["batchOrders"]):
+            # Injected faults apply per order, as Binance reports failures inside the batch response.
+            outcome = exchange.pick_outcome()
+            results.append(exchange.place("perp", params) if outcome == "ok" else _ERRORS[outcome][1])
+        return JSONResponse(results, headers=headers)
+
+    def _rest_read_route(path: str, read):
+        async def handler(request: Request):
+            exchange.requests += 1
+            await exchange.delay()
+            return JSONResponse(read(request), headers=exchange.weight_headers(_WEIGHTS.get(("GET", path), 1)))
+
+        return handler
+
+    for path, read in (
+        ("/api/v3/account", lambda request: exchange.account()),
+        ("/fapi/v2/positionRisk", lambda request: exchange.position_risk()),
+        ("/api/v3/ticker/price", lambda request: exchange.tickers(request.query_params.get("symbol"))),
+        ("/fapi/v1/ticker/price", lambda request: exchange.tickers(request.query_params.get("symbol"))),
+        ("/api/v3/exchangeInfo", lambda request: exchange.exchange_info("spot")),
+        ("/fapi/v1/exchangeInfo", lambda request: exchange.exchange_info("perp")),
+    ):
+        app.add_api_route(path, _rest_read_route(path, read), methods=["GET"])
+
+    def _listen_key_route(market: str):
+        async def handler(request: Request):
+            exchange.requests += 1
+            await exchange.delay()
+            headers = exchange.weight_headers()
+            if request.method == "POST":
+                return JSONResponse({"listenKey": exchange.create_listen_key(market)}, headers=headers)
+            listen_key = request.query_params.get("listenKey", "")
+            if listen_key not in exchange.listen_keys:
+                return JSONResponse({"code": -1125, "msg": "This listenKey does not exist."}, status_code=400, headers=headers)
+            if request.method == "DELETE":
+                exchange.listen_keys.pop(listen_key, None)
+            return JSONResponse({}, headers=headers)
+
+        return handler
+
+    app.add_api_route("/api/v3/userDataStream", _listen_key_route("spot"), methods=["POST", "PUT", "DELETE"])
+    app.add_api_route("/fapi/v1/listenKey", _listen_key_route("perp"), methods=["POST", "PUT", "DELETE"])
+
+    async def user_data_stream(websocket: WebSocket, listen_key: str):
+        market = exchange.listen_keys.get(listen_key)
+        if market is None:
+            await websocket.close(code=4001)
+            return
+        await websocket.accept()
+        queue = exchange.subscribe(market)
+
+        async def _watch_disconnect() -> None:
+            # The stream is push-only, so a reader is needed to notice the client going away.
+            with contextlib.suppress(Exception):
+                while (await websocket.receive())["type"] != "websocket.disconnect":
+                    pass
+            queue.put_nowait(None)
+
+        watcher = asyncio.create_task(_watch_disconnect())
+        expires_at = time.monotonic() + config.listen_key_ttl_sec if config.listen_key_ttl_sec > 0 else None
+        try:
+            while True:
+                timeout = None if expires_at is None else max(0.0, expires_at - time.monotonic())
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    exchange.listen_keys.pop(listen_key, None)
+                    await websocket.send_text(json.dumps({"e": "listenKeyExpired", "E": int(time.time() * 1000)}))
+                    await websocket.close()
+                    return
+                if event is None:
+                    return
+                await websocket.send_text(json.dumps(event))
+        except (WebSocketDisconnect, RuntimeError):
+            pass
+        finally:
+            exchange.unsubscribe(market, queue)
+            watcher.cancel()
+
+    app.add_api_websocket_route("/ws/{listen_key}", user_data_stream)
+
+    def _ws_api_route(market: str):
+        async def handler(websocket: WebSocket):
+            await websocket.accept()
+
+            async def _respond(message: str) -> None:
+                request = json.loads(message)
+                exchange.requests += 1
+                await exchange.delay()
+                method = request.get("method")
+                params = request.get("params") or {}
+                error = None
+                if method == "order.place":
+                    outcome = exchange.check_timestamp(params) or exchange.pick_outcome()
+                    if outcome == "ok":
+                        status, result = 200, exchange.place(market, params)
+                    else:
+                        (status, error), result = _ERRORS[outcome], None
+                elif method in {"order.cancel", "order.status"}:
+                    result = exchange.cancel(market, params) if method == "order.cancel" else exchange.lookup(market, params)
+                    status = 200 if result is not None else 400
+                else:
+                    status, result = 400, None
+                used_weight = exchange.use_weight()
+                body = {
+                    "id": request.get("id"),
+                    "status": status,
+                    "rateLimits": [
+                        {
+                            "rateLimitType": "REQUEST_WEIGHT",
+                            "interval": "MINUTE",
+                            "intervalNum": 1,
+                            "limit": 6000,
+                            "count": used_weight,
+                        }
+                    ],
+                }
+                if status == 200:
+                    body["result"] = result
+                else:
+                    body["error"] = error or _unknown_order()
+                await websocket.send_text(json.dumps(body))
+
+            tasks: set[asyncio.Task] = set()
+            try:
+                while True:
+                    # Requests are served concurrently, like the real endpoint, so responses may arrive out of order.
+                    task = asyncio.create_task(_respond(await websocket.receive_text()))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+            except WebSocketDisconnect:
+                for task in tasks:
+                    task.cancel()
+
+        return handler
+
+    app.add_api_websocket_route("/ws-api/v3", _ws_api_route("spot"))
+    app.add_api_websocket_route("/ws-fapi/v1", _ws_api_route("perp"))
+
+    return app
+
+
+@contextlib.asynccontextmanager
+async def serve_in_background(config: BinanceStandInConfig, host: str = "127.0.0.1", port: int = 8090):
+    app = build_app(config)
+    server = uvicorn.Server(uvicorn.Config(app, host=host, port=port, log_level="warning"))
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        if task.done():
+            task.result()
+        await asyncio.sleep(0.01)
+    # port=0 lets the OS pick a free port; report the one actually bound.
+    port = server.servers[0].sockets[0].getsockname()[1]
+    try:
+        yield app.state.exchange, f"http://{host}:{port}", f"ws://{host}:{port}"
+    finally:
+        await app.state.exchange.close()
+        server.should_exit = True
+        await task
+
+
+@contextlib.contextmanager
+def serve_in_thread(config: BinanceStandInConfig, host: str = "127.0.0.1", port: int = 8090):
+    # A separate event loop keeps the stand-in's own work from queueing behind the client under test.
+    app = build_app(config)
+    exchange = app.state.exchange
+    server = uvicorn.Server(uvicorn.Config(app, host=host, port=port, log_level="warning"))
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_until_complete, args=(server.serve(),), daemon=True)
+    thread.start()
+    while not server.started:
+        if not thread.is_alive():
+            raise RuntimeError("binance stand-in failed to start")
+        time.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    try:
+        yield exchange, f"http://{host}:{port}", f"ws://{host}:{port}"
+    finally:
+        asyncio.run_coroutine_threadsafe(exchange.close(), loop).result(timeout=5)
+        server.should_exit = True
+        thread.join()
+        loop.close()
+
+
+def point_adapter(adapter, rest_base: str, ws_base: str) -> None:
+    adapter.spot_base_url = rest_base
+    adapter.perp_base_url = rest_base
+    adapter.spot_ws_base = f"{ws_base}/ws"
+    adapter.perp_ws_base = f"{ws_base}/ws"
+    adapter.ws_api_urls = {"spot": f"{ws_base}/ws-api/v3", "perp": f"{ws_base}/ws-fapi/v1"}
+
+
+def add_config_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Server-side delay added to every request.")
+    parser.add_argument("--latency-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--event-latency-ms", type=float, default=0.0, help="Delay before a fill reaches the user-data stream.")
+    parser.add_argument("--partial-fill-rate", type=float, default=0.0, help="Share of orders filled in several slices.")
+    parser.add_argument("--fill-steps", type=int, default=3)
+    parser.add_argument("--fill-interval-ms", type=float, default=5.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of orders answered with 503.")
+    parser.add_argument("--reject-rate", type=float, default=0.0, help="Share of orders rejected with -2010.")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Share of orders answered with 429.")
+    parser.add_argument("--listen-key-ttl-sec", type=float, default=0.0, help="Send listenKeyExpired after this long.")
+    parser.add_argument("--clock-offset-ms", type=float, default=0.0, help="Server clock offset from the host clock.")
+    parser.add_argument("--seed", type=int, default=None)
+
+
+def config_from_args(args: argparse.Namespace) -> BinanceStandInConfig:
+    return BinanceStandInConfig(
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        event_latency_ms=args.event_latency_ms,
+        partial_fill_rate=args.partial_fill_rate,
+        fill_steps=args.fill_steps,
+        fill_interval_ms=args.fill_interval_ms,
+        error_rate=args.error_rate,
+        reject_rate=args.reject_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        listen_key_ttl_sec=args.listen_key_ttl_sec,
+        clock_offset_ms=args.clock_offset_ms,
+        seed=args.seed,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local Binance REST, WebSocket API and user-data stream stand-in.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    add_config_args(parser)
+    args = parser.parse_args()
+    uvicorn.run(build_app(config_from_args(args)), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
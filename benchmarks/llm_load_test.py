@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import random
+import time
+from dataclasses import asdict, dataclass, field
+
+from apps.llm_signal_service import NEGATIVE_KEYWORDS, POSITIVE_KEYWORDS, LLMProvider, LLMSignalService
+from common_types import AppSettings, Streams
+from common_types.bus import InMemoryEventBus
+
+from benchmarks.llm_mock_server import add_config_args, config_from_args, serve_in_background
+
+SYMBOLS = ["BTCUSDT", "ETHUSDT", "BNBUSDT", "SOLUSDT", "XRPUSDT", "ADAUSDT", "DOGEUSDT", "LINKUSDT"]
+
+
+@dataclass
+class LoadReport:
+    target_qps: float
+    duration_sec: float
+    batch_size: int = 1
+    sent: int = 0
+    batches: int = 0
+    completed: int = 0
+    failed: int = 0
+    signals: int = 0
+    fallback_signals: int = 0
+    throughput_qps: float = 0.0
+    p50_ms: float = 0.0
+    p99_ms: float = 0.0
+    max_ms: float = 0.0
+    first_signal_p50_ms: float = 0.0
+    first_signal_p99_ms: float = 0.0
+    fallback_rate: float = 0.0
+    latencies_ms: list[float] = field(default_factory=list, repr=False)
+    first_signal_ms: list[float] = field(default_factory=list, repr=False)
+
+
+class FirstSignalBus(InMemoryEventBus):
+    def __init__(self):
+        super().__init__()
+        self.first_signal_at: dict[str, float] = {}
+
+    async def publish(self, stream: str, payload: dict) -> str:
+        if stream == Streams.SIGNAL_RAW:
+            self.first_signal_at.setdefault(str(payload.get("event_id", "")), asyncio.get_running_loop().time())
+        return await super().publish(stream, payload)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def synthetic_entity_events(count: int, seed: int = 7, max_symbols: int = 2) -> list[dict]:
+    rng = random.Random(seed)
+    keywords = sorted(POSITIVE_KEYWORDS | NEGATIVE_KEYWORDS)
+    events = []
+    for idx in range(count):
+        symbols = rng.sample(SYMBOLS, rng.randint(1, max_symbols))
+        words = rng.sample(keywords, 2)
+        events.append(
+            {
+                "event_id": f"load-{idx}",
+                "symbols": symbols,
+                "tags": [],
+                "regions": [],
+                "relevance_score": 0.7,
+                "title": f"{symbols[0][:-4]} {words[0]} after {words[1]} reports",
+                "content": f"Market participants react to {words[0]} and {words[1]} news. " * 8,
+            }
+        )
+    return events
+
+
+async def run_load(
+    service: LLMSignalService,
+    payloads: list[dict],
+    qps: float,
+    duration_sec: float,
+    batch_size: int = 1,
+    batch_wait_ms: float = 200.0,
+) -> LoadReport:
+    report = LoadReport(target_qps=qps, duration_sec=duration_sec, batch_size=max(1, batch_size))
+    loop = asyncio.get_running_loop()
+    total = max(1, int(qps * duration_sec))
+    interval = 1.0 / qps
+
+    async def many(batch: list[tuple[dict, float]]) -> None:
+        # Latency runs from each event's arrival, so time spent waiting for the batch to fill counts too.
+        try:
+            if report.batch_size == 1:
+                outputs = await service.handle(batch[0][0])
+            else:
+                outputs = await service.handle_batch([payload for payload, _ in batch])
+        except Exception:
+            report.failed += len(batch)
+            return
+        finished = loop.time()
+        report.batches += 1
+        for payload, arrived in batch:
+            report.latencies_ms.append((finished - arrived) * 1000)
+            report.completed += 1
+            published_at = finished
+            if isinstance(service.bus, FirstSignalBus):
+                published_at = service.bus.first_signal_at.get(payload["event_id"], finished)
+            report.first_signal_ms.append((published_at - arrived) * 1000)
+        for stream, signal in outputs:
+            # Streaming mode also emits rationale records; only signals count.
+            if stream != Streams.SIGNAL_RAW:
+                continue
+            report.signals += 1
+            if str(signal.get("rationale", "")).startswith("heuristic"):
+                report.fallback_signals += 1
+
+    tasks = []
+    pending: list[tuple[dict, float]] = []
+
+    def flush() -> None:
+        if pending:
+            tasks.append(asyncio.create_task(many(list(pending))))
+            pending.clear()
+
+    # Open-loop arrivals: requests are scheduled on the clock regardless of how slow responses are.
+    start = loop.time()
+    for idx in range(total):
+        due = start + idx * interval
+        if pending and pending[0][1] + batch_wait_ms / 1000 < due:
+            # The batch would wait longer than the worker allows; send what has arrived, as the worker does.
+            await asyncio.sleep(max(0.0, pending[0][1] + batch_wait_ms / 1000 - loop.time()))
+            flush()
+        delay = due - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        pending.append((payloads[idx % len(payloads)], loop.time()))
+        report.sent += 1
+        if len(pending) >= report.batch_size:
+            flush()
+    flush()
+    await asyncio.gather(*tasks)
+    elapsed = loop.time() - start
+
+    report.throughput_qps = report.completed / elapsed if elapsed > 0 else 0.0
+    report.p50_ms = percentile(report.latencies_ms, 50)
+    report.p99_ms = percentile(report.latencies_ms, 99)
+    report.max_ms = max(report.latencies_ms, default=0.0)
+    report.first_signal_p50_ms = percentile(report.first_signal_ms, 50)
+    report.first_signal_p99_ms = percentile(report.first_signal_ms, 99)
+    report.fallback_rate = report.fallback_signals / report.signals if report.signals else 0.0
+    return report
+
+
+async def _main(args: argparse.Namespace) -> LoadReport:
+    payloads = synthetic_entity_events(max(1, int(args.qps * args.duration)), seed=args.seed or 7)
+
+    async def drive(base_url: str) -> LoadReport:
+        settings = AppSettings(
+            bus_backend="memory",
+            openai_api_key=args.api_key,
+            openai_base_url=base_url,
+            openai_model=args.model,
+            llm_streaming=args.streaming,
+            llm_batch_max_events=args.batch,
+            llm_batch_max_wait_ms=args.batch_wait_ms,
+        )
+        service = LLMSignalService(settings, LLMProvider(settings), bus=FirstSignalBus())
+        return await run_load(service, payloads, args.qps, args.duration, args.batch, args.batch_wait_ms)
+
+    if args.base_url:
+        return await drive(args.base_url)
+    async with serve_in_background(config_from_args(args), port=args.port) as base_url:
+        return await drive(base_url)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Drive LLMSignalService.handle (or handle_batch) at a target QPS.")
+    parser.add_argument("--qps", type=float, default=20.0)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--base-url", default="", help="Use an existing endpoint instead of the embedded mock server.")
+    parser.add_argument("--api-key", default="mock-key")
+    parser.add_argument("--model", default="qwen-plus")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--streaming", action="store_true", help="Enable LLM_STREAMING early signal extraction.")
+    parser.add_argument("--batch", type=int, default=1, help="Events per handle_batch call, as LLM_BATCH_MAX_EVENTS.")
+    parser.add_argument("--batch-wait-ms", type=int, default=200, help="Longest wait to fill a batch, as LLM_BATCH_MAX_WAIT_MS.")
+    parser.add_argument("--verbose", action="store_true", help="Keep per-request fallback tracebacks in the output.")
+    add_config_args(parser)
+    args = parser.parse_args()
+    if args.streaming and args.batch > 1:
+        parser.error("--streaming only applies to handle; batch mode does not stream")
+    if not args.verbose:
+        logging.getLogger("apps.llm_signal_service").setLevel(logging.CRITICAL)
+
+    started = time.perf_counter()
+    report = asyncio.run(_main(args))
+    summary = {key: value for key, value in asdict(report).items() if key not in {"latencies_ms", "first_signal_ms"}}
+    summary["wall_sec"] = round(time.perf_counter() - started, 3)
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
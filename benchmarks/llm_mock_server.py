@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import random
+import re
+import time
+from dataclasses import dataclass
+from uuid import uuid4
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+
+EVENT_ID_RE = re.compile(r"^event_id: (?P<event_id>.+)$", re.MULTILINE)
+SYMBOLS_RE = re.compile(r"^Symbols?: (?P<symbols>.+)$", re.MULTILINE)
+_RATIONALE_WORDS = (
+    "headline flows liquidity funding basis momentum exchange regulator adoption outflow sentiment "
+    "volatility catalyst spot perp open-interest reaction desk macro"
+).split()
+
+
+@dataclass
+class MockLLMConfig:
+    latency_dist: str = "lognormal"
+    latency_ms: float = 400.0
+    latency_jitter: float = 0.35
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    malformed_rate: float = 0.0
+    token_latency_ms: float = 0.0
+    chars_per_token: int = 4
+    seed: int | None = None
+
+
+class MockLLMBackend:
+    def __init__(self, config: MockLLMConfig):
+        self.config = config
+        self._rng = random.Random(config.seed)
+        self.requests = 0
+
+    def sample_latency_sec(self) -> float:
+        cfg = self.config
+        if cfg.latency_dist == "constant":
+            latency_ms = cfg.latency_ms
+        elif cfg.latency_dist == "uniform":
+            spread = cfg.latency_ms * cfg.latency_jitter
+            latency_ms = self._rng.uniform(cfg.latency_ms - spread, cfg.latency_ms + spread)
+        elif cfg.latency_dist == "exponential":
+            latency_ms = self._rng.expovariate(1.0 / max(cfg.latency_ms, 1e-9))
+        else:
+            # lognormal with median latency_ms and sigma latency_jitter
+            latency_ms = self._rng.lognormvariate(0.0, cfg.latency_jitter) * cfg.latency_ms
+        return max(0.0, latency_ms) / 1000
+
+    def pick_outcome(self) -> str:
+        roll = self._rng.random()
+        if roll < self.config.error_rate:
+            return "error"
+        roll -= self.config.error_rate
+        if roll < self.config.rate_limit_rate:
+            return "rate_limited"
+        roll -= self.config.rate_limit_rate
+        if roll < self.config.malformed_rate:
+            return "malformed"
+        return "ok"
+
+    def _signal(self) -> dict:
+        side = self._rng.choice([-1, 0, 1])
+        return {
+            "side": side,
+            "strength": round(self._rng.uniform(0.3, 0.9), 3),
+            "confidence": round(self._rng.uniform(0.5, 0.95), 3),
+            "horizon_min": self._rng.choice([30, 60, 120, 180]),
+            "rationale": f"mock analysis side={side}; " + " ".join(self._rng.sample(_RATIONALE_WORDS, 12)),
+        }
+
+    def completion_text(self, prompt: str) -> str:
+        if "JSON array" not in prompt:
+            return json.dumps(self._signal())
+
+        items = []
+        blocks = prompt.split("\n\n")
+        for block in blocks:
+            event_match = EVENT_ID_RE.search(block)
+            symbols_match = SYMBOLS_RE.search(block)
+            if event_match is None or symbols_match is None:
+                continue
+            for symbol in symbols_match.group("symbols").split(","):
+                items.append({"event_id": event_match.group("event_id"), "symbol": symbol.strip(), **self._signal()})
+        return json.dumps(items)
+
+    def malformed_text(self) -> str:
+        return self._rng.choice(
+            [
+                "Sure! The outlook is bullish, side=1 confidence high.",
+                '{"side": 1, "strength": 0.7, "confidence": ',
+                "```json\n{side: 1, strength: .7}\n```",
+            ]
+        )
+
+
+def _completion_body(model: str, text: str) -> dict:
+    return {
+        "id": f"chatcmpl-{uuid4().hex[:24]}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": text},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+    }
+
+
+def _chunk_body(completion_id: str, model: str, content: str | None, finish_reason: str | None) -> dict:
+    delta = {"content": content} if content is not None else {}
+    return {
+        "id": completion_id,
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+
+
+def _token_pieces(text: str, chars_per_token: int) -> list[str]:
+    size = max(1, chars_per_token)
+    return [text[idx : idx + size] for idx in range(0, len(text), size)]
+
+
+def build_app(config: MockLLMConfig) -> FastAPI:
+    backend = MockLLMBackend(config)
+    app = FastAPI(title="mock openai-compatible llm")
+    app.state.backend = backend
+
+    async def chat_completions(request: Request):
+        body = await request.json()
+        backend.requests += 1
+        await asyncio.sleep(backend.sample_latency_sec())
+
+        outcome = backend.pick_outcome()
+        if outcome == "error":
+            return JSONResponse(
+                status_code=500,
+                content={"error": {"message": "mock upstream error", "type": "server_error"}},
+            )
+        if outcome == "rate_limited":
+            return JSONResponse(
+                status_code=429,
+                headers={"retry-after": "1"},
+                content={"error": {"message": "mock rate limit", "type": "rate_limit_exceeded"}},
+            )
+
+        messages = body.get("messages") or []
+        prompt = str(messages[-1].get("content", "")) if messages else ""
+        text = backend.malformed_text() if outcome == "malformed" else backend.completion_text(prompt)
+        model = str(body.get("model", "mock"))
+        pieces = _token_pieces(text, config.chars_per_token)
+        token_delay = config.token_latency_ms / 1000
+
+        if not body.get("stream"):
+            await asyncio.sleep(token_delay * len(pieces))
+            return _completion_body(model, text)
+
+        async def events():
+            completion_id = f"chatcmpl-{uuid4().hex[:24]}"
+            for piece in pieces:
+                yield f"data: {json.dumps(_chunk_body(completion_id, model, piece, None))}\n\n"
+                await asyncio.sleep(token_delay)
+            yield f"data: {json.dumps(_chunk_body(completion_id, model, None, 'stop'))}\n\n"
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    app.add_api_route("/v1/chat/completions", chat_completions, methods=["POST"])
+    app.add_api_route("/chat/completions", chat_completions, methods=["POST"])
+
+    @app.get("/health")
+    async def health() -> PlainTextResponse:
+        return PlainTextResponse("ok")
+
+    return app
+
+
+@contextlib.asynccontextmanager
+async def serve_in_background(config: MockLLMConfig, host: str = "127.0.0.1", port: int = 8089):
+    server = uvicorn.Server(uvicorn.Config(build_app(config), host=host, port=port, log_level="warning"))
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        if task.done():
+            task.result()
+        await asyncio.sleep(0.01)
+    try:
+        yield f"http://{host}:{port}/v1"
+    finally:
+        server.should_exit = True
+        await task
+
+
+def add_config_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--latency-dist", default="lognormal", choices=["constant", "uniform", "exponential", "lognormal"])
+    parser.add_argument("--latency-ms", type=float, default=400.0)
+    parser.add_argument("--latency-jitter", type=float, default=0.35)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--malformed-rate", type=float, default=0.0)
+    parser.add_argument("--token-latency-ms", type=float, default=0.0, help="Generation delay per emitted token.")
+    parser.add_argument("--seed", type=int, default=None)
+
+
+def config_from_args(args: argparse.Namespace) -> MockLLMConfig:
+    return MockLLMConfig(
+        latency_dist=args.latency_dist,
+        latency_ms=args.latency_ms,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        malformed_rate=args.malformed_rate,
+        token_latency_ms=args.token_latency_ms,
+        seed=args.seed,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible chat-completions mock server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    add_config_args(parser)
+    args = parser.parse_args()
+    uvicorn.run(build_app(config_from_args(args)), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
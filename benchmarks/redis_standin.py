@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import asyncio
+import fnmatch
+import time
+from collections.abc import Callable
+
+try:
+    import lupa
+except ModuleNotFoundError:  # pragma: no cover
+    lupa = None
+
+
+class _Pipeline:
+    def __init__(self, client: "RedisStandIn"):
+        self._client = client
+        self._commands: list[tuple[str, tuple, dict]] = []
+
+    def __getattr__(self, name: str):
+        if name.startswith("_") or not hasattr(self._client, f"_cmd_{name}"):
+            raise AttributeError(name)
+
+        def _queue(*args, **kwargs):
+            self._commands.append((name, args, kwargs))
+            return self
+
+        return _queue
+
+    async def execute(self) -> list:
+        await self._client._round_trip()
+        return [getattr(self._client, f"_cmd_{name}")(*args, **kwargs) for name, args, kwargs in self._commands]
+
+
+class _Script:
+    def __init__(self, client: "RedisStandIn", source: str):
+        self._client = client
+        self._source = source
+
+    async def __call__(self, keys: list[str] | None = None, args: list | None = None):
+        await self._client._round_trip()
+        return self._client._eval(self._source, keys or [], args or [])
+
+
+def _to_redis(value) -> str:
+    # Redis formats numeric script arguments the way Lua prints them: integers without a fraction.
+    if isinstance(value, float):
+        return str(int(value)) if value.is_integer() else format(value, ".17g")
+    return str(value)
+
+
+# In-process subset of redis.asyncio.Redis; every command or pipeline execute costs one simulated round trip.
+class RedisStandIn:
+    def __init__(self, rtt_ms: float = 0.0, clock: Callable[[], float] = time.monotonic):
+        self.rtt_ms = rtt_ms
+        self.round_trips = 0
+        self._clock = clock
+        self._data: dict[str, str] = {}
+        self._hashes: dict[str, dict[str, str]] = {}
+        self._expiry: dict[str, float] = {}
+        self._lua = None
+
+    async def _round_trip(self) -> None:
+        self.round_trips += 1
+        if self.rtt_ms > 0:
+            await asyncio.sleep(self.rtt_ms / 1000)
+        else:
+            await asyncio.sleep(0)
+
+    def _live(self, key: str) -> bool:
+        expiry = self._expiry.get(key)
+        if expiry is not None and expiry <= self._clock():
+            self._data.pop(key, None)
+            self._hashes.pop(key, None)
+            self._expiry.pop(key, None)
+        return key in self._data or key in self._hashes
+
+    def _cmd_get(self, key: str) -> str | None:
+        return self._data.get(key) if self._live(key) else None
+
+    def _cmd_set(self, key: str, value, ex: int | None = None, nx: bool = False) -> bool | None:
+        if nx and self._live(key):
+            return None
+        self._data[key] = str(value)
+        if ex is not None:
+            self._expiry[key] = self._clock() + ex
+        else:
+            self._expiry.pop(key, None)
+        return True
+
+    def _cmd_mget(self, keys: list[str]) -> list[str | None]:
+        return [self._cmd_get(key) for key in keys]
+
+    def _cmd_incrbyfloat(self, key: str, delta: float) -> float:
+        value = float(self._data.get(key, 0.0)) + float(delta)
+        self._data[key] = repr(value)
+        return value
+
+    def _cmd_delete(self, *keys: str) -> int:
+        deleted = 0
+        for key in keys:
+            if self._live(key):
+                self._data.pop(key, None)
+                self._hashes.pop(key, None)
+                self._expiry.pop(key, None)
+                deleted += 1
+        return deleted
+
+    def _cmd_hmget(self, key: str, *fields: str) -> list[str | None]:
+        values = self._hashes.get(key, {}) if self._live(key) else {}
+        return [values.get(field) for field in fields]
+
+    def _cmd_hgetall(self, key: str) -> dict[str, str]:
+        return dict(self._hashes.get(key, {})) if self._live(key) else {}
+
+    def _cmd_hset(self, key: str, *pairs, mapping: dict | None = None) -> int:
+        self._live(key)
+        values = self._hashes.setdefault(key, {})
+        items = list(zip(pairs[::2], pairs[1::2])) + list((mapping or {}).items())
+        added = sum(1 for field, _ in items if str(field) not in values)
+        for field, value in items:
+            values[str(field)] = _to_redis(value)
+        return added
+
+    def _cmd_expire(self, key: str, seconds) -> int:
+        if not self._live(key):
+            return 0
+        self._expiry[key] = self._clock() + float(seconds)
+        return 1
+
+    def _eval(self, source: str, keys: list[str], args: list):
+        if lupa is None:
+            raise RuntimeError("lupa package is required to run Lua scripts on the Redis stand-in")
+        if self._lua is None:
+            self._lua = lupa.LuaRuntime(unpack_returned_tuples=True)
+        lua = self._lua
+
+        def _call(name, *call_args):
+            result = getattr(self, f"_cmd_{str(name).lower()}")(*[_to_redis(arg) for arg in call_args])
+            if isinstance(result, list):
+                # Missing values come back as false, as in Redis, so the table has no holes.
+                return lua.table_from([False if item is None else item for item in result])
+            return result
+
+        lua.globals().redis = lua.table_from({"call": _call})
+        lua.globals().KEYS = lua.table_from([str(key) for key in keys])
+        lua.globals().ARGV = lua.table_from([_to_redis(arg) for arg in args])
+        return self._from_lua(lua.execute(source))
+
+    @staticmethod
+    def _from_lua(value):
+        if lupa.lua_type(value) == "table":
+            return [RedisStandIn._from_lua(item) for item in value.values()]
+        if isinstance(value, float):
+            # Lua numbers become integer replies.
+            return int(value)
+        return value
+
+    def register_script(self, source: str) -> _Script:
+        return _Script(self, source)
+
+    async def hmget(self, key: str, *fields: str) -> list[str | None]:
+        await self._round_trip()
+        return self._cmd_hmget(key, *fields)
+
+    async def hgetall(self, key: str) -> dict[str, str]:
+        await self._round_trip()
+        return self._cmd_hgetall(key)
+
+    async def get(self, key: str) -> str | None:
+        await self._round_trip()
+        return self._cmd_get(key)
+
+    async def set(self, key: str, value, ex: int | None = None, nx: bool = False) -> bool | None:
+        await self._round_trip()
+        return self._cmd_set(key, value, ex=ex, nx=nx)
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        await self._round_trip()
+        return self._cmd_mget(keys)
+
+    async def incrbyfloat(self, key: str, delta: float) -> float:
+        await self._round_trip()
+        return self._cmd_incrbyfloat(key, delta)
+
+    async def delete(self, *keys: str) -> int:
+        await self._round_trip()
+        return self._cmd_delete(*keys)
+
+    async def scan_iter(self, match: str = "*"):
+        await self._round_trip()
+        for key in [key for key in [*self._data, *self._hashes] if fnmatch.fnmatchcase(key, match)]:
+            yield key
+
+    def pipeline(self, transaction: bool = True) -> _Pipeline:
+        return _Pipeline(self)
+
+    async def aclose(self) -> None:
+        return None
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import random
+
+
+def synthetic_intents(count: int, symbols: int, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    names = [f"SYM{idx:04d}USDT" for idx in range(symbols)]
+    out = []
+    for idx in range(count):
+        side = rng.choice((-1, 1))
+        out.append(
+            {
+                "intent_id": f"bench-{idx}",
+                "event_id": f"event-{idx}",
+                "symbol": rng.choice(names),
+                "market": "spot" if side > 0 else "perp",
+                "side": side,
+                "qty_usd": rng.uniform(50, 800),
+                "max_slippage_bps": 20,
+                "reason": "bench",
+            }
+        )
+    return out
@@ -5,6 +5,7 @@ from .models import (
     NewsEvent,
     EntityEvent,
     SignalEvent,
+    SignalRationale,
     OrderIntent,
     RiskDecision,
     ExecutionReport,
@@ -22,6 +23,7 @@ __all__ = [
     "NewsEvent",
     "EntityEvent",
     "SignalEvent",
+    "SignalRationale",
     "OrderIntent",
     "RiskDecision",
     "ExecutionReport",
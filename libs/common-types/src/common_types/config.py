@@ -22,6 +22,9 @@ try:
         openai_api_key: str = ""
         openai_model: str = "qwen-plus"
         openai_base_url: str = "https://dashscope.aliyuncs.com/compatible-mode/v1"
+        llm_batch_max_events: int = 1
+        llm_batch_max_wait_ms: int = 200
+        llm_streaming: bool = False
 
         telegram_bot_token: str = ""
         telegram_chat_id: str = ""
@@ -30,6 +33,12 @@ try:
         binance_api_secret: str = ""
         binance_use_testnet: bool = True
         binance_recv_window_ms: int = 5000
+        market_data_max_age_sec: float = 3.0
+        binance_rules_refresh_sec: float = 3600.0
+        binance_order_transport: str = "rest"
+        binance_http2: bool = True
+        binance_warm_connections: int = 2
+        binance_clock_sync_sec: float = 30.0
 
         account_equity_usd: float = 100000.0
         risk_per_trade_pct: float = 0.005
@@ -40,17 +49,46 @@ try:
         max_long_exposure_pct: float = 0.12
         max_short_exposure_pct: float = 0.12
         max_daily_drawdown_pct: float = 0.02
+        risk_batch_max_intents: int = 1
+        risk_batch_max_wait_ms: int = 20
         min_signal_confidence: float = 0.65
         default_event_ttl_sec: int = 3600
         max_slippage_bps: int = 20
+        portfolio_batch_max_signals: int = 1
+        portfolio_batch_max_wait_ms: int = 500
+        portfolio_batch_risk_budget_pct: float = 0.02
+        fusion_half_life_sec: float = 1800.0
+        fusion_buffer_size: int = 32
+        fusion_conflict_margin: float = 0.2
+        fusion_evict_epsilon: float = 0.001
+        fusion_replica_id: str = ""
+        fusion_replicas: str = ""
 
         execution_mode: str = "paper"
+        paper_latency_ms: float = 0.0
+        paper_fee_bps: float = 4.0
+        paper_level_depth_usd: float = 250000.0
+        paper_volatility_bps: float = 1.0
+        execution_dedup_ttl_sec: int = 86400
+        execution_dedup_max_items: int = 100000
+        execution_batch_max_intents: int = 1
+        execution_batch_max_wait_ms: int = 20
+        execution_max_concurrency: int = 1
+        execution_max_pending: int = 1000
         universe_symbols: str = Field(default="BTCUSDT,ETHUSDT")
+        universe_refresh_interval_sec: int = 300
 
         service_poll_ms: int = 1500
         service_idle_sleep_sec: float = 0.2
         position_sync_interval_sec: int = 30
         position_sync_drift_alert_pct: float = 0.02
+        position_sync_events: bool = True
+        position_sync_audit_interval_sec: int = 300
+        pnl_mark_source: str = "auto"
+        pnl_snapshot_interval_sec: float = 1.0
+        pnl_snapshot_drawdown_step: float = 0.001
+        pnl_batch_max_reports: int = 1
+        pnl_batch_max_wait_ms: int = 20
 
         @cached_property
         def universe(self) -> set[str]:
@@ -73,6 +111,11 @@ except ModuleNotFoundError:
         openai_base_url: str = Field(
             default_factory=lambda: os.getenv("OPENAI_BASE_URL", "https://dashscope.aliyuncs.com/compatible-mode/v1")
         )
+        llm_batch_max_events: int = Field(default_factory=lambda: int(os.getenv("LLM_BATCH_MAX_EVENTS", "1")))
+        llm_batch_max_wait_ms: int = Field(default_factory=lambda: int(os.getenv("LLM_BATCH_MAX_WAIT_MS", "200")))
+        llm_streaming: bool = Field(
+            default_factory=lambda: os.getenv("LLM_STREAMING", "false").strip().lower() in {"1", "true", "yes", "on"}
+        )
 
         telegram_bot_token: str = Field(default_factory=lambda: os.getenv("TELEGRAM_BOT_TOKEN", ""))
         telegram_chat_id: str = Field(default_factory=lambda: os.getenv("TELEGRAM_CHAT_ID", ""))
@@ -83,6 +126,14 @@ except ModuleNotFoundError:
             default_factory=lambda: os.getenv("BINANCE_USE_TESTNET", "true").strip().lower() in {"1", "true", "yes", "on"}
         )
         binance_recv_window_ms: int = Field(default_factory=lambda: int(os.getenv("BINANCE_RECV_WINDOW_MS", "5000")))
+        market_data_max_age_sec: float = Field(default_factory=lambda: float(os.getenv("MARKET_DATA_MAX_AGE_SEC", "3.0")))
+        binance_rules_refresh_sec: float = Field(default_factory=lambda: float(os.getenv("BINANCE_RULES_REFRESH_SEC", "3600.0")))
+        binance_order_transport: str = Field(default_factory=lambda: os.getenv("BINANCE_ORDER_TRANSPORT", "rest"))
+        binance_http2: bool = Field(
+            default_factory=lambda: os.getenv("BINANCE_HTTP2", "true").strip().lower() in {"1", "true", "yes", "on"}
+        )
+        binance_warm_connections: int = Field(default_factory=lambda: int(os.getenv("BINANCE_WARM_CONNECTIONS", "2")))
+        binance_clock_sync_sec: float = Field(default_factory=lambda: float(os.getenv("BINANCE_CLOCK_SYNC_SEC", "30.0")))
 
         account_equity_usd: float = Field(default_factory=lambda: float(os.getenv("ACCOUNT_EQUITY_USD", "100000")))
         risk_per_trade_pct: float = Field(default_factory=lambda: float(os.getenv("RISK_PER_TRADE_PCT", "0.005")))
@@ -93,12 +144,34 @@ except ModuleNotFoundError:
         max_long_exposure_pct: float = Field(default_factory=lambda: float(os.getenv("MAX_LONG_EXPOSURE_PCT", "0.12")))
         max_short_exposure_pct: float = Field(default_factory=lambda: float(os.getenv("MAX_SHORT_EXPOSURE_PCT", "0.12")))
         max_daily_drawdown_pct: float = Field(default_factory=lambda: float(os.getenv("MAX_DAILY_DRAWDOWN_PCT", "0.02")))
+        risk_batch_max_intents: int = Field(default_factory=lambda: int(os.getenv("RISK_BATCH_MAX_INTENTS", "1")))
+        risk_batch_max_wait_ms: int = Field(default_factory=lambda: int(os.getenv("RISK_BATCH_MAX_WAIT_MS", "20")))
         min_signal_confidence: float = Field(default_factory=lambda: float(os.getenv("MIN_SIGNAL_CONFIDENCE", "0.65")))
         default_event_ttl_sec: int = Field(default_factory=lambda: int(os.getenv("DEFAULT_EVENT_TTL_SEC", "3600")))
         max_slippage_bps: int = Field(default_factory=lambda: int(os.getenv("MAX_SLIPPAGE_BPS", "20")))
+        portfolio_batch_max_signals: int = Field(default_factory=lambda: int(os.getenv("PORTFOLIO_BATCH_MAX_SIGNALS", "1")))
+        portfolio_batch_max_wait_ms: int = Field(default_factory=lambda: int(os.getenv("PORTFOLIO_BATCH_MAX_WAIT_MS", "500")))
+        portfolio_batch_risk_budget_pct: float = Field(default_factory=lambda: float(os.getenv("PORTFOLIO_BATCH_RISK_BUDGET_PCT", "0.02")))
+        fusion_half_life_sec: float = Field(default_factory=lambda: float(os.getenv("FUSION_HALF_LIFE_SEC", "1800.0")))
+        fusion_buffer_size: int = Field(default_factory=lambda: int(os.getenv("FUSION_BUFFER_SIZE", "32")))
+        fusion_conflict_margin: float = Field(default_factory=lambda: float(os.getenv("FUSION_CONFLICT_MARGIN", "0.2")))
+        fusion_evict_epsilon: float = Field(default_factory=lambda: float(os.getenv("FUSION_EVICT_EPSILON", "0.001")))
+        fusion_replica_id: str = Field(default_factory=lambda: os.getenv("FUSION_REPLICA_ID", ""))
+        fusion_replicas: str = Field(default_factory=lambda: os.getenv("FUSION_REPLICAS", ""))
 
         execution_mode: str = Field(default_factory=lambda: os.getenv("EXECUTION_MODE", "paper"))
+        paper_latency_ms: float = Field(default_factory=lambda: float(os.getenv("PAPER_LATENCY_MS", "0.0")))
+        paper_fee_bps: float = Field(default_factory=lambda: float(os.getenv("PAPER_FEE_BPS", "4.0")))
+        paper_level_depth_usd: float = Field(default_factory=lambda: float(os.getenv("PAPER_LEVEL_DEPTH_USD", "250000.0")))
+        paper_volatility_bps: float = Field(default_factory=lambda: float(os.getenv("PAPER_VOLATILITY_BPS", "1.0")))
+        execution_dedup_ttl_sec: int = Field(default_factory=lambda: int(os.getenv("EXECUTION_DEDUP_TTL_SEC", "86400")))
+        execution_dedup_max_items: int = Field(default_factory=lambda: int(os.getenv("EXECUTION_DEDUP_MAX_ITEMS", "100000")))
+        execution_batch_max_intents: int = Field(default_factory=lambda: int(os.getenv("EXECUTION_BATCH_MAX_INTENTS", "1")))
+        execution_batch_max_wait_ms: int = Field(default_factory=lambda: int(os.getenv("EXECUTION_BATCH_MAX_WAIT_MS", "20")))
+        execution_max_concurrency: int = Field(default_factory=lambda: int(os.getenv("EXECUTION_MAX_CONCURRENCY", "1")))
+        execution_max_pending: int = Field(default_factory=lambda: int(os.getenv("EXECUTION_MAX_PENDING", "1000")))
         universe_symbols: str = Field(default_factory=lambda: os.getenv("UNIVERSE_SYMBOLS", "BTCUSDT,ETHUSDT"))
+        universe_refresh_interval_sec: int = Field(default_factory=lambda: int(os.getenv("UNIVERSE_REFRESH_INTERVAL_SEC", "300")))
 
         service_poll_ms: int = Field(default_factory=lambda: int(os.getenv("SERVICE_POLL_MS", "1500")))
         service_idle_sleep_sec: float = Field(default_factory=lambda: float(os.getenv("SERVICE_IDLE_SLEEP_SEC", "0.2")))
@@ -106,6 +179,15 @@ except ModuleNotFoundError:
         position_sync_drift_alert_pct: float = Field(
             default_factory=lambda: float(os.getenv("POSITION_SYNC_DRIFT_ALERT_PCT", "0.02"))
         )
+        position_sync_events: bool = Field(
+            default_factory=lambda: os.getenv("POSITION_SYNC_EVENTS", "true").strip().lower() in {"1", "true", "yes", "on"}
+        )
+        position_sync_audit_interval_sec: int = Field(default_factory=lambda: int(os.getenv("POSITION_SYNC_AUDIT_INTERVAL_SEC", "300")))
+        pnl_mark_source: str = Field(default_factory=lambda: os.getenv("PNL_MARK_SOURCE", "auto"))
+        pnl_snapshot_interval_sec: float = Field(default_factory=lambda: float(os.getenv("PNL_SNAPSHOT_INTERVAL_SEC", "1.0")))
+        pnl_snapshot_drawdown_step: float = Field(default_factory=lambda: float(os.getenv("PNL_SNAPSHOT_DRAWDOWN_STEP", "0.001")))
+        pnl_batch_max_reports: int = Field(default_factory=lambda: int(os.getenv("PNL_BATCH_MAX_REPORTS", "1")))
+        pnl_batch_max_wait_ms: int = Field(default_factory=lambda: int(os.getenv("PNL_BATCH_MAX_WAIT_MS", "20")))
 
         @cached_property
         def universe(self) -> set[str]:
@@ -43,6 +43,15 @@ class SignalEvent(BaseEvent):
     generated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
+class SignalRationale(BaseEvent):
+    event_id: str
+    symbol: str
+    rationale: str
+    signal_generated_at: datetime
+    horizon_min: int | None = None
+    generated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
 class OrderIntent(BaseEvent):
     intent_id: str
     event_id: str
@@ -93,6 +102,7 @@ STREAM_MODEL_MAP = {
     "news.raw": NewsEvent,
     "news.entity": EntityEvent,
     "signal.raw": SignalEvent,
+    "signal.rationale": SignalRationale,
     "signal.tradeable": SignalEvent,
     "signal.universe": SignalEvent,
     "order.intent": OrderIntent,
@@ -2,6 +2,7 @@ class Streams:
     NEWS_RAW = "news.raw"
     NEWS_ENTITY = "news.entity"
     SIGNAL_RAW = "signal.raw"
+    SIGNAL_RATIONALE = "signal.rationale"
     SIGNAL_TRADEABLE = "signal.tradeable"
     SIGNAL_UNIVERSE = "signal.universe"
     ORDER_INTENT = "order.intent"
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from pydantic import BaseModel, Field
+
+
+class MarketRules(BaseModel):
+    status: str = "TRADING"
+    min_qty: float = 0.0
+    max_qty: float = 0.0
+    step_size: float = 0.0
+    tick_size: float = 0.0
+    min_notional: float = 0.0
+    quote_precision: int = 8
+
+    @property
+    def trading(self) -> bool:
+        return self.status.upper() == "TRADING"
+
+
+class UniverseEntry(BaseModel):
+    symbol: str
+    spot: MarketRules | None = None
+    perp: MarketRules | None = None
+
+    def rules(self, market: str) -> MarketRules | None:
+        return self.spot if market == "spot" else self.perp
+
+    @property
+    def tradable(self) -> bool:
+        return any(rules is not None and rules.trading for rules in (self.spot, self.perp))
+
+
+class UniverseSnapshot(BaseModel):
+    version: int = 0
+    source: str = "static"
+    generated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    symbols: dict[str, UniverseEntry] = Field(default_factory=dict)
+
+    @classmethod
+    def from_symbols(cls, symbols: set[str], version: int = 0) -> "UniverseSnapshot":
+        entries = {s: UniverseEntry(symbol=s, spot=MarketRules(), perp=MarketRules()) for s in sorted(symbols)}
+        return cls(version=version, source="static", symbols=entries)
+
+    def entry(self, symbol: str) -> UniverseEntry | None:
+        return self.symbols.get(symbol.upper())
+
+    def is_tradable(self, symbol: str, market: str | None = None) -> bool:
+        entry = self.symbols.get(symbol.upper())
+        if entry is None:
+            return False
+        if market is None:
+            return entry.tradable
+        rules = entry.rules(market)
+        return rules is not None and rules.trading
+
+    def same_content(self, other: "UniverseSnapshot | None") -> bool:
+        return other is not None and other.source == self.source and other.symbols == self.symbols
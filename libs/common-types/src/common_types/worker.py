@@ -38,3 +38,73 @@ async def run_stream_worker(
                 last_id = record.id
             except Exception:
                 logger.exception("%s failed to process record id=%s", service_name, record.id)
+
+
+BatchHandler = Callable[[list[dict]], Awaitable[list[tuple[str, dict]]]]
+
+
+async def run_batch_stream_worker(
+    *,
+    service_name: str,
+    bus: EventBus,
+    input_stream: str,
+    handler: BatchHandler,
+    max_batch: int = 8,
+    max_wait_ms: int = 200,
+    poll_ms: int = 1000,
+    idle_sleep_sec: float = 0.2,
+    start_id: str = "0-0",
+) -> None:
+    loop = asyncio.get_running_loop()
+    last_id = start_id
+    logger.info(
+        "%s started. input_stream=%s max_batch=%s max_wait_ms=%s", service_name, input_stream, max_batch, max_wait_ms
+    )
+    while True:
+        records = await bus.read(input_stream, last_id=last_id, block_ms=poll_ms, count=max_batch)
+        if not records:
+            await asyncio.sleep(idle_sleep_sec)
+            continue
+
+        # Wait at most max_wait_ms after the first record to fill the batch.
+        deadline = loop.time() + max_wait_ms / 1000
+        while len(records) < max_batch:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            more = await bus.read(
+                input_stream,
+                last_id=records[-1].id,
+                block_ms=max(1, int(remaining * 1000)),
+                count=max_batch - len(records),
+            )
+            if not more:
+                # In-memory buses return immediately; avoid spinning until the deadline.
+                await asyncio.sleep(min(remaining, idle_sleep_sec))
+                continue
+            records.extend(more)
+
+        try:
+            outputs = await handler([record.data for record in records])
+        except Exception:
+            logger.exception(
+                "%s failed to process batch ids=%s..%s; retrying one record at a time",
+                service_name,
+                records[0].id,
+                records[-1].id,
+            )
+            await asyncio.sleep(idle_sleep_sec)
+            # Only the records that fail on their own are skipped, like run_stream_worker does.
+            outputs = []
+            for record in records:
+                try:
+                    outputs.extend(await handler([record.data]))
+                except Exception:
+                    logger.exception("%s failed to process record id=%s", service_name, record.id)
+        try:
+            for out_stream, payload in outputs:
+                await bus.publish(out_stream, payload)
+            last_id = records[-1].id
+        except Exception:
+            logger.exception("%s failed to publish batch ids=%s..%s", service_name, records[0].id, records[-1].id)
+            await asyncio.sleep(idle_sleep_sec)
@@ -1,5 +1,19 @@
 from .base import ExchangeAdapter
 from .factory import build_exchange_adapter
+from .market_data import BinanceMarketDataFeed, MarketDataCache
+from .rate_limit import BinanceRateLimiter, RateLimitExceeded
 from .simulated import SimulatedExchangeAdapter
+from .ws_api import BinanceWsApiClient, BinanceWsApiError, WsApiUnavailable
 
-__all__ = ["ExchangeAdapter", "build_exchange_adapter", "SimulatedExchangeAdapter"]
+__all__ = [
+    "ExchangeAdapter",
+    "build_exchange_adapter",
+    "SimulatedExchangeAdapter",
+    "MarketDataCache",
+    "BinanceMarketDataFeed",
+    "BinanceRateLimiter",
+    "RateLimitExceeded",
+    "BinanceWsApiClient",
+    "BinanceWsApiError",
+    "WsApiUnavailable",
+]
@@ -10,6 +10,16 @@ class ExchangeAdapter(ABC):
     async def place_order(self, intent: OrderIntent) -> ExecutionReport:
         raise NotImplementedError
 
+    async def place_orders(self, intents: list[OrderIntent]) -> list[ExecutionReport | Exception]:
+        # Results line up with intents; a failed order does not stop the ones after it.
+        results: list[ExecutionReport | Exception] = []
+        for intent in intents:
+            try:
+                results.append(await self.place_order(intent))
+            except Exception as exc:
+                results.append(exc)
+        return results
+
     @abstractmethod
     async def cancel_order(self, order_id: str) -> bool:
         raise NotImplementedError
@@ -4,6 +4,7 @@ import asyncio
 import contextlib
 import hashlib
 import hmac
+import importlib.util
 import json
 import logging
 import time
@@ -12,24 +13,37 @@ from typing import Any
 from urllib.parse import urlencode
 
 from common_types.models import ExecutionReport, OrderIntent
+from common_types.universe import MarketRules, UniverseSnapshot
 
 from .base import ExchangeAdapter
+from .clock import ServerClock
+from .exchange_info import (
+    EXCHANGE_INFO_PATH,
+    check_order,
+    check_quote_order,
+    format_decimal,
+    parse_exchange_info,
+    quantize_base_qty,
+    quantize_quote_qty,
+)
+from .market_data import BinanceMarketDataFeed, MarketDataCache
+from .rate_limit import (
+    PRIORITY_ACCOUNT,
+    PRIORITY_BACKGROUND,
+    PRIORITY_ORDER,
+    REQUEST_WEIGHTS,
+    BinanceRateLimiter,
+    perp_rate_limiter,
+    spot_rate_limiter,
+)
+from .user_data import LISTEN_KEY_EXPIRED, QUOTE_ASSETS, decode_account_frame, decode_user_data_frame, parse_status
+from .ws_api import PERP_WS_API_URL, SPOT_WS_API_URL, BinanceWsApiClient, WsApiUnavailable
 
 logger = logging.getLogger(__name__)
 
-
-def _parse_status(status: str) -> str:
-    normalized = status.lower()
-    mapping = {
-        "new": "new",
-        "partially_filled": "partially_filled",
-        "filled": "filled",
-        "rejected": "rejected",
-        "canceled": "canceled",
-        "cancelled": "canceled",
-        "expired": "canceled",
-    }
-    return mapping.get(normalized, "new")
+ORDER_PATHS = {"/api/v3/order", "/fapi/v1/order", "/fapi/v1/batchOrders"}
+PERP_BATCH_MAX_ORDERS = 5
+TIME_PATH = {"spot": "/api/v3/time", "perp": "/fapi/v1/time"}
 
 
 class BinanceExchangeAdapter(ExchangeAdapter):
@@ -40,6 +54,13 @@ class BinanceExchangeAdapter(ExchangeAdapter):
         use_testnet: bool = True,
         recv_window_ms: int = 5000,
         timeout_sec: float = 10.0,
+        market_data: MarketDataCache | None = None,
+        rules_refresh_sec: float = 3600.0,
+        order_transport: str = "rest",
+        ws_api_urls: dict[str, str] | None = None,
+        http2: bool = True,
+        warm_connections: int = 2,
+        clock_sync_sec: float = 30.0,
     ):
         if not api_key or not api_secret:
             raise RuntimeError("Binance API credentials are required for live execution mode.")
@@ -61,6 +82,19 @@ class BinanceExchangeAdapter(ExchangeAdapter):
             self.spot_ws_base = "wss://stream.binance.com:9443/ws"
             self.perp_ws_base = "wss://fstream.binance.com/ws"
 
+        self.market_data = market_data if market_data is not None else MarketDataCache()
+        self.market_feed: BinanceMarketDataFeed | None = None
+        self.rules_refresh_sec = rules_refresh_sec
+        self._rules: dict[str, dict[str, MarketRules]] = {}
+        self.rate_limiters: dict[str, BinanceRateLimiter] = {"spot": spot_rate_limiter(), "perp": perp_rate_limiter()}
+        self.order_transport = order_transport.lower()
+        self.ws_api_urls = ws_api_urls or {"spot": SPOT_WS_API_URL[use_testnet], "perp": PERP_WS_API_URL[use_testnet]}
+        self._ws_clients: dict[str, BinanceWsApiClient] = {}
+        self.ws_fallbacks = 0
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        self.warm_connections = max(1, warm_connections)
+        self.clock_sync_sec = clock_sync_sec
+        self.server_clock = ServerClock()
         self._client = None
 
     def _ensure_client(self):
@@ -71,12 +105,13 @@ class BinanceExchangeAdapter(ExchangeAdapter):
         except ModuleNotFoundError as exc:
             raise RuntimeError("httpx is required for Binance live execution mode.") from exc
 
-        self._client = httpx.AsyncClient(timeout=self.timeout_sec)
+        # Idle connections must outlive the sync interval, since the /time calls are what keep them open.
+        limits = httpx.Limits(keepalive_expiry=self.clock_sync_sec + 30)
+        self._client = httpx.AsyncClient(timeout=self.timeout_sec, http2=self.http2, limits=limits)
         return self._client
 
-    @staticmethod
-    def _timestamp_ms() -> int:
-        return int(time.time() * 1000)
+    def _timestamp_ms(self) -> int:
+        return self.server_clock.now_ms()
 
     def _signature(self, query: str) -> str:
         return hmac.new(self.api_secret.encode("utf-8"), query.encode("utf-8"), hashlib.sha256).hexdigest()
@@ -97,9 +132,21 @@ class BinanceExchangeAdapter(ExchangeAdapter):
         path: str,
         params: dict[str, Any] | None = None,
         signed: bool = True,
+        priority: int = PRIORITY_ACCOUNT,
+        order_count: int = 1,
+        acquired: bool = False,
     ) -> dict[str, Any] | list[dict[str, Any]]:
         client = self._ensure_client()
         params = params or {}
+        limiter = self.rate_limiters[market]
+        if not acquired:
+            await limiter.acquire(
+                priority=priority,
+                weight=REQUEST_WEIGHTS.get((method, path), 1),
+                is_order=method == "POST" and path in ORDER_PATHS,
+                order_count=order_count,
+            )
+        # Sign after any limiter delay so the timestamp stays inside recvWindow.
         payload = self._sign_params(params) if signed else params
 
         base_url = self.spot_base_url if market == "spot" else self.perp_base_url
@@ -107,6 +154,7 @@ class BinanceExchangeAdapter(ExchangeAdapter):
         headers = {"X-MBX-APIKEY": self.api_key}
 
         response = await client.request(method, url, params=payload, headers=headers)
+        limiter.update(response.headers, response.status_code)
         response.raise_for_status()
 
         data = response.json()
@@ -114,36 +162,276 @@ class BinanceExchangeAdapter(ExchangeAdapter):
             raise RuntimeError(f"Binance API error: {data}")
         return data
 
+    def _ws_client(self, market: str) -> BinanceWsApiClient:
+        client = self._ws_clients.get(market)
+        if client is None:
+            client = BinanceWsApiClient(
+                self.ws_api_urls[market],
+                self.api_key,
+                sign=self._signature,
+                timestamp_ms=self._timestamp_ms,
+                recv_window_ms=self.recv_window_ms,
+                request_timeout_sec=self.timeout_sec,
+                on_rate_limits=self.rate_limiters[market].update,
+            )
+            self._ws_clients[market] = client
+        return client
+
+    async def _order_call(
+        self,
+        *,
+        market: str,
+        ws_method: str,
+        http_method: str,
+        path: str,
+        params: dict[str, Any],
+    ) -> dict[str, Any]:
+        acquired = False
+        if self.order_transport == "ws":
+            await self.rate_limiters[market].acquire(
+                priority=PRIORITY_ORDER,
+                weight=REQUEST_WEIGHTS.get((http_method, path), 1),
+                is_order=http_method == "POST" and path in ORDER_PATHS,
+            )
+            acquired = True
+            try:
+                data = await self._ws_client(market).request(ws_method, params)
+                assert isinstance(data, dict)
+                return data
+            except WsApiUnavailable as exc:
+                # Only requests that never reached the socket are retried over REST; anything sent has an unknown outcome.
+                self.ws_fallbacks += 1
+                logger.warning("binance %s websocket api unavailable, falling back to REST: %s", market, exc)
+
+        # A fallback spends the budget the websocket attempt already took; the request never reached the exchange.
+        data = await self._request(
+            method=http_method,
+            market=market,
+            path=path,
+            params=params,
+            signed=True,
+            priority=PRIORITY_ORDER,
+            acquired=acquired,
+        )
+        assert isinstance(data, dict)
+        return data
+
     async def _fetch_mark_price(self, symbol: str) -> float:
-        client = self._ensure_client()
-        url = f"{self.perp_base_url}/fapi/v1/ticker/price"
-        resp = await client.get(url, params={"symbol": symbol})
-        resp.raise_for_status()
-        data = resp.json()
+        # Only reached on a cache miss while an order waits on it, so it shares the order priority.
+        data = await self._request(
+            method="GET",
+            market="perp",
+            path="/fapi/v1/ticker/price",
+            params={"symbol": symbol},
+            signed=False,
+            priority=PRIORITY_ORDER,
+        )
+        assert isinstance(data, dict)
         return float(data["price"])
 
-    async def _fetch_spot_price(self, symbol: str) -> float:
-        client = self._ensure_client()
-        url = f"{self.spot_base_url}/api/v3/ticker/price"
-        resp = await client.get(url, params={"symbol": symbol})
-        resp.raise_for_status()
-        data = resp.json()
-        return float(data.get("price", 0.0))
+    async def _mark_price(self, symbol: str) -> float:
+        cached = self.market_data.price("perp", symbol)
+        if cached is not None:
+            return cached
+        price = await self._fetch_mark_price(symbol)
+        self.market_data.update_mark("perp", symbol, price)
+        return price
+
+    def set_market_rules(self, market: str, rules: dict[str, MarketRules]) -> None:
+        self._rules[market] = rules
+
+    async def refresh_market_rules(self) -> None:
+        spot, perp = await asyncio.gather(
+            self._request(
+                method="GET", market="spot", path=EXCHANGE_INFO_PATH["spot"], signed=False, priority=PRIORITY_BACKGROUND
+            ),
+            self._request(
+                method="GET", market="perp", path=EXCHANGE_INFO_PATH["perp"], signed=False, priority=PRIORITY_BACKGROUND
+            ),
+        )
+        assert isinstance(spot, dict) and isinstance(perp, dict)
+        self._rules = {"spot": parse_exchange_info("spot", spot), "perp": parse_exchange_info("perp", perp)}
+
+    async def _sync_clock_once(self, market: str) -> None:
+        sent_ms = time.time() * 1000
+        data = await self._request(method="GET", market=market, path=TIME_PATH[market], signed=False, priority=PRIORITY_BACKGROUND)
+        received_ms = time.time() * 1000
+        assert isinstance(data, dict)
+        self.server_clock.observe(sent_ms, float(data["serverTime"]), received_ms)
+
+    async def sync_clock(self) -> None:
+        # Concurrent pings open (or keep alive) warm_connections connections per host and each yields an offset sample.
+        results = await asyncio.gather(
+            *(self._sync_clock_once(market) for market in ("spot", "perp") for _ in range(self.warm_connections)),
+            return_exceptions=True,
+        )
+        errors = [result for result in results if isinstance(result, Exception)]
+        if len(errors) == len(results):
+            raise errors[0]
+
+    async def warmup(self) -> None:
+        self._ensure_client()
+        await self.sync_clock()
+        if self.order_transport == "ws":
+            for market in ("spot", "perp"):
+                try:
+                    await self._ws_client(market).connect()
+                except Exception as exc:
+                    logger.warning("binance %s websocket api pre-connect failed; orders will connect on demand: %s", market, exc)
+
+    async def run_connection_keeper(self) -> None:
+        while True:
+            await asyncio.sleep(self.clock_sync_sec)
+            try:
+                await self.sync_clock()
+            except Exception as exc:
+                logger.warning("binance clock sync failed; keeping offset %.1fms: %s", self.server_clock.offset_ms, exc)
+
+    def _pool_stats(self) -> dict:
+        pool = getattr(getattr(self._client, "_transport", None), "_pool", None)
+        connections = list(getattr(pool, "connections", []))
+        if not connections:
+            return {market: {"connections": 0, "idle": 0} for market in ("spot", "perp")}
+        import httpcore
+        import httpx
+
+        stats = {}
+        for market, base in (("spot", self.spot_base_url), ("perp", self.perp_base_url)):
+            url = httpx.URL(base)
+            origin = httpcore.Origin(url.raw_scheme, url.raw_host, url.port or (443 if url.scheme == "https" else 80))
+            own = [conn for conn in connections if conn.can_handle_request(origin)]
+            stats[market] = {"connections": len(own), "idle": sum(1 for conn in own if conn.is_idle())}
+        return stats
+
+    def connection_metrics(self) -> dict:
+        return {
+            "http2": self.http2,
+            "pools": self._pool_stats(),
+            "clock": self.server_clock.stats(),
+            "ws_api_connected": {market: client.connected for market, client in self._ws_clients.items()},
+        }
+
+    async def run_rules_refresh(self) -> None:
+        while True:
+            try:
+                await self.refresh_market_rules()
+            except Exception as exc:
+                logger.warning("binance exchangeInfo refresh failed; keeping cached filters: %s", exc)
+            await asyncio.sleep(self.rules_refresh_sec)
+
+    def _market_rules(self, market: str, symbol: str) -> MarketRules | None:
+        # Filters come from the background refresh; until it has run, orders keep the legacy formatting.
+        return self._rules.get(market, {}).get(symbol)
+
+    def _local_reject(self, intent: OrderIntent, reason: str) -> ExecutionReport:
+        logger.warning("order rejected locally intent_id=%s symbol=%s: %s", intent.intent_id, intent.symbol, reason)
+        return ExecutionReport(
+            order_id=f"{intent.market}:{intent.symbol}:local-reject:{intent.intent_id}",
+            intent_id=intent.intent_id,
+            symbol=intent.symbol,
+            market=intent.market,
+            side=intent.side,
+            status="rejected",
+            filled_qty=0.0,
+            avg_price=0.0,
+            fee=0.0,
+            ts=datetime.now(timezone.utc),
+        )
+
+    def rate_limit_metrics(self) -> dict:
+        return {market: limiter.metrics() for market, limiter in self.rate_limiters.items()}
+
+    def _market_feed(self, symbols: set[str]) -> BinanceMarketDataFeed:
+        if self.market_feed is None:
+            self.market_feed = BinanceMarketDataFeed(self.market_data, symbols, use_testnet=self.use_testnet)
+        return self.market_feed
+
+    def apply_universe(self, snapshot: UniverseSnapshot) -> None:
+        self._market_feed(set()).apply_universe(snapshot)
+
+    async def run_market_data(self, symbols: set[str]) -> None:
+        await self._market_feed(symbols).run()
+
+    async def _fetch_spot_prices(self, symbols: set[str]) -> dict[str, float]:
+        prices: dict[str, float] = {}
+        missing: set[str] = set()
+        for symbol in symbols:
+            cached = self.market_data.price("spot", symbol)
+            if cached is None:
+                missing.add(symbol)
+            else:
+                prices[symbol] = cached
+        if missing:
+            # One unfiltered ticker call costs a fixed weight regardless of how many assets we hold.
+            tickers = await self._request(method="GET", market="spot", path="/api/v3/ticker/price", signed=False)
+            assert isinstance(tickers, list)
+            for item in tickers:
+                symbol = str(item.get("symbol", ""))
+                if symbol in missing:
+                    prices[symbol] = float(item.get("price", 0.0))
+        return prices
+
+    async def _prepare_perp_order(self, intent: OrderIntent) -> tuple[dict[str, Any], float, float] | ExecutionReport:
+        mark_price = await self._mark_price(intent.symbol)
+        rules = self._market_rules("perp", intent.symbol)
+        if rules is not None:
+            quantized = quantize_base_qty(rules, intent.qty_usd / max(mark_price, 1e-9))
+            reason = check_order(rules, quantized, mark_price)
+            if reason is not None:
+                return self._local_reject(intent, reason)
+            quantity = float(quantized)
+            quantity_text = format_decimal(quantized)
+        else:
+            quantity = max(0.001, round(intent.qty_usd / max(mark_price, 1e-9), 3))
+            quantity_text = f"{quantity:.3f}"
+        params = {
+            "symbol": intent.symbol,
+            "side": "BUY" if intent.side > 0 else "SELL",
+            "type": "MARKET",
+            "quantity": quantity_text,
+            "newClientOrderId": intent.intent_id[:32],
+        }
+        return params, quantity, mark_price
+
+    def _perp_report(self, intent: OrderIntent, data: dict[str, Any], quantity: float, mark_price: float) -> ExecutionReport:
+        filled_qty = float(data.get("executedQty", quantity))
+        return ExecutionReport(
+            order_id=f"perp:{intent.symbol}:{data.get('orderId')}",
+            intent_id=intent.intent_id,
+            symbol=intent.symbol,
+            market="perp",
+            side=intent.side,
+            status=parse_status(str(data.get("status", "new"))),
+            filled_qty=filled_qty,
+            avg_price=float(data.get("avgPrice", 0.0)) or mark_price,
+            fee=0.0,
+            ts=datetime.now(timezone.utc),
+        )
 
     async def place_order(self, intent: OrderIntent) -> ExecutionReport:
         side = "BUY" if intent.side > 0 else "SELL"
         client_order_id = intent.intent_id[:32]
 
+        rules = self._market_rules(intent.market, intent.symbol)
+
         if intent.market == "spot":
+            quote_qty = f"{intent.qty_usd:.2f}"
+            if rules is not None:
+                quantized = quantize_quote_qty(rules, intent.qty_usd)
+                reason = check_quote_order(rules, quantized)
+                if reason is not None:
+                    return self._local_reject(intent, reason)
+                quote_qty = format_decimal(quantized)
             params = {
                 "symbol": intent.symbol,
                 "side": side,
                 "type": "MARKET",
-                "quoteOrderQty": f"{intent.qty_usd:.2f}",
+                "quoteOrderQty": quote_qty,
                 "newClientOrderId": client_order_id,
             }
-            data = await self._request(method="POST", market="spot", path="/api/v3/order", params=params, signed=True)
-            assert isinstance(data, dict)
+            data = await self._order_call(
+                market="spot", ws_method="order.place", http_method="POST", path="/api/v3/order", params=params
+            )
 
             filled_qty = float(data.get("executedQty", 0.0))
             fills = data.get("fills", []) or []
@@ -157,25 +445,16 @@ class BinanceExchangeAdapter(ExchangeAdapter):
                 fee = 0.0
 
             order_id = f"spot:{intent.symbol}:{data.get('orderId')}"
-            status = _parse_status(str(data.get("status", "new")))
+            status = parse_status(str(data.get("status", "new")))
         else:
-            mark_price = await self._fetch_mark_price(intent.symbol)
-            quantity = max(0.001, round(intent.qty_usd / max(mark_price, 1e-9), 3))
-            params = {
-                "symbol": intent.symbol,
-                "side": side,
-                "type": "MARKET",
-                "quantity": f"{quantity:.3f}",
-                "newClientOrderId": client_order_id,
-            }
-            data = await self._request(method="POST", market="perp", path="/fapi/v1/order", params=params, signed=True)
-            assert isinstance(data, dict)
-
-            filled_qty = float(data.get("executedQty", quantity))
-            avg_price = float(data.get("avgPrice", 0.0)) or mark_price
-            fee = 0.0
-            order_id = f"perp:{intent.symbol}:{data.get('orderId')}"
-            status = _parse_status(str(data.get("status", "new")))
+            prepared = await self._prepare_perp_order(intent)
+            if isinstance(prepared, ExecutionReport):
+                return prepared
+            params, quantity, mark_price = prepared
+            data = await self._order_call(
+                market="perp", ws_method="order.place", http_method="POST", path="/fapi/v1/order", params=params
+            )
+            return self._perp_report(intent, data, quantity, mark_price)
 
         return ExecutionReport(
             order_id=order_id,
@@ -190,37 +469,130 @@ class BinanceExchangeAdapter(ExchangeAdapter):
             ts=datetime.now(timezone.utc),
         )
 
-    async def cancel_order(self, order_id: str) -> bool:
+    @staticmethod
+    def _batch_chunks(orders: list[tuple[int, OrderIntent, dict[str, Any], float, float]]) -> list[list]:
+        # A batch is processed concurrently on the exchange, so two orders for one symbol go in successive batches.
+        chunks: list[list] = []
+        last_chunk: dict[str, int] = {}
+        for order in orders:
+            symbol = order[1].symbol
+            idx = last_chunk.get(symbol, -1) + 1
+            while idx < len(chunks) and len(chunks[idx]) >= PERP_BATCH_MAX_ORDERS:
+                idx += 1
+            if idx == len(chunks):
+                chunks.append([])
+            chunks[idx].append(order)
+            last_chunk[symbol] = idx
+        return chunks
+
+    async def place_orders(self, intents: list[OrderIntent]) -> list[ExecutionReport | Exception]:
+        if self.order_transport == "ws":
+            return await super().place_orders(intents)
+
+        results: list[ExecutionReport | Exception | None] = [None] * len(intents)
+        perp_orders = []
+        for idx, intent in enumerate(intents):
+            if intent.market != "perp":
+                continue
+            try:
+                prepared = await self._prepare_perp_order(intent)
+            except Exception as exc:
+                results[idx] = exc
+                continue
+            if isinstance(prepared, ExecutionReport):
+                results[idx] = prepared
+            else:
+                perp_orders.append((idx, intent, *prepared))
+
+        for chunk in self._batch_chunks(perp_orders):
+            if len(chunk) == 1:
+                idx, intent, params, quantity, mark_price = chunk[0]
+                try:
+                    data = await self._order_call(
+                        market="perp", ws_method="order.place", http_method="POST", path="/fapi/v1/order", params=params
+                    )
+                    results[idx] = self._perp_report(intent, data, quantity, mark_price)
+                except Exception as exc:
+                    results[idx] = exc
+                continue
+            batch = json.dumps([params for _, _, params, _, _ in chunk], separators=(",", ":"))
+            try:
+                data = await self._request(
+                    method="POST",
+                    market="perp",
+                    path="/fapi/v1/batchOrders",
+                    params={"batchOrders": batch},
+                    priority=PRIORITY_ORDER,
+                    order_count=len(chunk),
+                )
+                assert isinstance(data, list) and len(data) == len(chunk)
+            except Exception as exc:
+                for idx, *_ in chunk:
+                    results[idx] = exc
+                continue
+            for (idx, intent, _, quantity, mark_price), item in zip(chunk, data):
+                if isinstance(item.get("code"), int) and item["code"] < 0:
+                    results[idx] = RuntimeError(f"Binance API error: {item}")
+                else:
+                    results[idx] = self._perp_report(intent, item, quantity, mark_price)
+
+        for idx, intent in enumerate(intents):
+            if results[idx] is None:
+                try:
+                    results[idx] = await self.place_order(intent)
+                except Exception as exc:
+                    results[idx] = exc
+        return results
+
+    @staticmethod
+    def _split_order_id(order_id: str) -> tuple[str, str, str]:
         parts = order_id.split(":")
         if len(parts) != 3:
             raise ValueError("order_id must be in format 'market:symbol:exchange_order_id'")
-
         market, symbol, exchange_order_id = parts
-        if market == "spot":
-            await self._request(
-                method="DELETE",
-                market="spot",
-                path="/api/v3/order",
-                params={"symbol": symbol, "orderId": exchange_order_id},
-                signed=True,
-            )
-            return True
+        return market, symbol, exchange_order_id
 
-        await self._request(
-            method="DELETE",
-            market="perp",
-            path="/fapi/v1/order",
+    async def cancel_order(self, order_id: str) -> bool:
+        market, symbol, exchange_order_id = self._split_order_id(order_id)
+        await self._order_call(
+            market=market,
+            ws_method="order.cancel",
+            http_method="DELETE",
+            path="/api/v3/order" if market == "spot" else "/fapi/v1/order",
             params={"symbol": symbol, "orderId": exchange_order_id},
-            signed=True,
         )
         return True
 
-    async def fetch_positions(self) -> list[dict]:
-        positions: list[dict] = []
-        spot_price_cache: dict[str, float] = {}
+    async def query_order(self, order_id: str) -> dict:
+        market, symbol, exchange_order_id = self._split_order_id(order_id)
+        data = await self._order_call(
+            market=market,
+            ws_method="order.status",
+            http_method="GET",
+            path="/api/v3/order" if market == "spot" else "/fapi/v1/order",
+            params={"symbol": symbol, "orderId": exchange_order_id},
+        )
+        filled_qty = float(data.get("executedQty", 0.0) or 0.0)
+        if market == "spot":
+            avg_price = float(data.get("cummulativeQuoteQty", 0.0) or 0.0) / filled_qty if filled_qty > 0 else 0.0
+        else:
+            avg_price = float(data.get("avgPrice", 0.0) or 0.0)
+        return {
+            "order_id": order_id,
+            "status": parse_status(str(data.get("status", "new"))),
+            "filled_qty": filled_qty,
+            "avg_price": avg_price,
+        }
 
-        spot_account = await self._request(method="GET", market="spot", path="/api/v3/account", params={}, signed=True)
+    async def fetch_positions(self) -> list[dict]:
+        spot_account, perp_positions = await asyncio.gather(
+            self._request(method="GET", market="spot", path="/api/v3/account", params={}, signed=True),
+            self._request(method="GET", market="perp", path="/fapi/v2/positionRisk", params={}, signed=True),
+        )
         assert isinstance(spot_account, dict)
+        assert isinstance(perp_positions, list)
+
+        balances: dict[str, float] = {}
         for bal in spot_account.get("balances", []):
             free = float(bal.get("free", 0.0))
             locked = float(bal.get("locked", 0.0))
@@ -228,19 +600,22 @@ class BinanceExchangeAdapter(ExchangeAdapter):
             if total <= 0:
                 continue
             asset = str(bal.get("asset", "")).upper()
-            if asset in {"USDT", "BUSD", "USDC"}:
+            if asset in QUOTE_ASSETS:
                 continue
-            symbol = f"{asset}USDT"
-            if symbol not in spot_price_cache:
-                try:
-                    spot_price_cache[symbol] = await self._fetch_spot_price(symbol)
-                except Exception:
-                    spot_price_cache[symbol] = 0.0
-            px = spot_price_cache[symbol]
+            balances[f"{asset}USDT"] = total
+
+        spot_prices: dict[str, float] = {}
+        if balances:
+            try:
+                spot_prices = await self._fetch_spot_prices(set(balances))
+            except Exception as exc:
+                logger.warning("binance spot ticker fetch failed; reporting zero notional: %s", exc)
+
+        positions: list[dict] = []
+        for symbol, total in balances.items():
+            px = spot_prices.get(symbol, 0.0)
             positions.append({"market": "spot", "symbol": symbol, "qty": total, "notional_usd": abs(total) * px})
 
-        perp_positions = await self._request(method="GET", market="perp", path="/fapi/v2/positionRisk", params={}, signed=True)
-        assert isinstance(perp_positions, list)
         for pos in perp_positions:
             qty = float(pos.get("positionAmt", 0.0))
             if qty == 0.0:
@@ -265,46 +640,6 @@ class BinanceExchangeAdapter(ExchangeAdapter):
             raise RuntimeError(f"Failed to create {market} listen key: {data}")
         return str(listen_key)
 
-    def _parse_user_data_event(self, market: str, data: dict) -> dict | None:
-        if market == "spot":
-            if data.get("e") != "executionReport":
-                return None
-            filled_qty = float(data.get("z", 0.0) or 0.0)
-            quote_filled = float(data.get("Z", 0.0) or 0.0)
-            avg_price = quote_filled / filled_qty if filled_qty > 0 else 0.0
-            ts_ms = int(data.get("E") or self._timestamp_ms())
-            return {
-                "order_id": f"spot:{data.get('s')}:{data.get('i')}",
-                "intent_id": str(data.get("c", "")),
-                "symbol": data.get("s"),
-                "market": "spot",
-                "side": 1 if data.get("S") == "BUY" else -1,
-                "status": _parse_status(str(data.get("X", "new"))),
-                "filled_qty": filled_qty,
-                "avg_price": avg_price,
-                "fee": 0.0,
-                "ts": datetime.fromtimestamp(ts_ms / 1000, tz=timezone.utc).isoformat(),
-            }
-
-        if data.get("e") != "ORDER_TRADE_UPDATE":
-            return None
-        order = data.get("o", {})
-        filled_qty = float(order.get("z", 0.0) or 0.0)
-        avg_price = float(order.get("ap", 0.0) or 0.0)
-        ts_ms = int(data.get("E") or self._timestamp_ms())
-        return {
-            "order_id": f"perp:{order.get('s')}:{order.get('i')}",
-            "intent_id": str(order.get("c", "")),
-            "symbol": order.get("s"),
-            "market": "perp",
-            "side": 1 if order.get("S") == "BUY" else -1,
-            "status": _parse_status(str(order.get("X", "new"))),
-            "filled_qty": filled_qty,
-            "avg_price": avg_price,
-            "fee": 0.0,
-            "ts": datetime.fromtimestamp(ts_ms / 1000, tz=timezone.utc).isoformat(),
-        }
-
     async def _build_alert(self, market: str, message: str, severity: str = "warning") -> dict:
         return {
             "event_type": "alert",
@@ -320,7 +655,9 @@ class BinanceExchangeAdapter(ExchangeAdapter):
             await asyncio.sleep(30 * 60)
             await self._request(method="PUT", market=market, path=path, params={"listenKey": listen_key}, signed=False)
 
-    async def _consume_user_stream(self, market: str, queue: "asyncio.Queue[dict]") -> None:
+    async def _consume_user_stream(
+        self, market: str, queue: "asyncio.Queue[dict | ExecutionReport]", decode=decode_user_data_frame
+    ) -> None:
         try:
             import websockets
         except ModuleNotFoundError as exc:
@@ -350,16 +687,14 @@ class BinanceExchangeAdapter(ExchangeAdapter):
                         except asyncio.TimeoutError:
                             continue
 
-                        data = json.loads(message)
-                        if data.get("e") == "listenKeyExpired":
+                        event = decode(market, message)
+                        if event is None:
+                            continue
+                        if event == LISTEN_KEY_EXPIRED:
                             msg = f"Binance {market} listenKey expired; reconnecting stream."
                             await queue.put(await self._build_alert(market, msg, severity="warning"))
                             raise RuntimeError(msg)
-
-                        parsed = self._parse_user_data_event(market, data)
-                        if parsed is not None:
-                            parsed["event_type"] = "execution"
-                            await queue.put(parsed)
+                        await queue.put(event)
             except Exception as exc:
                 logger.warning("binance %s user stream loop error: %s", market, exc)
                 await asyncio.sleep(2)
@@ -369,10 +704,10 @@ class BinanceExchangeAdapter(ExchangeAdapter):
                     with contextlib.suppress(asyncio.CancelledError):
                         await keepalive_task
 
-    async def stream_execution_events(self):
-        queue: asyncio.Queue[dict] = asyncio.Queue()
-        spot_task = asyncio.create_task(self._consume_user_stream("spot", queue))
-        perp_task = asyncio.create_task(self._consume_user_stream("perp", queue))
+    async def _stream_user_data(self, decode):
+        queue: asyncio.Queue[dict | ExecutionReport] = asyncio.Queue()
+        spot_task = asyncio.create_task(self._consume_user_stream("spot", queue, decode))
+        perp_task = asyncio.create_task(self._consume_user_stream("perp", queue, decode))
         try:
             while True:
                 event = await queue.get()
@@ -383,7 +718,18 @@ class BinanceExchangeAdapter(ExchangeAdapter):
                 with contextlib.suppress(asyncio.CancelledError):
                     await task
 
+    def stream_execution_events(self):
+        # Fills arrive as ExecutionReport objects; alerts stay dicts with event_type "alert".
+        return self._stream_user_data(decode_user_data_frame)
+
+    def stream_account_events(self):
+        # Position and balance changes as dicts with event_type "account"; each lists only what changed.
+        return self._stream_user_data(decode_account_frame)
+
     async def close(self) -> None:
+        for client in self._ws_clients.values():
+            await client.close()
+        self._ws_clients.clear()
         if self._client is not None:
             await self._client.aclose()
             self._client = None
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+
+class ServerClock:
+    def __init__(self, alpha: float = 0.2, max_rtt_ms: float = 1000.0, clock: Callable[[], float] = time.time):
+        self.alpha = alpha
+        self.max_rtt_ms = max_rtt_ms
+        self._clock = clock
+        self.offset_ms = 0.0
+        self.last_rtt_ms: float | None = None
+        self.min_rtt_ms: float | None = None
+        self.samples = 0
+        self.rejected = 0
+        self.last_sync: float | None = None
+
+    def now_ms(self) -> int:
+        return int(self._clock() * 1000 + self.offset_ms)
+
+    def observe(self, sent_ms: float, server_ms: float, received_ms: float) -> bool:
+        rtt = received_ms - sent_ms
+        if rtt < 0 or rtt > self.max_rtt_ms:
+            # A slow round trip leaves too wide a window to say when the server read its clock.
+            self.rejected += 1
+            return False
+        sample = server_ms - (sent_ms + received_ms) / 2
+        self.offset_ms = sample if self.samples == 0 else self.offset_ms + self.alpha * (sample - self.offset_ms)
+        self.samples += 1
+        self.last_rtt_ms = rtt
+        self.min_rtt_ms = rtt if self.min_rtt_ms is None else min(self.min_rtt_ms, rtt)
+        self.last_sync = received_ms / 1000
+        return True
+
+    def stats(self) -> dict:
+        return {
+            "offset_ms": self.offset_ms,
+            "samples": self.samples,
+            "rejected": self.rejected,
+            "last_rtt_ms": self.last_rtt_ms,
+            "min_rtt_ms": self.min_rtt_ms,
+            "since_sync_sec": self._clock() - self.last_sync if self.last_sync is not None else None,
+        }
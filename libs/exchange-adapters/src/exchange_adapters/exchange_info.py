@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+from decimal import ROUND_DOWN, Decimal
+
+from common_types.universe import MarketRules, UniverseEntry, UniverseSnapshot
+
+SPOT_REST_BASE = {True: "https://testnet.binance.vision", False: "https://api.binance.com"}
+PERP_REST_BASE = {True: "https://testnet.binancefuture.com", False: "https://fapi.binance.com"}
+EXCHANGE_INFO_PATH = {"spot": "/api/v3/exchangeInfo", "perp": "/fapi/v1/exchangeInfo"}
+
+
+def _float(value, default: float = 0.0) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def parse_exchange_info(market: str, data: dict) -> dict[str, MarketRules]:
+    out: dict[str, MarketRules] = {}
+    for item in data.get("symbols", []):
+        symbol = str(item.get("symbol", "")).upper()
+        if not symbol:
+            continue
+        if market == "perp" and item.get("contractType", "PERPETUAL") != "PERPETUAL":
+            continue
+
+        filters = {f.get("filterType"): f for f in item.get("filters", [])}
+        lot = filters.get("LOT_SIZE", {})
+        # Market orders are bounded by MARKET_LOT_SIZE when the exchange publishes a non-zero step.
+        market_lot = filters.get("MARKET_LOT_SIZE", {})
+        if _float(market_lot.get("stepSize")) > 0:
+            lot = {**lot, **{k: v for k, v in market_lot.items() if _float(v) > 0}}
+        price = filters.get("PRICE_FILTER", {})
+        notional = filters.get("NOTIONAL") or filters.get("MIN_NOTIONAL") or {}
+
+        out[symbol] = MarketRules(
+            status=str(item.get("status", "TRADING")),
+            min_qty=_float(lot.get("minQty")),
+            max_qty=_float(lot.get("maxQty")),
+            step_size=_float(lot.get("stepSize")),
+            tick_size=_float(price.get("tickSize")),
+            min_notional=_float(notional.get("minNotional", notional.get("notional"))),
+            quote_precision=int(item.get("quoteAssetPrecision", item.get("quotePrecision", 8)) or 8),
+        )
+    return out
+
+
+async def fetch_market_rules(client, base_url: str, market: str) -> dict[str, MarketRules]:
+    resp = await client.get(f"{base_url}{EXCHANGE_INFO_PATH[market]}")
+    resp.raise_for_status()
+    return parse_exchange_info(market, resp.json())
+
+
+async def fetch_binance_universe_rules(
+    use_testnet: bool = True,
+    timeout_sec: float = 10.0,
+) -> tuple[dict[str, MarketRules], dict[str, MarketRules]]:
+    try:
+        import httpx
+    except ModuleNotFoundError as exc:
+        raise RuntimeError("httpx is required to load Binance exchangeInfo.") from exc
+
+    async with httpx.AsyncClient(timeout=timeout_sec) as client:
+        spot, perp = await asyncio.gather(
+            fetch_market_rules(client, SPOT_REST_BASE[use_testnet], "spot"),
+            fetch_market_rules(client, PERP_REST_BASE[use_testnet], "perp"),
+        )
+    return spot, perp
+
+
+def build_universe_snapshot(
+    whitelist: set[str],
+    spot_rules: dict[str, MarketRules],
+    perp_rules: dict[str, MarketRules],
+    version: int,
+) -> UniverseSnapshot:
+    entries: dict[str, UniverseEntry] = {}
+    for symbol in sorted(whitelist):
+        spot = spot_rules.get(symbol)
+        perp = perp_rules.get(symbol)
+        if spot is None and perp is None:
+            continue
+        entries[symbol] = UniverseEntry(symbol=symbol, spot=spot, perp=perp)
+    return UniverseSnapshot(version=version, source="binance", symbols=entries)
+
+
+def floor_to_step(value: float, step: float) -> Decimal:
+    amount = Decimal(repr(float(value)))
+    if step <= 0:
+        return amount
+    quantum = Decimal(repr(float(step))).normalize()
+    return (amount / quantum).to_integral_value(rounding=ROUND_DOWN) * quantum
+
+
+def format_decimal(value: Decimal) -> str:
+    text = format(value.normalize(), "f")
+    return text if text != "-0" else "0"
+
+
+def quantize_base_qty(rules: MarketRules, qty: float) -> Decimal:
+    if rules.max_qty > 0:
+        qty = min(qty, rules.max_qty)
+    return floor_to_step(qty, rules.step_size)
+
+
+def quantize_quote_qty(rules: MarketRules, quote_qty: float) -> Decimal:
+    return floor_to_step(quote_qty, 10.0 ** -rules.quote_precision)
+
+
+def check_order(rules: MarketRules, qty: Decimal, price: float) -> str | None:
+    if not rules.trading:
+        return f"symbol status {rules.status}"
+    if qty <= 0 or (rules.min_qty > 0 and qty < Decimal(repr(rules.min_qty))):
+        return f"quantity {format_decimal(qty)} below minQty {rules.min_qty}"
+    if rules.min_notional > 0 and price > 0 and float(qty) * price < rules.min_notional:
+        return f"notional {float(qty) * price:.4f} below minNotional {rules.min_notional}"
+    return None
+
+
+def check_quote_order(rules: MarketRules, quote_qty: Decimal) -> str | None:
+    if not rules.trading:
+        return f"symbol status {rules.status}"
+    if quote_qty <= 0 or float(quote_qty) < rules.min_notional:
+        return f"notional {format_decimal(quote_qty)} below minNotional {rules.min_notional}"
+    return None
@@ -4,15 +4,27 @@ from common_types.config import AppSettings
 
 from .base import ExchangeAdapter
 from .binance import BinanceExchangeAdapter
+from .market_data import MarketDataCache
 from .simulated import SimulatedExchangeAdapter
 
 
 def build_exchange_adapter(settings: AppSettings) -> ExchangeAdapter:
     if settings.execution_mode.lower() == "paper":
-        return SimulatedExchangeAdapter()
+        return SimulatedExchangeAdapter(
+            latency_ms=settings.paper_latency_ms,
+            fee_bps=settings.paper_fee_bps,
+            level_depth_usd=settings.paper_level_depth_usd,
+            volatility_bps=settings.paper_volatility_bps,
+        )
     return BinanceExchangeAdapter(
         settings.binance_api_key,
         settings.binance_api_secret,
         use_testnet=settings.binance_use_testnet,
         recv_window_ms=settings.binance_recv_window_ms,
+        market_data=MarketDataCache(max_age_sec=settings.market_data_max_age_sec),
+        rules_refresh_sec=settings.binance_rules_refresh_sec,
+        order_transport=settings.binance_order_transport,
+        http2=settings.binance_http2,
+        warm_connections=settings.binance_warm_connections,
+        clock_sync_sec=settings.binance_clock_sync_sec,
     )
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from common_types.universe import UniverseSnapshot
+
+logger = logging.getLogger(__name__)
+
+SPOT_MARKET_WS_BASE = {True: "wss://testnet.binance.vision/stream", False: "wss://stream.binance.com:9443/stream"}
+PERP_MARKET_WS_BASE = {True: "wss://stream.binancefuture.com/stream", False: "wss://fstream.binance.com/stream"}
+
+
+@dataclass(slots=True)
+class PriceQuote:
+    mark: float = 0.0
+    bid: float = 0.0
+    ask: float = 0.0
+    mark_at: float = 0.0
+    book_at: float = 0.0
+
+
+class MarketDataCache:
+    # Written by a single feed task and read on the same event loop, so quotes are replaced without locking.
+    def __init__(self, max_age_sec: float = 3.0):
+        self.max_age_sec = max_age_sec
+        self._quotes: dict[tuple[str, str], PriceQuote] = {}
+        self._listeners: list[Callable[[str, str], None]] = []
+
+    def __len__(self) -> int:
+        return len(self._quotes)
+
+    def _quote(self, market: str, symbol: str) -> PriceQuote:
+        key = (market, symbol.upper())
+        quote = self._quotes.get(key)
+        if quote is None:
+            quote = PriceQuote()
+            self._quotes[key] = quote
+        return quote
+
+    def subscribe(self, listener: Callable[[str, str], None]) -> None:
+        self._listeners.append(listener)
+
+    def _notify(self, market: str, symbol: str) -> None:
+        for listener in self._listeners:
+            listener(market, symbol.upper())
+
+    def update_mark(self, market: str, symbol: str, price: float, at: float | None = None) -> None:
+        quote = self._quote(market, symbol)
+        quote.mark = price
+        quote.mark_at = time.monotonic() if at is None else at
+        if self._listeners:
+            self._notify(market, symbol)
+
+    def update_book(self, market: str, symbol: str, bid: float, ask: float, at: float | None = None) -> None:
+        quote = self._quote(market, symbol)
+        quote.bid = bid
+        quote.ask = ask
+        quote.book_at = time.monotonic() if at is None else at
+        if self._listeners:
+            self._notify(market, symbol)
+
+    def get(self, market: str, symbol: str) -> PriceQuote | None:
+        return self._quotes.get((market, symbol.upper()))
+
+    def price(self, market: str, symbol: str, max_age_sec: float | None = None) -> float | None:
+        quote = self._quotes.get((market, symbol.upper()))
+        if quote is None:
+            return None
+        cutoff = time.monotonic() - (self.max_age_sec if max_age_sec is None else max_age_sec)
+        # Perps are sized off the mark price; spot (and perps without a fresh mark) fall back to the book mid.
+        if quote.mark > 0 and quote.mark_at >= cutoff:
+            return quote.mark
+        if quote.bid > 0 and quote.ask > 0 and quote.book_at >= cutoff:
+            return (quote.bid + quote.ask) / 2
+        return None
+
+    def apply_message(self, market: str, message: dict) -> bool:
+        data = message.get("data", message)
+        symbol = data.get("s")
+        if not symbol:
+            return False
+        event = data.get("e")
+        if event == "markPriceUpdate":
+            self.update_mark(market, symbol, float(data["p"]))
+            return True
+        # Spot bookTicker frames carry no event type; futures ones are tagged "bookTicker".
+        if event in (None, "bookTicker") and "b" in data and "a" in data:
+            self.update_book(market, symbol, float(data["b"]), float(data["a"]))
+            return True
+        return False
+
+
+class BinanceMarketDataFeed:
+    def __init__(
+        self,
+        cache: MarketDataCache,
+        symbols: set[str],
+        use_testnet: bool = True,
+        spot_ws_base: str | None = None,
+        perp_ws_base: str | None = None,
+        reconnect_delay_sec: float = 2.0,
+    ):
+        self.cache = cache
+        self.symbols = sorted(s.upper() for s in symbols)
+        self.spot_ws_base = spot_ws_base or SPOT_MARKET_WS_BASE[use_testnet]
+        self.perp_ws_base = perp_ws_base or PERP_MARKET_WS_BASE[use_testnet]
+        self.reconnect_delay_sec = reconnect_delay_sec
+        self._changed = asyncio.Event()
+        self._universe_version = -1
+
+    def set_symbols(self, symbols: set[str]) -> bool:
+        updated = sorted(s.upper() for s in symbols)
+        if updated == self.symbols:
+            return False
+        self.symbols = updated
+        # Wakes every open connection so it reconnects with the new stream list.
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+        return True
+
+    def apply_universe(self, snapshot: UniverseSnapshot) -> bool:
+        if snapshot.version <= self._universe_version:
+            return False
+        self._universe_version = snapshot.version
+        if not self.set_symbols({symbol for symbol, entry in snapshot.symbols.items() if entry.tradable}):
+            return False
+        logger.info("market data resubscribed to %d symbols for universe v%d", len(self.symbols), snapshot.version)
+        return True
+
+    def stream_names(self, market: str) -> list[str]:
+        names = []
+        for symbol in self.symbols:
+            lowered = symbol.lower()
+            if market == "perp":
+                names.append(f"{lowered}@markPrice@1s")
+            names.append(f"{lowered}@bookTicker")
+        return names
+
+    def url(self, market: str) -> str:
+        base = self.spot_ws_base if market == "spot" else self.perp_ws_base
+        return f"{base}?streams={'/'.join(self.stream_names(market))}"
+
+    async def run_market(self, market: str) -> None:
+        try:
+            import websockets
+        except ModuleNotFoundError as exc:
+            raise RuntimeError("websockets package is required to stream Binance market data") from exc
+
+        while True:
+            changed = self._changed
+            if not self.symbols:
+                await changed.wait()
+                continue
+            try:
+                async with websockets.connect(self.url(market), ping_interval=20, ping_timeout=20, close_timeout=5) as ws:
+                    reader = asyncio.ensure_future(self._read(ws, market))
+                    waiter = asyncio.ensure_future(changed.wait())
+                    try:
+                        await asyncio.wait({reader, waiter}, return_when=asyncio.FIRST_COMPLETED)
+                    finally:
+                        reader.cancel()
+                        waiter.cancel()
+                        await asyncio.gather(reader, waiter, return_exceptions=True)
+                    if changed.is_set():
+                        continue
+                    reader.result()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("binance %s market data stream error: %s", market, exc)
+            await asyncio.sleep(self.reconnect_delay_sec)
+
+    async def _read(self, ws: Any, market: str) -> None:
+        async for message in ws:
+            self.cache.apply_message(market, json.loads(message))
+
+    async def run(self) -> None:
+        await asyncio.gather(self.run_market("spot"), self.run_market("perp"))
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections.abc import Awaitable, Callable, Mapping
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_ORDER = 0
+PRIORITY_ACCOUNT = 1
+PRIORITY_BACKGROUND = 2
+
+_INTERVAL_SEC = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+# Request weights for the endpoints the adapter calls; anything else counts as 1.
+REQUEST_WEIGHTS: dict[tuple[str, str], int] = {
+    ("GET", "/api/v3/account"): 20,
+    ("GET", "/api/v3/exchangeInfo"): 20,
+    ("GET", "/api/v3/ticker/price"): 4,
+    ("GET", "/fapi/v1/exchangeInfo"): 1,
+    ("GET", "/fapi/v1/ticker/price"): 1,
+    ("POST", "/fapi/v1/batchOrders"): 5,
+    ("GET", "/fapi/v2/positionRisk"): 5,
+    ("GET", "/fapi/v2/account"): 5,
+}
+
+
+class RateLimitExceeded(RuntimeError):
+    pass
+
+
+def _interval_seconds(interval: str) -> int:
+    interval = interval.lower()
+    return int(interval[:-1]) * _INTERVAL_SEC[interval[-1]]
+
+
+class BinanceRateLimiter:
+    def __init__(
+        self,
+        weight_limits: Mapping[str, int],
+        order_limits: Mapping[str, int],
+        priority_ceilings: Mapping[int, float] | None = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        self.weight_limits = {k.lower(): v for k, v in weight_limits.items()}
+        self.order_limits = {k.lower(): v for k, v in order_limits.items()}
+        # Share of each limit a priority class may consume; the rest is reserved for higher priorities.
+        self.priority_ceilings = dict(priority_ceilings or {PRIORITY_ORDER: 1.0, PRIORITY_ACCOUNT: 0.8, PRIORITY_BACKGROUND: 0.6})
+        self._clock = clock
+        self._sleep = sleep
+        self._weight: dict[str, tuple[int, int]] = {}
+        self._orders: dict[str, tuple[int, int]] = {}
+        self.banned_until = 0.0
+        self.delayed = 0
+        self.delay_sec_total = 0.0
+
+    def _window(self, interval: str, now: float) -> int:
+        return int(now // _interval_seconds(interval))
+
+    def _used(self, counters: dict[str, tuple[int, int]], interval: str, now: float) -> int:
+        window, used = counters.get(interval, (-1, 0))
+        return used if window == self._window(interval, now) else 0
+
+    def _add(self, counters: dict[str, tuple[int, int]], interval: str, amount: int, now: float) -> None:
+        counters[interval] = (self._window(interval, now), self._used(counters, interval, now) + amount)
+
+    def _wait_sec(self, priority: int, weight: int, is_order: bool, now: float, order_count: int = 1) -> float:
+        ceiling = self.priority_ceilings.get(priority, min(self.priority_ceilings.values()))
+        wait = 0.0
+        for interval, limit in self.weight_limits.items():
+            if self._used(self._weight, interval, now) + weight > limit * ceiling:
+                span = _interval_seconds(interval)
+                wait = max(wait, (math.floor(now / span) + 1) * span - now)
+        if is_order:
+            for interval, limit in self.order_limits.items():
+                if self._used(self._orders, interval, now) + order_count > limit * ceiling:
+                    span = _interval_seconds(interval)
+                    wait = max(wait, (math.floor(now / span) + 1) * span - now)
+        return wait
+
+    async def acquire(
+        self, priority: int = PRIORITY_ACCOUNT, weight: int = 1, is_order: bool = False, order_count: int = 1
+    ) -> None:
+        while True:
+            now = self._clock()
+            if self.banned_until > now:
+                wait = self.banned_until - now
+                reason = f"Binance rate limit ban active for {wait:.1f}s"
+            else:
+                wait = self._wait_sec(priority, weight, is_order, now, order_count)
+                reason = "Binance rate limit reached for the current window"
+            if wait <= 0:
+                break
+            # Orders fail fast instead of queueing behind a window reset; everything else waits for headroom.
+            if priority == PRIORITY_ORDER:
+                raise RateLimitExceeded(reason)
+            self.delayed += 1
+            self.delay_sec_total += wait
+            logger.info("binance rate limiter delaying priority=%s request by %.2fs", priority, wait)
+            await self._sleep(wait)
+
+        now = self._clock()
+        for interval in self.weight_limits:
+            self._add(self._weight, interval, weight, now)
+        if is_order:
+            for interval in self.order_limits:
+                self._add(self._orders, interval, order_count, now)
+
+    def update(self, headers: Mapping[str, str], status_code: int = 200) -> None:
+        now = self._clock()
+        for name, value in headers.items():
+            lowered = name.lower()
+            if lowered.startswith("x-mbx-used-weight-"):
+                counters, interval = self._weight, lowered.rsplit("-", 1)[1]
+            elif lowered.startswith("x-mbx-order-count-"):
+                counters, interval = self._orders, lowered.rsplit("-", 1)[1]
+            else:
+                continue
+            try:
+                # The exchange's count is authoritative and replaces the local estimate for this window.
+                counters[interval] = (self._window(interval, now), int(value))
+            except (KeyError, ValueError):
+                continue
+        if status_code in (418, 429):
+            retry_after = headers.get("Retry-After") or headers.get("retry-after")
+            try:
+                delay = float(retry_after) if retry_after is not None else 60.0
+            except ValueError:
+                delay = 60.0
+            self.banned_until = max(self.banned_until, now + delay)
+            logger.warning("binance returned %s; backing off for %.0fs", status_code, delay)
+
+    def metrics(self) -> dict:
+        now = self._clock()
+        weight = {
+            interval: {
+                "used": self._used(self._weight, interval, now),
+                "limit": limit,
+                "headroom_pct": max(0.0, 1 - self._used(self._weight, interval, now) / limit) if limit else 0.0,
+            }
+            for interval, limit in self.weight_limits.items()
+        }
+        orders = {
+            interval: {"used": self._used(self._orders, interval, now), "limit": limit}
+            for interval, limit in self.order_limits.items()
+        }
+        return {
+            "weight": weight,
+            "orders": orders,
+            "banned_for_sec": max(0.0, self.banned_until - now),
+            "delayed": self.delayed,
+            "delay_sec_total": self.delay_sec_total,
+        }
+
+
+def spot_rate_limiter(**kwargs) -> BinanceRateLimiter:
+    return BinanceRateLimiter(weight_limits={"1m": 6000}, order_limits={"10s": 100, "1d": 200_000}, **kwargs)
+
+
+def perp_rate_limiter(**kwargs) -> BinanceRateLimiter:
+    return BinanceRateLimiter(weight_limits={"1m": 2400}, order_limits={"10s": 300, "1m": 1200}, **kwargs)
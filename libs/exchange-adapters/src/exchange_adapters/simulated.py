@@ -1,64 +1,270 @@
 from __future__ import annotations
 
+import asyncio
+import itertools
+import math
+import random
+import time
+from collections.abc import Callable
 from datetime import datetime, timezone
-from random import uniform
 from uuid import uuid4
 
 from common_types.models import ExecutionReport, OrderIntent
 
 from .base import ExchangeAdapter
 
+DEFAULT_BASE_PRICES: dict[str, float] = {
+    "BTCUSDT": 65000.0,
+    "ETHUSDT": 3200.0,
+    "BNBUSDT": 580.0,
+    "SOLUSDT": 140.0,
+    "XRPUSDT": 0.62,
+    "ADAUSDT": 0.47,
+    "DOGEUSDT": 0.12,
+    "LINKUSDT": 19.0,
+    "AVAXUSDT": 34.0,
+    "TONUSDT": 6.8,
+}
+# Remainders below this fraction of the order size are rounding noise, not unfilled quantity.
+_DUST = 1e-9
+
+
+class SimulatedBook:
+    __slots__ = ("mid", "ts", "ask_used", "bid_used", "resting")
+
+    def __init__(self, mid: float, ts: float):
+        self.mid = mid
+        self.ts = ts
+        # Base quantity taken from the top of each side; it regenerates as the book refills.
+        self.ask_used = 0.0
+        self.bid_used = 0.0
+        self.resting: list[RestingOrder] = []
+
+
+class RestingOrder:
+    __slots__ = ("order_id", "intent_id", "symbol", "market", "side", "limit", "remaining", "filled", "notional", "expires_at")
+
+    def __init__(self, order_id: str, intent: OrderIntent, limit: float, remaining: float, filled: float, notional: float, expires_at: float):
+        self.order_id = order_id
+        self.intent_id = intent.intent_id
+        self.symbol = intent.symbol
+        self.market = intent.market
+        self.side = intent.side
+        self.limit = limit
+        self.remaining = remaining
+        self.filled = filled
+        self.notional = notional
+        self.expires_at = expires_at
+
 
 class SimulatedExchangeAdapter(ExchangeAdapter):
-    def __init__(self):
-        self._base_prices: dict[str, float] = {
-            "BTCUSDT": 65000.0,
-            "ETHUSDT": 3200.0,
-            "BNBUSDT": 580.0,
-            "SOLUSDT": 140.0,
-            "XRPUSDT": 0.62,
-            "ADAUSDT": 0.47,
-            "DOGEUSDT": 0.12,
-            "LINKUSDT": 19.0,
-            "AVAXUSDT": 34.0,
-            "TONUSDT": 6.8,
-        }
+    def __init__(
+        self,
+        base_prices: dict[str, float] | None = None,
+        seed: int | None = None,
+        latency_ms: float = 0.0,
+        latency_jitter_ms: float = 0.0,
+        fee_bps: float = 4.0,
+        half_spread_bps: float = 1.0,
+        level_step_bps: float = 1.0,
+        level_depth_usd: float = 250_000.0,
+        book_levels: int = 20,
+        volatility_bps: float = 1.0,
+        resilience_sec: float = 1.0,
+        rest_ttl_sec: float = 30.0,
+        poll_interval_sec: float = 0.05,
+        max_pending_events: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._base_prices = dict(base_prices if base_prices is not None else DEFAULT_BASE_PRICES)
+        self._rng = random.Random(seed)
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.fee_rate = fee_bps / 10_000
+        self.half_spread = half_spread_bps / 10_000
+        self.level_step = level_step_bps / 10_000
+        self.level_depth_usd = level_depth_usd
+        self.book_levels = max(1, book_levels)
+        # Random-walk volatility of the mid, as a fraction per sqrt(second).
+        self.volatility = volatility_bps / 10_000
+        self.resilience_sec = max(resilience_sec, 1e-9)
+        self.rest_ttl_sec = rest_ttl_sec
+        self.poll_interval_sec = poll_interval_sec
+        self._clock = clock
+        self._books: dict[str, SimulatedBook] = {}
+        self._resting_symbols: set[str] = set()
         self._positions: dict[tuple[str, str], float] = {}
+        self._order_prefix = f"paper-{uuid4().hex[:8]}"
+        self._order_seq = itertools.count(1)
+        self._events: asyncio.Queue[dict] = asyncio.Queue(maxsize=max_pending_events)
+        self.dropped_events = 0
+
+    def _book(self, symbol: str, now: float) -> SimulatedBook:
+        book = self._books.get(symbol)
+        if book is None:
+            book = SimulatedBook(self._base_prices.get(symbol, 10.0), now)
+            self._books[symbol] = book
+            return book
+        dt = now - book.ts
+        if dt > 0:
+            # Advanced lazily, so idle symbols cost nothing until they are traded or valued again.
+            if self.volatility > 0:
+                book.mid *= math.exp(self.volatility * math.sqrt(dt) * self._rng.gauss(0.0, 1.0))
+            refill = math.exp(-dt / self.resilience_sec)
+            book.ask_used *= refill
+            book.bid_used *= refill
+            book.ts = now
+        return book
+
+    def update_price(self, symbol: str, price: float, now: float | None = None) -> None:
+        book = self._book(symbol, self._clock() if now is None else now)
+        book.mid = price
 
-    def _get_price(self, symbol: str) -> float:
-        base = self._base_prices.get(symbol, 10.0)
-        return max(0.0001, base * (1 + uniform(-0.0015, 0.0015)))
+    def mid_price(self, symbol: str) -> float:
+        return self._book(symbol, self._clock()).mid
+
+    def _sweep(self, book: SimulatedBook, side: int, qty: float, limit: float) -> tuple[float, float]:
+        mid = book.mid
+        level_qty = self.level_depth_usd / mid
+        used = book.ask_used if side > 0 else book.bid_used
+        level = int(used // level_qty)
+        available = (level + 1) * level_qty - used
+        filled = 0.0
+        notional = 0.0
+        while qty - filled > qty * _DUST and level < self.book_levels:
+            price = mid * (1 + side * (self.half_spread + level * self.level_step))
+            if (price - limit) * side > 0:
+                break
+            take = min(available, qty - filled)
+            filled += take
+            notional += take * price
+            level += 1
+            available = level_qty
+        if side > 0:
+            book.ask_used = used + filled
+        else:
+            book.bid_used = used + filled
+        return filled, notional
+
+    def _book_fill(self, market: str, symbol: str, side: int, qty: float) -> None:
+        key = (market, symbol)
+        self._positions[key] = self._positions.get(key, 0.0) + (qty if side > 0 else -qty)
+
+    def _emit(self, order: RestingOrder, status: str) -> None:
+        event = {
+            "event_type": "execution",
+            "order_id": order.order_id,
+            "intent_id": order.intent_id,
+            "symbol": order.symbol,
+            "market": order.market,
+            "side": order.side,
+            "status": status,
+            "filled_qty": order.filled,
+            "avg_price": order.notional / order.filled if order.filled > 0 else 0.0,
+            "fee": order.notional * self.fee_rate,
+            "ts": datetime.now(timezone.utc).isoformat(),
+        }
+        try:
+            self._events.put_nowait(event)
+        except asyncio.QueueFull:
+            self.dropped_events += 1
+
+    def _match_resting(self, book: SimulatedBook, now: float) -> None:
+        # Resting remainders keep time priority among themselves and take liquidity as the book refills.
+        still_resting = []
+        for order in book.resting:
+            filled, notional = self._sweep(book, order.side, order.remaining, order.limit)
+            if filled > 0:
+                order.filled += filled
+                order.notional += notional
+                order.remaining -= filled
+                self._book_fill(order.market, order.symbol, order.side, filled)
+            if order.remaining <= (order.filled + order.remaining) * _DUST:
+                self._emit(order, "filled")
+            elif now >= order.expires_at:
+                self._emit(order, "canceled")
+            else:
+                if filled > 0:
+                    self._emit(order, "partially_filled")
+                still_resting.append(order)
+        book.resting = still_resting
+
+    def poll(self, now: float | None = None) -> int:
+        now = self._clock() if now is None else now
+        pending = 0
+        for symbol in list(self._resting_symbols):
+            book = self._book(symbol, now)
+            self._match_resting(book, now)
+            if book.resting:
+                pending += len(book.resting)
+            else:
+                self._resting_symbols.discard(symbol)
+        return pending
+
+    async def _round_trip(self) -> None:
+        if self.latency_ms > 0 or self.latency_jitter_ms > 0:
+            jitter = self._rng.uniform(-self.latency_jitter_ms, self.latency_jitter_ms) if self.latency_jitter_ms else 0.0
+            await asyncio.sleep(max(0.0, self.latency_ms + jitter) / 1000)
 
     async def place_order(self, intent: OrderIntent) -> ExecutionReport:
-        px = self._get_price(intent.symbol)
-        qty = intent.qty_usd / px
-        fee = intent.qty_usd * 0.0004
+        await self._round_trip()
+        return self._execute(intent)
+
+    async def place_orders(self, intents: list[OrderIntent]) -> list[ExecutionReport | Exception]:
+        # One round trip for the whole batch, matched in submission order like a batch endpoint.
+        await self._round_trip()
+        return [self._execute(intent) for intent in intents]
+
+    def _execute(self, intent: OrderIntent) -> ExecutionReport:
+        now = self._clock()
+        book = self._book(intent.symbol, now)
+        if book.resting:
+            self._match_resting(book, now)
+        side = 1 if intent.side > 0 else -1
+        qty = intent.qty_usd / book.mid
+        # max_slippage_bps acts as the protection price; liquidity beyond it is waited for, not swept.
+        limit = book.mid * (1 + side * intent.max_slippage_bps / 10_000)
+        queued_behind = any(order.side == side for order in book.resting)
+        filled, notional = (0.0, 0.0) if queued_behind else self._sweep(book, side, qty, limit)
+        if filled > 0:
+            self._book_fill(intent.market, intent.symbol, side, filled)
 
-        key = (intent.market, intent.symbol)
-        signed_qty = qty if intent.side > 0 else -qty
-        self._positions[key] = self._positions.get(key, 0.0) + signed_qty
+        order_id = f"{self._order_prefix}-{next(self._order_seq)}"
+        remaining = qty - filled
+        if remaining <= qty * _DUST:
+            status = "filled"
+        else:
+            status = "partially_filled" if filled > 0 else "new"
+            book.resting.append(RestingOrder(order_id, intent, limit, remaining, filled, notional, now + self.rest_ttl_sec))
+            self._resting_symbols.add(intent.symbol)
 
         return ExecutionReport(
-            order_id=f"paper-{uuid4().hex[:16]}",
+            order_id=order_id,
             intent_id=intent.intent_id,
             symbol=intent.symbol,
             market=intent.market,
             side=intent.side,
-            status="filled",
-            filled_qty=qty,
-            avg_price=px,
-            fee=fee,
+            status=status,
+            filled_qty=filled,
+            avg_price=notional / filled if filled > 0 else 0.0,
+            fee=notional * self.fee_rate,
             ts=datetime.now(timezone.utc),
         )
 
     async def cancel_order(self, order_id: str) -> bool:
-        del order_id
-        return True
+        for book in self._books.values():
+            for order in book.resting:
+                if order.order_id == order_id:
+                    book.resting.remove(order)
+                    self._emit(order, "canceled")
+                    return True
+        return False
 
     async def fetch_positions(self) -> list[dict]:
+        now = self._clock()
         out = []
         for (market, symbol), qty in self._positions.items():
-            px = self._base_prices.get(symbol, 10.0)
+            px = self._book(symbol, now).mid
             out.append(
                 {
                     "market": market,
@@ -70,5 +276,11 @@ class SimulatedExchangeAdapter(ExchangeAdapter):
         return out
 
     async def stream_execution_events(self):
-        if False:
-            yield {}
+        while True:
+            if self._events.empty():
+                self.poll()
+            try:
+                event = await asyncio.wait_for(self._events.get(), timeout=self.poll_interval_sec)
+            except asyncio.TimeoutError:
+                continue
+            yield event
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+import time
+from datetime import datetime, timezone
+
+from common_types.models import ExecutionReport
+
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None
+
+loads = orjson.loads if orjson is not None else json.loads
+
+LISTEN_KEY_EXPIRED = "listenKeyExpired"
+EXECUTION_EVENTS = {"spot": "executionReport", "perp": "ORDER_TRADE_UPDATE"}
+ACCOUNT_EVENTS = {"spot": "outboundAccountPosition", "perp": "ACCOUNT_UPDATE"}
+QUOTE_ASSETS = {"USDT", "BUSD", "USDC"}
+
+
+def _markers(events: dict[str, str]) -> dict[str, tuple]:
+    # Event names as they appear quoted in the raw frame; frames without one are dropped undecoded.
+    return {
+        market: (f'"{name}"', f'"{name}"'.encode(), f'"{LISTEN_KEY_EXPIRED}"', f'"{LISTEN_KEY_EXPIRED}"'.encode())
+        for market, name in events.items()
+    }
+
+
+_MARKERS = _markers(EXECUTION_EVENTS)
+_ACCOUNT_MARKERS = _markers(ACCOUNT_EVENTS)
+_STATUSES = {
+    "new": "new",
+    "partially_filled": "partially_filled",
+    "filled": "filled",
+    "rejected": "rejected",
+    "canceled": "canceled",
+    "cancelled": "canceled",
+    "expired": "canceled",
+}
+
+
+def parse_status(status: str) -> str:
+    return _STATUSES.get(status.lower(), "new")
+
+
+def _event_time(ms: object) -> datetime:
+    return datetime.fromtimestamp((int(ms) if ms else time.time() * 1000) / 1000, tz=timezone.utc)
+
+
+def execution_report(market: str, data: dict) -> ExecutionReport | None:
+    if data.get("e") != EXECUTION_EVENTS[market]:
+        return None
+    if market == "spot":
+        order = data
+        filled_qty = float(order.get("z") or 0.0)
+        avg_price = float(order.get("Z") or 0.0) / filled_qty if filled_qty > 0 else 0.0
+    else:
+        order = data.get("o", {})
+        filled_qty = float(order.get("z") or 0.0)
+        avg_price = float(order.get("ap") or 0.0)
+    # Typed fields validate in the core without the ISO-string round trip; model_construct is slower in pydantic 2.
+    return ExecutionReport(
+        order_id=f"{market}:{order.get('s')}:{order.get('i')}",
+        intent_id=str(order.get("c", "")),
+        symbol=order.get("s"),
+        market=market,
+        side=1 if order.get("S") == "BUY" else -1,
+        status=parse_status(str(order.get("X", "new"))),
+        filled_qty=filled_qty,
+        avg_price=avg_price,
+        fee=0.0,
+        ts=_event_time(data.get("E")),
+    )
+
+
+def account_update(market: str, data: dict) -> dict | None:
+    if data.get("e") != ACCOUNT_EVENTS[market]:
+        return None
+    positions = []
+    if market == "spot":
+        # Balances changed by the event; quote assets are cash, not positions, as in fetch_positions.
+        for bal in data.get("B", []):
+            asset = str(bal.get("a", "")).upper()
+            if asset and asset not in QUOTE_ASSETS:
+                qty = float(bal.get("f") or 0.0) + float(bal.get("l") or 0.0)
+                positions.append({"market": "spot", "symbol": f"{asset}USDT", "qty": qty})
+    else:
+        # Only positions the event touched are listed. Entry notional plus unrealized PnL is the notional at mark.
+        for pos in data.get("a", {}).get("P", []):
+            qty = float(pos.get("pa") or 0.0)
+            notional = qty * float(pos.get("ep") or 0.0) + float(pos.get("up") or 0.0)
+            positions.append({"market": "perp", "symbol": pos.get("s"), "qty": qty, "notional_usd": abs(notional)})
+    return {"event_type": "account", "market": market, "event_ms": int(data.get("E") or 0), "positions": positions}
+
+
+def _decode(markers: dict[str, tuple], decode, market: str, frame: str | bytes):
+    event_text, event_bytes, expired_text, expired_bytes = markers[market]
+    is_bytes = isinstance(frame, (bytes, bytearray))
+    if (event_bytes if is_bytes else event_text) in frame:
+        return decode(market, loads(frame))
+    if (expired_bytes if is_bytes else expired_text) in frame and loads(frame).get("e") == LISTEN_KEY_EXPIRED:
+        return LISTEN_KEY_EXPIRED
+    return None
+
+
+def decode_user_data_frame(market: str, frame: str | bytes) -> ExecutionReport | str | None:
+    return _decode(_MARKERS, execution_report, market, frame)
+
+
+def decode_account_frame(market: str, frame: str | bytes) -> dict | str | None:
+    return _decode(_ACCOUNT_MARKERS, account_update, market, frame)
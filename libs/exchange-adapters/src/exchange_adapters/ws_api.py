@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import itertools
+import json
+import logging
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+SPOT_WS_API_URL = {True: "wss://ws-api.testnet.binance.vision/ws-api/v3", False: "wss://ws-api.binance.com:443/ws-api/v3"}
+PERP_WS_API_URL = {True: "wss://testnet.binancefuture.com/ws-fapi/v1", False: "wss://ws-fapi.binance.com/ws-fapi/v1"}
+
+_RATE_LIMIT_INTERVALS = {"SECOND": "s", "MINUTE": "m", "HOUR": "h", "DAY": "d"}
+
+
+class WsApiUnavailable(ConnectionError):
+    pass
+
+
+class BinanceWsApiError(RuntimeError):
+    def __init__(self, status: int, code: int | None, message: str):
+        super().__init__(f"Binance WebSocket API error status={status} code={code}: {message}")
+        self.status = status
+        self.code = code
+
+
+def rate_limit_headers(rate_limits: list[dict]) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    for item in rate_limits or []:
+        suffix = _RATE_LIMIT_INTERVALS.get(str(item.get("interval", "")).upper())
+        if suffix is None:
+            continue
+        interval = f"{item.get('intervalNum', 1)}{suffix}"
+        if item.get("rateLimitType") == "REQUEST_WEIGHT":
+            headers[f"x-mbx-used-weight-{interval}"] = str(item.get("count", 0))
+        elif item.get("rateLimitType") == "ORDERS":
+            headers[f"x-mbx-order-count-{interval}"] = str(item.get("count", 0))
+    return headers
+
+
+class BinanceWsApiClient:
+    def __init__(
+        self,
+        url: str,
+        api_key: str,
+        sign: Callable[[str], str],
+        timestamp_ms: Callable[[], int],
+        recv_window_ms: int = 5000,
+        request_timeout_sec: float = 5.0,
+        on_rate_limits: Callable[[dict[str, str], int], None] | None = None,
+    ):
+        self.url = url
+        self.api_key = api_key
+        self._sign = sign
+        self._timestamp_ms = timestamp_ms
+        self.recv_window_ms = recv_window_ms
+        self.request_timeout_sec = request_timeout_sec
+        self._on_rate_limits = on_rate_limits
+        self._ws = None
+        self._reader: asyncio.Task | None = None
+        self._pending: dict[str, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+        self._connect_lock = asyncio.Lock()
+        self.reconnects = 0
+
+    @property
+    def connected(self) -> bool:
+        return self._ws is not None and self._reader is not None and not self._reader.done()
+
+    async def connect(self) -> None:
+        if self.connected:
+            return
+        async with self._connect_lock:
+            if self.connected:
+                return
+            try:
+                import websockets
+            except ModuleNotFoundError as exc:
+                raise RuntimeError("websockets package is required for the Binance WebSocket API transport") from exc
+            try:
+                self._ws = await asyncio.wait_for(
+                    websockets.connect(self.url, ping_interval=20, ping_timeout=20, close_timeout=2),
+                    timeout=self.request_timeout_sec,
+                )
+            except Exception as exc:
+                self._ws = None
+                raise WsApiUnavailable(f"cannot connect to {self.url}: {exc}") from exc
+            if self._reader is not None:
+                self.reconnects += 1
+            self._reader = asyncio.create_task(self._read_loop(self._ws))
+
+    async def _read_loop(self, ws) -> None:
+        try:
+            async for message in ws:
+                data = json.loads(message)
+                future = self._pending.pop(str(data.get("id")), None)
+                if future is not None and not future.done():
+                    future.set_result(data)
+        except Exception as exc:
+            logger.warning("binance websocket api connection lost: %s", exc)
+        finally:
+            # Requests already on the wire have an unknown outcome; surface that rather than guessing.
+            pending, self._pending = self._pending, {}
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("WebSocket API connection closed before response"))
+
+    def _signed_params(self, params: dict[str, Any]) -> dict[str, Any]:
+        signed = {k: v for k, v in params.items() if v is not None}
+        signed["apiKey"] = self.api_key
+        signed["timestamp"] = self._timestamp_ms()
+        signed["recvWindow"] = self.recv_window_ms
+        payload = "&".join(f"{key}={signed[key]}" for key in sorted(signed))
+        signed["signature"] = self._sign(payload)
+        return signed
+
+    async def request(self, method: str, params: dict[str, Any] | None = None, signed: bool = True) -> Any:
+        await self.connect()
+        request_id = str(next(self._ids))
+        body = {"id": request_id, "method": method, "params": self._signed_params(params or {}) if signed else params or {}}
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            await self._ws.send(json.dumps(body))
+        except Exception as exc:
+            self._pending.pop(request_id, None)
+            raise WsApiUnavailable(f"send failed: {exc}") from exc
+
+        try:
+            response = await asyncio.wait_for(future, timeout=self.request_timeout_sec)
+        finally:
+            self._pending.pop(request_id, None)
+
+        status = int(response.get("status", 200))
+        if self._on_rate_limits is not None and response.get("rateLimits"):
+            self._on_rate_limits(rate_limit_headers(response["rateLimits"]), status)
+        if status != 200:
+            error = response.get("error") or {}
+            raise BinanceWsApiError(status, error.get("code"), str(error.get("msg", "")))
+        return response.get("result")
+
+    async def close(self) -> None:
+        if self._ws is not None:
+            await self._ws.close()
+        if self._reader is not None:
+            self._reader.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._reader
+        self._ws = None
@@ -1,11 +1,32 @@
 from .dedup import DedupStore, MemoryDedupStore, RedisDedupStore
-from .state import MemoryTradingStateStore, RedisTradingStateStore, TradingStateStore
+from .fusion import (
+    ConsistentHashRing,
+    FusionBook,
+    FusionStateStore,
+    FusionView,
+    MemoryFusionStateStore,
+    RedisFusionStateStore,
+    SignalRingBuffer,
+)
+from .state import ExposureView, MemoryTradingStateStore, RedisTradingStateStore, TradingStateStore
+from .universe import MemoryUniverseStore, RedisUniverseStore, UniverseStore
 
 __all__ = [
     "DedupStore",
     "MemoryDedupStore",
     "RedisDedupStore",
+    "FusionBook",
+    "SignalRingBuffer",
+    "FusionView",
+    "FusionStateStore",
+    "MemoryFusionStateStore",
+    "RedisFusionStateStore",
+    "ConsistentHashRing",
+    "ExposureView",
     "TradingStateStore",
     "MemoryTradingStateStore",
     "RedisTradingStateStore",
+    "UniverseStore",
+    "MemoryUniverseStore",
+    "RedisUniverseStore",
 ]
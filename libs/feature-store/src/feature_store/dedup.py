@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 
 try:
     from redis import asyncio as redis
@@ -14,28 +15,73 @@ class DedupStore(ABC):
     async def seen_or_add(self, key: str, ttl_sec: int) -> bool:
         raise NotImplementedError
 
+    async def seen_or_add_many(self, keys: list[str], ttl_sec: int) -> list[bool]:
+        return [await self.seen_or_add(key, ttl_sec) for key in keys]
+
+    @abstractmethod
+    async def discard(self, key: str) -> None:
+        raise NotImplementedError
+
 
 class MemoryDedupStore(DedupStore):
-    def __init__(self):
-        self._items: dict[str, float] = {}
+    def __init__(self, max_items: int = 100_000):
+        self.max_items = max(1, max_items)
+        # Least recently seen first, so both expired and overflow entries are evicted from the front.
+        self._items: OrderedDict[str, float] = OrderedDict()
 
-    async def seen_or_add(self, key: str, ttl_sec: int) -> bool:
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def seen_or_add_nowait(self, key: str, ttl_sec: int) -> bool:
         now = time.time()
         expiry = self._items.get(key)
         if expiry and expiry > now:
+            self._items.move_to_end(key)
             return True
         self._items[key] = now + ttl_sec
+        self._items.move_to_end(key)
+        self._evict(now)
         return False
 
+    def _evict(self, now: float) -> None:
+        items = self._items
+        while items:
+            key, expiry = next(iter(items.items()))
+            if expiry > now and len(items) <= self.max_items:
+                break
+            del items[key]
+
+    async def seen_or_add(self, key: str, ttl_sec: int) -> bool:
+        return self.seen_or_add_nowait(key, ttl_sec)
+
+    async def seen_or_add_many(self, keys: list[str], ttl_sec: int) -> list[bool]:
+        return [self.seen_or_add_nowait(key, ttl_sec) for key in keys]
+
+    async def discard(self, key: str) -> None:
+        self._items.pop(key, None)
+
 
 class RedisDedupStore(DedupStore):
-    def __init__(self, redis_url: str, namespace: str = "dedup"):
-        if redis is None:
-            raise RuntimeError("redis package is not installed. Install project dependencies or use memory dedup store.")
-        self._client = redis.from_url(redis_url, decode_responses=True)
+    def __init__(self, redis_url: str, namespace: str = "dedup", client=None):
+        if client is None:
+            if redis is None:
+                raise RuntimeError("redis package is not installed. Install project dependencies or use memory dedup store.")
+            client = redis.from_url(redis_url, decode_responses=True)
+        self._client = client
         self._namespace = namespace
 
     async def seen_or_add(self, key: str, ttl_sec: int) -> bool:
         namespaced_key = f"{self._namespace}:{key}"
         created = await self._client.set(namespaced_key, "1", ex=ttl_sec, nx=True)
         return created is None
+
+    async def seen_or_add_many(self, keys: list[str], ttl_sec: int) -> list[bool]:
+        if not keys:
+            return []
+        pipe = self._client.pipeline(transaction=False)
+        for key in keys:
+            pipe.set(f"{self._namespace}:{key}", "1", ex=ttl_sec, nx=True)
+        return [created is None for created in await pipe.execute()]
+
+    async def discard(self, key: str) -> None:
+        await self._client.delete(f"{self._namespace}:{key}")
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import bisect
+import hashlib
+import math
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+
+try:
+    from redis import asyncio as redis
+except ModuleNotFoundError:  # pragma: no cover
+    redis = None
+
+
+class SignalRingBuffer:
+    __slots__ = ("capacity", "_ts", "_contrib", "_head", "size", "ref_ts", "net", "gross")
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, capacity)
+        self._ts = [0.0] * self.capacity
+        self._contrib = [0.0] * self.capacity
+        self._head = 0
+        self.size = 0
+        # net/gross are the decayed signed/absolute sums of the buffered contributions as of ref_ts.
+        self.ref_ts = 0.0
+        self.net = 0.0
+        self.gross = 0.0
+
+    def decay_to(self, ts: float, decay_rate: float) -> None:
+        if ts <= self.ref_ts:
+            return
+        factor = math.exp(-decay_rate * (ts - self.ref_ts))
+        self.net *= factor
+        self.gross *= factor
+        self.ref_ts = ts
+
+    def add(self, ts: float, contribution: float, decay_rate: float) -> None:
+        # Out-of-order signals are booked at the buffer's reference time instead of being "un-decayed".
+        if self.size == 0:
+            self.ref_ts = ts
+        self.decay_to(ts, decay_rate)
+        ts = self.ref_ts
+
+        if self.size == self.capacity:
+            oldest = self._contrib[self._head]
+            factor = math.exp(-decay_rate * (ts - self._ts[self._head]))
+            self.net -= oldest * factor
+            self.gross -= abs(oldest) * factor
+        else:
+            self.size += 1
+
+        self._ts[self._head] = ts
+        self._contrib[self._head] = contribution
+        self._head = (self._head + 1) % self.capacity
+        self.net += contribution
+        self.gross += abs(contribution)
+
+    def net_at(self, ts: float, decay_rate: float) -> float:
+        if ts <= self.ref_ts:
+            return self.net
+        return self.net * math.exp(-decay_rate * (ts - self.ref_ts))
+
+
+class FusionBook:
+    def __init__(self, capacity: int = 32, half_life_sec: float = 1800.0, evict_epsilon: float = 1e-3):
+        self.capacity = capacity
+        self.decay_rate = math.log(2) / max(half_life_sec, 1e-9)
+        self.evict_epsilon = evict_epsilon
+        # Ordered by last update so the least recently touched symbols are checked for eviction first.
+        self._buffers: OrderedDict[str, SignalRingBuffer] = OrderedDict()
+        self._clock = 0.0
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._buffers
+
+    def update(self, symbol: str, ts: float, contribution: float) -> SignalRingBuffer:
+        self._clock = max(self._clock, ts)
+        buffer = self._buffers.get(symbol)
+        if buffer is None:
+            buffer = SignalRingBuffer(self.capacity)
+            self._buffers[symbol] = buffer
+        else:
+            self._buffers.move_to_end(symbol)
+        buffer.add(ts, contribution, self.decay_rate)
+        self.evict_decayed(self._clock)
+        return buffer
+
+    def get(self, symbol: str) -> SignalRingBuffer | None:
+        return self._buffers.get(symbol)
+
+    def evict_decayed(self, now: float) -> int:
+        evicted = 0
+        while self._buffers:
+            symbol, buffer = next(iter(self._buffers.items()))
+            if abs(buffer.gross) * math.exp(-self.decay_rate * max(0.0, now - buffer.ref_ts)) >= self.evict_epsilon:
+                break
+            del self._buffers[symbol]
+            evicted += 1
+        return evicted
+
+
+@dataclass
+class FusionView:
+    net: float
+    gross: float
+    size: int
+
+
+class FusionStateStore(ABC):
+    @abstractmethod
+    async def update(self, symbol: str, ts: float, contribution: float) -> FusionView:
+        raise NotImplementedError
+
+
+class MemoryFusionStateStore(FusionStateStore):
+    def __init__(self, capacity: int = 32, half_life_sec: float = 1800.0, evict_epsilon: float = 1e-3):
+        self.book = FusionBook(capacity=capacity, half_life_sec=half_life_sec, evict_epsilon=evict_epsilon)
+
+    async def update(self, symbol: str, ts: float, contribution: float) -> FusionView:
+        buffer = self.book.update(symbol, ts, contribution)
+        return FusionView(net=buffer.net, gross=buffer.gross, size=buffer.size)
+
+
+# Same arithmetic as SignalRingBuffer.add, executed atomically per symbol hash.
+_UPDATE_SCRIPT = """
+local key = KEYS[1]
+local ts = tonumber(ARGV[1])
+local contribution = tonumber(ARGV[2])
+local capacity = tonumber(ARGV[3])
+local rate = tonumber(ARGV[4])
+local ttl = tonumber(ARGV[5])
+
+local state = redis.call('HMGET', key, 'head', 'size', 'ref_ts', 'net', 'gross')
+local head = tonumber(state[1]) or 0
+local size = tonumber(state[2]) or 0
+local ref = tonumber(state[3]) or ts
+local net = tonumber(state[4]) or 0
+local gross = tonumber(state[5]) or 0
+if size > capacity then
+  size = capacity
+end
+head = head % capacity
+if size == 0 then
+  ref = ts
+end
+if ts > ref then
+  local factor = math.exp(-rate * (ts - ref))
+  net = net * factor
+  gross = gross * factor
+  ref = ts
+end
+
+if size == capacity then
+  local oldest = redis.call('HMGET', key, 't' .. head, 'c' .. head)
+  local old_c = tonumber(oldest[2]) or 0
+  local factor = math.exp(-rate * (ref - (tonumber(oldest[1]) or ref)))
+  net = net - old_c * factor
+  gross = gross - math.abs(old_c) * factor
+else
+  size = size + 1
+end
+
+net = net + contribution
+gross = gross + math.abs(contribution)
+local fmt = '%.17g'
+redis.call('HSET', key,
+  't' .. head, string.format(fmt, ref),
+  'c' .. head, string.format(fmt, contribution),
+  'head', (head + 1) % capacity,
+  'size', size,
+  'ref_ts', string.format(fmt, ref),
+  'net', string.format(fmt, net),
+  'gross', string.format(fmt, gross))
+redis.call('EXPIRE', key, ttl)
+return {string.format(fmt, net), string.format(fmt, gross), size}
+"""
+
+
+class RedisFusionStateStore(FusionStateStore):
+    def __init__(
+        self,
+        redis_url: str,
+        capacity: int = 32,
+        half_life_sec: float = 1800.0,
+        evict_epsilon: float = 1e-3,
+        namespace: str = "fusion",
+        client=None,
+    ):
+        if client is None:
+            if redis is None:
+                raise RuntimeError("redis package is not installed. Install project dependencies or use memory fusion store.")
+            client = redis.from_url(redis_url, decode_responses=True)
+        self._client = client
+        self._namespace = namespace
+        self.capacity = max(1, capacity)
+        self.decay_rate = math.log(2) / max(half_life_sec, 1e-9)
+        # Redis expires a symbol once even a full buffer of max-strength signals would have decayed below epsilon.
+        max_gross = self.capacity * 1.2
+        self._ttl_sec = max(1, math.ceil(math.log(max(max_gross / max(evict_epsilon, 1e-12), 1.0)) / self.decay_rate))
+        self._update = self._client.register_script(_UPDATE_SCRIPT)
+
+    def _symbol_key(self, symbol: str) -> str:
+        # Hash tag keeps each symbol's state in a single cluster slot.
+        return f"{self._namespace}:{{{symbol.upper()}}}"
+
+    async def update(self, symbol: str, ts: float, contribution: float) -> FusionView:
+        net, gross, size = await self._update(
+            keys=[self._symbol_key(symbol)],
+            args=[repr(float(ts)), repr(float(contribution)), self.capacity, repr(self.decay_rate), self._ttl_sec],
+        )
+        return FusionView(net=float(net), gross=float(gross), size=int(size))
+
+
+class ConsistentHashRing:
+    def __init__(self, nodes: list[str], vnodes: int = 64):
+        self.nodes = sorted(set(nodes))
+        self._points: list[int] = []
+        self._owners: list[str] = []
+        ring = sorted((self._hash(f"{node}#{idx}"), node) for node in self.nodes for idx in range(vnodes))
+        for point, node in ring:
+            self._points.append(point)
+            self._owners.append(node)
+
+    @staticmethod
+    def _hash(value: str) -> int:
+        return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+    def owner(self, key: str) -> str:
+        if not self._points:
+            raise ValueError("consistent hash ring has no nodes")
+        idx = bisect.bisect(self._points, self._hash(key)) % len(self._points)
+        return self._owners[idx]
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 
 try:
     from redis import asyncio as redis
@@ -9,6 +11,14 @@ except ModuleNotFoundError:  # pragma: no cover
     redis = None
 
 
+@dataclass
+class ExposureView:
+    symbol: dict[str, float] = field(default_factory=dict)
+    market: dict[str, float] = field(default_factory=dict)
+    side: dict[str, float] = field(default_factory=dict)
+    total: float = 0.0
+
+
 class TradingStateStore(ABC):
     @abstractmethod
     async def get_symbol_exposure(self, symbol: str) -> float:
@@ -53,6 +63,21 @@ class TradingStateStore(ABC):
     ) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_exposure_view(self, symbols: Iterable[str]) -> ExposureView:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def apply_exposure_deltas(
+        self,
+        *,
+        symbol_deltas: dict[str, float],
+        market_deltas: dict[str, float],
+        side_deltas: dict[str, float],
+        total_delta: float,
+    ) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     async def get_daily_realized_pnl(self) -> float:
         raise NotImplementedError
@@ -117,6 +142,30 @@ class MemoryTradingStateStore(TradingStateStore):
         self._side_exposure["short"] = float(side_exposure.get("short", 0.0))
         self._total_exposure = float(total_exposure)
 
+    async def get_exposure_view(self, symbols: Iterable[str]) -> ExposureView:
+        return ExposureView(
+            symbol={symbol.upper(): self._symbol_exposure.get(symbol.upper(), 0.0) for symbol in symbols},
+            market={market: self._market_exposure.get(market, 0.0) for market in ("spot", "perp")},
+            side={side: self._side_exposure.get(side, 0.0) for side in ("long", "short")},
+            total=self._total_exposure,
+        )
+
+    async def apply_exposure_deltas(
+        self,
+        *,
+        symbol_deltas: dict[str, float],
+        market_deltas: dict[str, float],
+        side_deltas: dict[str, float],
+        total_delta: float,
+    ) -> None:
+        for symbol, delta in symbol_deltas.items():
+            self._symbol_exposure[symbol.upper()] += delta
+        for market, delta in market_deltas.items():
+            self._market_exposure[market.lower()] += delta
+        for side, delta in side_deltas.items():
+            self._side_exposure[side] += delta
+        self._total_exposure += total_delta
+
     async def get_daily_realized_pnl(self) -> float:
         return self._daily_realized_pnl
 
@@ -125,10 +174,12 @@ class MemoryTradingStateStore(TradingStateStore):
 
 
 class RedisTradingStateStore(TradingStateStore):
-    def __init__(self, redis_url: str, namespace: str = "state"):
-        if redis is None:
-            raise RuntimeError("redis package is not installed. Install project dependencies or use memory state store.")
-        self._client = redis.from_url(redis_url, decode_responses=True)
+    def __init__(self, redis_url: str, namespace: str = "state", client=None):
+        if client is None:
+            if redis is None:
+                raise RuntimeError("redis package is not installed. Install project dependencies or use memory state store.")
+            client = redis.from_url(redis_url, decode_responses=True)
+        self._client = client
         self._namespace = namespace
 
     def _symbol_key(self, symbol: str) -> str:
@@ -209,6 +260,38 @@ class RedisTradingStateStore(TradingStateStore):
         pipe.set(self._total_key(), str(float(total_exposure)))
         await pipe.execute()
 
+    async def get_exposure_view(self, symbols: Iterable[str]) -> ExposureView:
+        symbols = [symbol.upper() for symbol in symbols]
+        keys = [self._symbol_key(symbol) for symbol in symbols]
+        keys += [self._market_key("spot"), self._market_key("perp"), self._side_key(1), self._side_key(-1), self._total_key()]
+        values = [float(value) if value is not None else 0.0 for value in await self._client.mget(keys)]
+        spot, perp, long, short, total = values[len(symbols) :]
+        return ExposureView(
+            symbol=dict(zip(symbols, values)),
+            market={"spot": spot, "perp": perp},
+            side={"long": long, "short": short},
+            total=total,
+        )
+
+    async def apply_exposure_deltas(
+        self,
+        *,
+        symbol_deltas: dict[str, float],
+        market_deltas: dict[str, float],
+        side_deltas: dict[str, float],
+        total_delta: float,
+    ) -> None:
+        pipe = self._client.pipeline(transaction=False)
+        for symbol, delta in symbol_deltas.items():
+            pipe.incrbyfloat(self._symbol_key(symbol), delta)
+        for market, delta in market_deltas.items():
+            pipe.incrbyfloat(self._market_key(market), delta)
+        for side, delta in side_deltas.items():
+            pipe.incrbyfloat(self._side_key(1 if side == "long" else -1), delta)
+        if total_delta:
+            pipe.incrbyfloat(self._total_key(), total_delta)
+        await pipe.execute()
+
     async def get_daily_realized_pnl(self) -> float:
         value = await self._client.get(self._daily_pnl_key())
         return float(value) if value is not None else 0.0
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+
+from common_types.universe import UniverseSnapshot
+
+try:
+    from redis import asyncio as redis
+except ModuleNotFoundError:  # pragma: no cover
+    redis = None
+
+RUNTIME_CONFIG_KEY = "runtime:config"
+RUNTIME_CONFIG_CHANNEL = "runtime:config"
+UNIVERSE_SNAPSHOT_KEY = "runtime:universe"
+UNIVERSE_MESSAGE_PREFIX = "universe:"
+
+
+class UniverseStore(ABC):
+    @abstractmethod
+    async def load(self) -> UniverseSnapshot | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def publish(self, snapshot: UniverseSnapshot) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def load_whitelist(self) -> set[str] | None:
+        raise NotImplementedError
+
+    # Yields runtime-config channel messages: "universe:<version>" or "config:<field>".
+    @abstractmethod
+    def watch(self) -> AsyncIterator[str]:
+        raise NotImplementedError
+
+    async def watch_snapshots(self) -> AsyncIterator[UniverseSnapshot]:
+        async for message in self.watch():
+            if not message.startswith(UNIVERSE_MESSAGE_PREFIX):
+                continue
+            snapshot = await self.load()
+            if snapshot is not None:
+                yield snapshot
+
+
+def parse_whitelist(raw: str | None) -> set[str] | None:
+    if raw is None:
+        return None
+    return {s.strip().upper() for s in raw.split(",") if s.strip()}
+
+
+class MemoryUniverseStore(UniverseStore):
+    def __init__(self):
+        self._snapshot: UniverseSnapshot | None = None
+        self._whitelist: set[str] | None = None
+        self._subscribers: list[asyncio.Queue[str]] = []
+
+    async def load(self) -> UniverseSnapshot | None:
+        return self._snapshot
+
+    async def publish(self, snapshot: UniverseSnapshot) -> None:
+        self._snapshot = snapshot
+        self._notify(f"{UNIVERSE_MESSAGE_PREFIX}{snapshot.version}")
+
+    async def load_whitelist(self) -> set[str] | None:
+        return self._whitelist
+
+    async def set_whitelist(self, symbols: set[str]) -> None:
+        self._whitelist = {s.upper() for s in symbols}
+        self._notify("config:universe_symbols")
+
+    def _notify(self, message: str) -> None:
+        for queue in self._subscribers:
+            queue.put_nowait(message)
+
+    async def watch(self) -> AsyncIterator[str]:
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        self._subscribers.append(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._subscribers.remove(queue)
+
+
+class RedisUniverseStore(UniverseStore):
+    def __init__(self, redis_url: str):
+        if redis is None:
+            raise RuntimeError("redis package is not installed. Install project dependencies or use memory universe store.")
+        self._client = redis.from_url(redis_url, decode_responses=True)
+
+    async def load(self) -> UniverseSnapshot | None:
+        raw = await self._client.get(UNIVERSE_SNAPSHOT_KEY)
+        if not raw:
+            return None
+        return UniverseSnapshot.model_validate(json.loads(raw))
+
+    async def publish(self, snapshot: UniverseSnapshot) -> None:
+        await self._client.set(UNIVERSE_SNAPSHOT_KEY, json.dumps(snapshot.model_dump(mode="json")))
+        await self._client.publish(RUNTIME_CONFIG_CHANNEL, f"{UNIVERSE_MESSAGE_PREFIX}{snapshot.version}")
+
+    async def load_whitelist(self) -> set[str] | None:
+        return parse_whitelist(await self._client.hget(RUNTIME_CONFIG_KEY, "universe_symbols"))
+
+    async def watch(self) -> AsyncIterator[str]:
+        pubsub = self._client.pubsub()
+        await pubsub.subscribe(RUNTIME_CONFIG_CHANNEL)
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    yield str(message.get("data", ""))
+        finally:
+            await pubsub.unsubscribe(RUNTIME_CONFIG_CHANNEL)
+            await pubsub.aclose()
+
+    async def close(self) -> None:
+        await self._client.aclose()
@@ -5,10 +5,12 @@ import logging
 
 from common_types import AppSettings, Streams, make_bus
 from common_types.logging import configure_logging
-from common_types.worker import run_stream_worker
+from common_types.worker import run_batch_stream_worker, run_stream_worker
 from exchange_adapters import build_exchange_adapter
+from feature_store import MemoryDedupStore, MemoryUniverseStore, RedisDedupStore, RedisUniverseStore
 
 from apps.execution_service import ExecutionService
+from apps.universe_service import follow_universe
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +19,7 @@ async def _pump_exchange_events(bus, service: ExecutionService, adapter) -> None
     try:
         async for event in adapter.stream_execution_events():
             try:
-                if event.get("event_type") == "alert":
+                if isinstance(event, dict) and event.get("event_type") == "alert":
                     await bus.publish(
                         Streams.RISK_ALERT,
                         {
@@ -40,17 +42,64 @@ async def _pump_exchange_events(bus, service: ExecutionService, adapter) -> None
         logger.exception("exchange execution event pump stopped")
 
 
+async def _report_metrics(service: ExecutionService, adapter, interval_sec: float = 30.0) -> None:
+    rate_limit_metrics = getattr(adapter, "rate_limit_metrics", None)
+    while True:
+        await asyncio.sleep(interval_sec)
+        if service.dispatcher is not None:
+            logger.info("execution dispatcher metrics %s", service.metrics())
+        if rate_limit_metrics is not None:
+            logger.info("exchange rate limit metrics %s", rate_limit_metrics())
+        connection_metrics = getattr(adapter, "connection_metrics", None)
+        if connection_metrics is not None:
+            logger.info("exchange connection metrics %s", connection_metrics())
+
+
 async def _main() -> None:
     settings = AppSettings()
     configure_logging(settings.log_level)
 
     bus = make_bus(settings)
     adapter = build_exchange_adapter(settings)
-    service = ExecutionService(adapter)
+    in_memory = settings.bus_backend in {"memory", "inmemory"}
+    dedup = (
+        MemoryDedupStore(max_items=settings.execution_dedup_max_items)
+        if in_memory
+        else RedisDedupStore(settings.redis_url, namespace="execution:dedup")
+    )
+    service = ExecutionService(
+        adapter,
+        dedup=dedup,
+        dedup_ttl_sec=settings.execution_dedup_ttl_sec,
+        dedup_max_items=settings.execution_dedup_max_items,
+        bus=bus,
+        max_concurrency=settings.execution_max_concurrency,
+        max_pending=settings.execution_max_pending,
+    )
 
     try:
-        tasks = [
-            run_stream_worker(
+        warmup = getattr(adapter, "warmup", None)
+        if warmup is not None:
+            # Opens the connection pools and takes the first clock samples before the first order needs them.
+            try:
+                await warmup()
+            except Exception:
+                logger.exception("exchange connection warmup failed; connecting on first use")
+        if settings.execution_batch_max_intents > 1 and service.dispatcher is not None:
+            logger.warning("EXECUTION_MAX_CONCURRENCY>1 dispatches orders one by one; perp intents in a batch are not coalesced")
+        if settings.execution_batch_max_intents > 1:
+            intent_worker = run_batch_stream_worker(
+                service_name="execution-service",
+                bus=bus,
+                input_stream=Streams.ORDER_APPROVED,
+                handler=service.handle_batch,
+                max_batch=settings.execution_batch_max_intents,
+                max_wait_ms=settings.execution_batch_max_wait_ms,
+                poll_ms=settings.service_poll_ms,
+                idle_sleep_sec=settings.service_idle_sleep_sec,
+            )
+        else:
+            intent_worker = run_stream_worker(
                 service_name="execution-service",
                 bus=bus,
                 input_stream=Streams.ORDER_APPROVED,
@@ -58,12 +107,30 @@ async def _main() -> None:
                 poll_ms=settings.service_poll_ms,
                 idle_sleep_sec=settings.service_idle_sleep_sec,
             )
-        ]
+        # Paper mode streams fills too: remainders resting in the simulated book complete asynchronously.
+        tasks = [intent_worker, _pump_exchange_events(bus, service, adapter)]
         if settings.execution_mode.lower() == "live":
-            tasks.append(_pump_exchange_events(bus, service, adapter))
+            run_market_data = getattr(adapter, "run_market_data", None)
+            if run_market_data is not None:
+                tasks.append(run_market_data(settings.universe))
+                # Symbols added to the universe at runtime get cached marks instead of falling back to REST.
+                apply_universe = getattr(adapter, "apply_universe", None)
+                if apply_universe is not None:
+                    universe_store = MemoryUniverseStore() if in_memory else RedisUniverseStore(settings.redis_url)
+                    tasks.append(follow_universe(universe_store, apply_universe))
+            run_rules_refresh = getattr(adapter, "run_rules_refresh", None)
+            if run_rules_refresh is not None:
+                tasks.append(run_rules_refresh())
+            run_connection_keeper = getattr(adapter, "run_connection_keeper", None)
+            if run_connection_keeper is not None:
+                tasks.append(run_connection_keeper())
+        if service.dispatcher is not None or hasattr(adapter, "rate_limit_metrics"):
+            tasks.append(_report_metrics(service, adapter))
 
         await asyncio.gather(*tasks)
     finally:
+        if service.dispatcher is not None:
+            await service.dispatcher.drain()
         close_adapter = getattr(adapter, "close", None)
         if close_adapter is not None:
             await close_adapter()
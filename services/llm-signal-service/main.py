@@ -4,7 +4,7 @@ import asyncio
 
 from common_types import AppSettings, Streams, make_bus
 from common_types.logging import configure_logging
-from common_types.worker import run_stream_worker
+from common_types.worker import run_batch_stream_worker, run_stream_worker
 
 from apps.llm_signal_service import LLMProvider, LLMSignalService
 
@@ -12,20 +12,34 @@ from apps.llm_signal_service import LLMProvider, LLMSignalService
 async def _main() -> None:
     settings = AppSettings()
     configure_logging(settings.log_level)
+    if settings.llm_streaming and settings.llm_batch_max_events > 1:
+        raise RuntimeError("LLM_STREAMING cannot be combined with LLM_BATCH_MAX_EVENTS>1: batch inference does not stream.")
 
     bus = make_bus(settings)
     provider = LLMProvider(settings)
-    service = LLMSignalService(settings, provider)
+    service = LLMSignalService(settings, provider, bus=bus)
 
     try:
-        await run_stream_worker(
-            service_name="llm-signal-service",
-            bus=bus,
-            input_stream=Streams.NEWS_ENTITY,
-            handler=service.handle,
-            poll_ms=settings.service_poll_ms,
-            idle_sleep_sec=settings.service_idle_sleep_sec,
-        )
+        if settings.llm_batch_max_events > 1:
+            await run_batch_stream_worker(
+                service_name="llm-signal-service",
+                bus=bus,
+                input_stream=Streams.NEWS_ENTITY,
+                handler=service.handle_batch,
+                max_batch=settings.llm_batch_max_events,
+                max_wait_ms=settings.llm_batch_max_wait_ms,
+                poll_ms=settings.service_poll_ms,
+                idle_sleep_sec=settings.service_idle_sleep_sec,
+            )
+        else:
+            await run_stream_worker(
+                service_name="llm-signal-service",
+                bus=bus,
+                input_stream=Streams.NEWS_ENTITY,
+                handler=service.handle,
+                poll_ms=settings.service_poll_ms,
+                idle_sleep_sec=settings.service_idle_sleep_sec,
+            )
     finally:
         await bus.close()
 
@@ -24,6 +24,7 @@ STREAMS = [
     Streams.NEWS_RAW,
     Streams.NEWS_ENTITY,
     Streams.SIGNAL_RAW,
+    Streams.SIGNAL_RATIONALE,
     Streams.SIGNAL_TRADEABLE,
     Streams.SIGNAL_UNIVERSE,
     Streams.ORDER_INTENT,
@@ -278,6 +279,8 @@ async def strategy_stop() -> dict:
 async def config_update(req: ConfigUpdate) -> dict:
     if req.values:
         await redis_client.hset("runtime:config", mapping={k: str(v) for k, v in req.values.items()})
+        for key in req.values:
+            await redis_client.publish("runtime:config", f"config:{key}")
     values = await redis_client.hgetall("runtime:config")
     return {"updated": True, "values": values}
 
@@ -4,7 +4,7 @@ import asyncio
 
 from common_types import AppSettings, Streams, make_bus
 from common_types.logging import configure_logging
-from common_types.worker import run_stream_worker
+from common_types.worker import run_batch_stream_worker, run_stream_worker
 
 from apps.portfolio_service import PortfolioService
 
@@ -17,14 +17,26 @@ async def _main() -> None:
     service = PortfolioService(settings)
 
     try:
-        await run_stream_worker(
-            service_name="portfolio-service",
-            bus=bus,
-            input_stream=Streams.SIGNAL_UNIVERSE,
-            handler=service.handle,
-            poll_ms=settings.service_poll_ms,
-            idle_sleep_sec=settings.service_idle_sleep_sec,
-        )
+        if settings.portfolio_batch_max_signals > 1:
+            await run_batch_stream_worker(
+                service_name="portfolio-service",
+                bus=bus,
+                input_stream=Streams.SIGNAL_UNIVERSE,
+                handler=service.handle_batch,
+                max_batch=settings.portfolio_batch_max_signals,
+                max_wait_ms=settings.portfolio_batch_max_wait_ms,
+                poll_ms=settings.service_poll_ms,
+                idle_sleep_sec=settings.service_idle_sleep_sec,
+            )
+        else:
+            await run_stream_worker(
+                service_name="portfolio-service",
+                bus=bus,
+                input_stream=Streams.SIGNAL_UNIVERSE,
+                handler=service.handle,
+                poll_ms=settings.service_poll_ms,
+                idle_sleep_sec=settings.service_idle_sleep_sec,
+            )
     finally:
         await bus.close()
 
@@ -4,9 +4,12 @@ import asyncio
 
 from common_types import AppSettings, Streams, make_bus
 from common_types.logging import configure_logging
-from common_types.worker import run_stream_worker
+from common_types.worker import run_batch_stream_worker, run_stream_worker
+from exchange_adapters import BinanceMarketDataFeed, MarketDataCache
+from feature_store import MemoryUniverseStore, RedisUniverseStore
 
 from apps.position_pnl_service import PositionPnLService
+from apps.universe_service import follow_universe
 
 
 async def _main() -> None:
@@ -14,17 +17,48 @@ async def _main() -> None:
     configure_logging(settings.log_level)
 
     bus = make_bus(settings)
-    service = PositionPnLService()
+    service = PositionPnLService(
+        starting_equity=settings.account_equity_usd,
+        account=settings.execution_mode.lower(),
+        snapshot_interval_sec=settings.pnl_snapshot_interval_sec,
+        drawdown_step=settings.pnl_snapshot_drawdown_step,
+    )
+
+    mark_source = settings.pnl_mark_source.lower()
+    if mark_source == "auto":
+        mark_source = "market_data" if settings.execution_mode.lower() == "live" else "fills"
 
     try:
-        await run_stream_worker(
-            service_name="position-pnl-service",
-            bus=bus,
-            input_stream=Streams.EXECUTION_REPORT,
-            handler=service.handle,
-            poll_ms=settings.service_poll_ms,
-            idle_sleep_sec=settings.service_idle_sleep_sec,
-        )
+        if settings.pnl_batch_max_reports > 1:
+            report_worker = run_batch_stream_worker(
+                service_name="position-pnl-service",
+                bus=bus,
+                input_stream=Streams.EXECUTION_REPORT,
+                handler=service.handle_batch,
+                max_batch=settings.pnl_batch_max_reports,
+                max_wait_ms=settings.pnl_batch_max_wait_ms,
+                poll_ms=settings.service_poll_ms,
+                idle_sleep_sec=settings.service_idle_sleep_sec,
+            )
+        else:
+            report_worker = run_stream_worker(
+                service_name="position-pnl-service",
+                bus=bus,
+                input_stream=Streams.EXECUTION_REPORT,
+                handler=service.handle,
+                poll_ms=settings.service_poll_ms,
+                idle_sleep_sec=settings.service_idle_sleep_sec,
+            )
+        tasks = [report_worker, service.run_snapshots(bus.publish)]
+        if mark_source == "market_data":
+            cache = MarketDataCache(max_age_sec=settings.market_data_max_age_sec)
+            service.watch(cache)
+            feed = BinanceMarketDataFeed(cache, settings.universe, use_testnet=settings.binance_use_testnet)
+            # Symbols added to the universe at runtime get marked from market data instead of their fill price.
+            in_memory = settings.bus_backend in {"memory", "inmemory"}
+            universe_store = MemoryUniverseStore() if in_memory else RedisUniverseStore(settings.redis_url)
+            tasks.extend([feed.run(), follow_universe(universe_store, feed.apply_universe)])
+        await asyncio.gather(*tasks)
     finally:
         await bus.close()
 
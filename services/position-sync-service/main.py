@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+import time
 
 from common_types import AppSettings, make_bus
 from common_types.logging import configure_logging
@@ -9,6 +11,8 @@ from feature_store import MemoryTradingStateStore, RedisTradingStateStore
 
 from apps.position_sync_service import PositionSyncService
 
+logger = logging.getLogger(__name__)
+
 
 async def _main() -> None:
     settings = AppSettings()
@@ -18,8 +22,17 @@ async def _main() -> None:
     adapter = build_exchange_adapter(settings)
     state = MemoryTradingStateStore() if settings.bus_backend in {"memory", "inmemory"} else RedisTradingStateStore(settings.redis_url)
 
-    service = PositionSyncService(settings, adapter, state, bus)
+    # Account events are stamped with exchange time, so the audit cutoff is taken on the exchange clock too.
+    server_clock = getattr(adapter, "server_clock", None)
+    clock = (lambda: server_clock.now_ms() / 1000) if server_clock is not None else time.time
+    service = PositionSyncService(settings, adapter, state, bus, clock=clock)
     try:
+        sync_clock = getattr(adapter, "sync_clock", None)
+        if sync_clock is not None and settings.execution_mode.lower() == "live":
+            try:
+                await sync_clock()
+            except Exception:
+                logger.exception("exchange clock sync failed; using the local clock")
         await service.run_forever()
     finally:
         close_adapter = getattr(adapter, "close", None)
@@ -4,10 +4,11 @@ import asyncio
 
 from common_types import AppSettings, Streams, make_bus
 from common_types.logging import configure_logging
-from common_types.worker import run_stream_worker
-from feature_store import MemoryTradingStateStore, RedisTradingStateStore
+from common_types.worker import run_batch_stream_worker, run_stream_worker
+from feature_store import MemoryTradingStateStore, MemoryUniverseStore, RedisTradingStateStore, RedisUniverseStore
 
 from apps.risk_service import RiskService
+from apps.universe_service import follow_universe
 
 
 async def _main() -> None:
@@ -15,19 +16,35 @@ async def _main() -> None:
     configure_logging(settings.log_level)
 
     bus = make_bus(settings)
-    state = MemoryTradingStateStore() if settings.bus_backend in {"memory", "inmemory"} else RedisTradingStateStore(settings.redis_url)
+    in_memory = settings.bus_backend in {"memory", "inmemory"}
+    state = MemoryTradingStateStore() if in_memory else RedisTradingStateStore(settings.redis_url)
+    universe_store = MemoryUniverseStore() if in_memory else RedisUniverseStore(settings.redis_url)
     service = RiskService(settings, state)
+    if settings.risk_batch_max_intents > 1:
+        intent_worker = run_batch_stream_worker(
+            service_name="risk-service-intent",
+            bus=bus,
+            input_stream=Streams.ORDER_INTENT,
+            handler=service.handle_order_intents,
+            max_batch=settings.risk_batch_max_intents,
+            max_wait_ms=settings.risk_batch_max_wait_ms,
+            poll_ms=settings.service_poll_ms,
+            idle_sleep_sec=settings.service_idle_sleep_sec,
+        )
+    else:
+        intent_worker = run_stream_worker(
+            service_name="risk-service-intent",
+            bus=bus,
+            input_stream=Streams.ORDER_INTENT,
+            handler=service.handle_order_intent,
+            poll_ms=settings.service_poll_ms,
+            idle_sleep_sec=settings.service_idle_sleep_sec,
+        )
 
     try:
         await asyncio.gather(
-            run_stream_worker(
-                service_name="risk-service-intent",
-                bus=bus,
-                input_stream=Streams.ORDER_INTENT,
-                handler=service.handle_order_intent,
-                poll_ms=settings.service_poll_ms,
-                idle_sleep_sec=settings.service_idle_sleep_sec,
-            ),
+            follow_universe(universe_store, service.apply_universe),
+            intent_worker,
             run_stream_worker(
                 service_name="risk-service-pnl",
                 bus=bus,
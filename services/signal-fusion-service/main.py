@@ -5,6 +5,7 @@ import asyncio
 from common_types import AppSettings, Streams, make_bus
 from common_types.logging import configure_logging
 from common_types.worker import run_stream_worker
+from feature_store import MemoryFusionStateStore, RedisFusionStateStore
 
 from apps.signal_fusion_service import SignalFusionService
 
@@ -14,11 +15,23 @@ async def _main() -> None:
     configure_logging(settings.log_level)
 
     bus = make_bus(settings)
-    service = SignalFusionService(settings)
+    store_kwargs = {
+        "capacity": settings.fusion_buffer_size,
+        "half_life_sec": settings.fusion_half_life_sec,
+        "evict_epsilon": settings.fusion_evict_epsilon,
+    }
+    if settings.bus_backend in {"memory", "inmemory"}:
+        store = MemoryFusionStateStore(**store_kwargs)
+    else:
+        store = RedisFusionStateStore(settings.redis_url, **store_kwargs)
+    service = SignalFusionService(settings, store)
+    service_name = "signal-fusion-service"
+    if settings.fusion_replica_id:
+        service_name = f"{service_name}:{settings.fusion_replica_id}"
 
     try:
         await run_stream_worker(
-            service_name="signal-fusion-service",
+            service_name=service_name,
             bus=bus,
             input_stream=Streams.SIGNAL_RAW,
             handler=service.handle,
@@ -5,8 +5,10 @@ import asyncio
 from common_types import AppSettings, Streams, make_bus
 from common_types.logging import configure_logging
 from common_types.worker import run_stream_worker
+from exchange_adapters.exchange_info import fetch_binance_universe_rules
+from feature_store import MemoryUniverseStore, RedisUniverseStore
 
-from apps.universe_service import UniverseService
+from apps.universe_service import UniverseRefresher, UniverseService, follow_universe
 
 
 async def _main() -> None:
@@ -14,16 +16,27 @@ async def _main() -> None:
     configure_logging(settings.log_level)
 
     bus = make_bus(settings)
+    store = MemoryUniverseStore() if settings.bus_backend in {"memory", "inmemory"} else RedisUniverseStore(settings.redis_url)
+    fetch_rules = None
+    if settings.execution_mode == "live":
+        async def fetch_rules():
+            return await fetch_binance_universe_rules(use_testnet=settings.binance_use_testnet)
+
+    refresher = UniverseRefresher(settings, store, fetch_rules=fetch_rules)
     service = UniverseService(settings)
 
     try:
-        await run_stream_worker(
-            service_name="universe-service",
-            bus=bus,
-            input_stream=Streams.SIGNAL_TRADEABLE,
-            handler=service.handle,
-            poll_ms=settings.service_poll_ms,
-            idle_sleep_sec=settings.service_idle_sleep_sec,
+        await asyncio.gather(
+            refresher.run_forever(),
+            follow_universe(store, service.apply_snapshot),
+            run_stream_worker(
+                service_name="universe-service",
+                bus=bus,
+                input_stream=Streams.SIGNAL_TRADEABLE,
+                handler=service.handle,
+                poll_ms=settings.service_poll_ms,
+                idle_sleep_sec=settings.service_idle_sleep_sec,
+            ),
         )
     finally:
         await bus.close()
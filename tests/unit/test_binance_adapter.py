@@ -47,3 +47,327 @@ def test_binance_order_id_shape_for_spot_report(monkeypatch):
     report = asyncio.run(adapter.place_order(intent))
     assert report.order_id == "spot:BTCUSDT:123"
     assert report.status == "filled"
+
+
+def test_binance_quantizes_orders_with_cached_exchange_filters():
+    import asyncio
+
+    from common_types.universe import MarketRules
+
+    adapter = BinanceExchangeAdapter("test_key", "test_secret", use_testnet=True)
+    adapter.set_market_rules("perp", {"DOGEUSDT": MarketRules(min_qty=1, max_qty=1_000_000, step_size=1, min_notional=5)})
+    adapter.set_market_rules("spot", {"DOGEUSDT": MarketRules(min_notional=5, quote_precision=2)})
+    adapter.market_data.update_mark("perp", "DOGEUSDT", 0.12)
+    sent: list[dict] = []
+
+    async def fake_request(**kwargs):
+        sent.append(kwargs["params"])
+        return {"orderId": 9, "executedQty": kwargs["params"].get("quantity", "0"), "status": "FILLED"}
+
+    adapter._request = fake_request  # type: ignore
+
+    def _intent(market: str, qty_usd: float) -> OrderIntent:
+        return OrderIntent(
+            intent_id="intent-q",
+            event_id="evt-1",
+            symbol="DOGEUSDT",
+            market=market,
+            side=1,
+            qty_usd=qty_usd,
+            max_slippage_bps=20,
+            reason="test",
+        )
+
+    report = asyncio.run(adapter.place_order(_intent("perp", 100.0)))
+    assert sent[-1]["quantity"] == "833"
+    assert report.filled_qty == 833
+
+    asyncio.run(adapter.place_order(_intent("spot", 100.129)))
+    assert sent[-1]["quoteOrderQty"] == "100.12"
+
+    rejected = asyncio.run(adapter.place_order(_intent("perp", 3.0)))
+    assert rejected.status == "rejected"
+    assert len(sent) == 2
+
+    # Each local reject is its own order, so execution dedup does not swallow the next one for the symbol.
+    from apps.execution_service import ExecutionService
+
+    service = ExecutionService(adapter)
+    for intent_id in ("intent-r1", "intent-r2"):
+        out = asyncio.run(service.handle(_intent("perp", 3.0).model_copy(update={"intent_id": intent_id}).model_dump(mode="json")))
+        assert [(payload["intent_id"], payload["status"]) for _, payload in out] == [(intent_id, "rejected")]
+
+
+def test_binance_fetch_positions_uses_one_ticker_call_and_concurrent_account_reads():
+    import asyncio
+
+    adapter = BinanceExchangeAdapter("test_key", "test_secret", use_testnet=True)
+    adapter.market_data.update_book("spot", "ASSET0USDT", 1.9, 2.1)
+    calls: list[str] = []
+    in_flight = {"now": 0, "max": 0}
+
+    async def fake_request(**kwargs):
+        calls.append(kwargs["path"])
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        if kwargs["path"] == "/api/v3/account":
+            balances = [{"asset": f"ASSET{idx}", "free": "1", "locked": "0"} for idx in range(40)]
+            return {"balances": balances + [{"asset": "USDT", "free": "500", "locked": "0"}]}
+        if kwargs["path"] == "/fapi/v2/positionRisk":
+            return [{"symbol": "BTCUSDT", "positionAmt": "0.01", "notional": "650"}]
+        return [{"symbol": f"ASSET{idx}USDT", "price": str(float(idx))} for idx in range(40)]
+
+    adapter._request = fake_request  # type: ignore
+    positions = asyncio.run(adapter.fetch_positions())
+
+    assert sorted(calls) == ["/api/v3/account", "/api/v3/ticker/price", "/fapi/v2/positionRisk"]
+    assert in_flight["max"] == 2
+    by_symbol = {p["symbol"]: p for p in positions}
+    assert len(positions) == 41
+    assert by_symbol["ASSET0USDT"]["notional_usd"] == 2.0
+    assert by_symbol["ASSET7USDT"]["notional_usd"] == 7.0
+    assert by_symbol["BTCUSDT"]["market"] == "perp"
+
+
+def _perp_intent(intent_id: str) -> OrderIntent:
+    return OrderIntent(
+        intent_id=intent_id,
+        event_id=f"evt-{intent_id}",
+        symbol="BTCUSDT",
+        market="perp",
+        side=-1,
+        qty_usd=650,
+        max_slippage_bps=20,
+        reason="test",
+    )
+
+
+def test_binance_ws_order_transport_places_queries_and_cancels_over_one_socket():
+    import asyncio
+    import json
+
+    import websockets
+
+    seen: list[dict] = []
+    connections = 0
+
+    async def _handler(ws):
+        nonlocal connections
+        connections += 1
+        async for message in ws:
+            request = json.loads(message)
+            seen.append(request)
+            params = request["params"]
+            result = {"orderId": 42, "status": "FILLED", "executedQty": "0.01", "avgPrice": "65000"}
+            if request["method"] == "order.cancel":
+                result["status"] = "CANCELED"
+            await ws.send(
+                json.dumps(
+                    {
+                        "id": request["id"],
+                        "status": 200,
+                        "result": {**result, "symbol": params["symbol"]},
+                        "rateLimits": [
+                            {"rateLimitType": "REQUEST_WEIGHT", "interval": "MINUTE", "intervalNum": 1, "limit": 2400, "count": 77}
+                        ],
+                    }
+                )
+            )
+
+    async def _run():
+        async with websockets.serve(_handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            adapter = BinanceExchangeAdapter(
+                "test_key",
+                "test_secret",
+                use_testnet=True,
+                order_transport="ws",
+                ws_api_urls={"spot": f"ws://127.0.0.1:{port}/spot", "perp": f"ws://127.0.0.1:{port}/perp"},
+            )
+
+            async def fail_request(**kwargs):
+                raise AssertionError(f"unexpected REST call {kwargs}")
+
+            adapter._request = fail_request  # type: ignore
+            adapter.market_data.update_mark("perp", "BTCUSDT", 65000.0)
+            try:
+                report = await adapter.place_order(_perp_intent("ws-1"))
+                status = await adapter.query_order(report.order_id)
+                cancelled = await adapter.cancel_order(report.order_id)
+            finally:
+                await adapter.close()
+            return adapter, report, status, cancelled
+
+    adapter, report, status, cancelled = asyncio.run(_run())
+    assert report.order_id == "perp:BTCUSDT:42"
+    assert report.status == "filled"
+    assert status == {"order_id": "perp:BTCUSDT:42", "status": "filled", "filled_qty": 0.01, "avg_price": 65000.0}
+    assert cancelled is True
+    assert connections == 1
+    assert [r["method"] for r in seen] == ["order.place", "order.status", "order.cancel"]
+    assert {"apiKey", "timestamp", "recvWindow", "signature"} <= set(seen[0]["params"])
+    assert adapter.rate_limit_metrics()["perp"]["weight"]["1m"]["used"] == 77
+
+
+def test_binance_ws_order_transport_falls_back_to_rest_only_when_socket_is_unreachable():
+    import asyncio
+
+    adapter = BinanceExchangeAdapter(
+        "test_key",
+        "test_secret",
+        use_testnet=True,
+        order_transport="ws",
+        ws_api_urls={"spot": "ws://127.0.0.1:1/spot", "perp": "ws://127.0.0.1:1/perp"},
+    )
+    calls: list[dict] = []
+
+    async def fake_request(**kwargs):
+        calls.append(kwargs)
+        return {"orderId": 7, "status": "FILLED", "executedQty": "0.01", "avgPrice": "65000"}
+
+    adapter._request = fake_request  # type: ignore
+    adapter.market_data.update_mark("perp", "BTCUSDT", 65000.0)
+    limiter = adapter.rate_limiters["perp"]
+    acquires: list[dict] = []
+    acquire = limiter.acquire
+
+    async def counting_acquire(**kwargs):
+        acquires.append(kwargs)
+        await acquire(**kwargs)
+
+    limiter.acquire = counting_acquire
+
+    report = asyncio.run(adapter.place_order(_perp_intent("ws-2")))
+    assert report.order_id == "perp:BTCUSDT:7"
+    assert adapter.ws_fallbacks == 1
+    assert [(c["method"], c["path"]) for c in calls] == [("POST", "/fapi/v1/order")]
+    # The REST retry reuses the budget the websocket attempt acquired.
+    assert calls[0]["acquired"] is True
+    assert len(acquires) == 1
+
+
+def test_binance_place_orders_batches_perp_intents_and_fans_out_results():
+    import asyncio
+    import json
+
+    adapter = BinanceExchangeAdapter("test_key", "test_secret", use_testnet=True)
+    symbols = ["BTCUSDT", "ETHUSDT", "BTCUSDT", "SOLUSDT", "BNBUSDT", "XRPUSDT", "ADAUSDT"]
+    for symbol in set(symbols):
+        adapter.market_data.update_mark("perp", symbol, 100.0)
+    calls: list[dict] = []
+
+    async def fake_request(**kwargs):
+        calls.append(kwargs)
+        if kwargs["path"] == "/api/v3/order":
+            return {"orderId": 1, "executedQty": "1", "cummulativeQuoteQty": "100", "status": "FILLED"}
+        orders = json.loads(kwargs["params"]["batchOrders"])
+        out = []
+        for order in orders:
+            if order["symbol"] == "SOLUSDT":
+                out.append({"code": -2019, "msg": "Margin is insufficient."})
+            else:
+                out.append({"orderId": len(out) + 10, "executedQty": order["quantity"], "avgPrice": "100.5", "status": "FILLED"})
+        return out
+
+    adapter._request = fake_request  # type: ignore
+    intents = [_perp_intent(f"batch-{idx}").model_copy(update={"symbol": symbol}) for idx, symbol in enumerate(symbols)]
+    intents.append(_perp_intent("spot-1").model_copy(update={"market": "spot"}))
+    results = asyncio.run(adapter.place_orders(intents))
+
+    batches = [json.loads(call["params"]["batchOrders"]) for call in calls if call["path"] == "/fapi/v1/batchOrders"]
+    # The second BTCUSDT order waits for the next batch; the first batch fills up to five with later symbols.
+    assert [[order["symbol"] for order in batch] for batch in batches] == [
+        ["BTCUSDT", "ETHUSDT", "SOLUSDT", "BNBUSDT", "XRPUSDT"],
+        ["BTCUSDT", "ADAUSDT"],
+    ]
+    assert [call["order_count"] for call in calls if call["path"] == "/fapi/v1/batchOrders"] == [5, 2]
+    assert [call["path"] for call in calls][-1] == "/api/v3/order"
+    assert len(results) == len(intents)
+    assert [getattr(result, "intent_id", None) for result in results] == [
+        "batch-0", "batch-1", "batch-2", None, "batch-4", "batch-5", "batch-6", "spot-1"
+    ]
+    assert isinstance(results[3], RuntimeError)
+    assert results[2].order_id == "perp:BTCUSDT:10"
+    assert results[0].avg_price == 100.5
+
+
+def test_user_data_decoder_skips_other_events_and_builds_reports():
+    import json
+
+    from exchange_adapters.user_data import LISTEN_KEY_EXPIRED, decode_user_data_frame
+
+    perp = {
+        "e": "ORDER_TRADE_UPDATE",
+        "E": 1717000000212,
+        "o": {"s": "ETHUSDT", "c": "intent-7", "S": "SELL", "X": "PARTIALLY_FILLED", "i": 42, "z": "0.3", "ap": "3201.5"},
+    }
+    spot = {"e": "executionReport", "E": 1717000000123, "s": "BTCUSDT", "c": "intent-8", "S": "BUY", "X": "FILLED", "i": 7, "z": "0.002", "Z": "130"}
+
+    report = decode_user_data_frame("perp", json.dumps(perp, separators=(",", ":")).encode())
+    assert report.order_id == "perp:ETHUSDT:42"
+    assert (report.side, report.status, report.filled_qty, report.avg_price) == (-1, "partially_filled", 0.3, 3201.5)
+    assert report.ts.timestamp() == 1717000000.212
+    assert decode_user_data_frame("spot", json.dumps(spot)).avg_price == 65000.0
+    # A frame is only decoded when it names an event this market's stream acts on.
+    assert decode_user_data_frame("spot", json.dumps(perp)) is None
+    assert decode_user_data_frame("perp", '{"e":"ACCOUNT_UPDATE","E":1,"a":{}}') is None
+    assert decode_user_data_frame("perp", "not json at all") is None
+    assert decode_user_data_frame("spot", '{"e":"listenKeyExpired","E":1}') == LISTEN_KEY_EXPIRED
+
+
+def test_account_decoder_lists_changed_positions():
+    import json
+
+    import pytest
+
+    from exchange_adapters.user_data import decode_account_frame, decode_user_data_frame
+
+    perp = {
+        "e": "ACCOUNT_UPDATE",
+        "E": 1700000000000,
+        "a": {"m": "ORDER", "B": [], "P": [{"s": "BTCUSDT", "pa": "-0.01", "ep": "65000", "up": "-5", "ps": "BOTH"}]},
+    }
+    spot = {"e": "outboundAccountPosition", "E": 1700000000001, "B": [{"a": "ETH", "f": "1.5", "l": "0.5"}, {"a": "USDT", "f": "10", "l": "0"}]}
+
+    event = decode_account_frame("perp", json.dumps(perp).encode())
+    assert event["event_ms"] == 1700000000000
+    assert event["positions"] == [{"market": "perp", "symbol": "BTCUSDT", "qty": -0.01, "notional_usd": pytest.approx(655.0)}]
+    assert decode_account_frame("spot", json.dumps(spot))["positions"] == [{"market": "spot", "symbol": "ETHUSDT", "qty": 2.0}]
+    assert decode_account_frame("spot", '{"e":"executionReport","E":1}') is None
+    assert decode_user_data_frame("perp", json.dumps(perp)) is None
+
+
+
+def test_server_clock_smooths_offset_and_drops_slow_round_trips():
+    from exchange_adapters.clock import ServerClock
+
+    clock = ServerClock(alpha=0.5, max_rtt_ms=100, clock=lambda: 1000.0)
+    assert clock.observe(1_000_000, 1_000_510, 1_000_020)
+    assert clock.offset_ms == 500
+    assert clock.observe(1_000_000, 1_000_310, 1_000_020)
+    assert clock.offset_ms == 400
+    assert not clock.observe(1_000_000, 1_009_000, 1_000_500)
+    assert clock.offset_ms == 400 and clock.rejected == 1
+    assert clock.now_ms() == 1_000_400
+
+
+def test_mark_price_fallback_goes_through_the_rate_limited_request_path():
+    import asyncio
+
+    from exchange_adapters.rate_limit import PRIORITY_ORDER
+
+    adapter = BinanceExchangeAdapter("test_key", "test_secret", use_testnet=True)
+    calls: list[dict] = []
+
+    async def fake_request(**kwargs):
+        calls.append(kwargs)
+        return {"symbol": "BTCUSDT", "price": "65000.5"}
+
+    adapter._request = fake_request
+
+    assert asyncio.run(adapter._mark_price("BTCUSDT")) == 65000.5
+    assert asyncio.run(adapter._mark_price("BTCUSDT")) == 65000.5
+    assert len(calls) == 1
+    assert (calls[0]["path"], calls[0]["signed"], calls[0]["priority"]) == ("/fapi/v1/ticker/price", False, PRIORITY_ORDER)
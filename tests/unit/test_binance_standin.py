@@ -0,0 +1,148 @@
+import asyncio
+import contextlib
+
+import httpx
+import pytest
+
+from benchmarks.binance_standin import BinanceStandInConfig, point_adapter, serve_in_background
+from common_types.models import ExecutionReport, OrderIntent
+from exchange_adapters.binance import BinanceExchangeAdapter
+
+
+def _intent(intent_id: str, market: str, side: int = 1) -> OrderIntent:
+    return OrderIntent(
+        intent_id=intent_id,
+        event_id=f"evt-{intent_id}",
+        symbol="BTCUSDT",
+        market=market,
+        side=side,
+        qty_usd=650,
+        max_slippage_bps=20,
+        reason="test",
+    )
+
+
+async def _collect(adapter: BinanceExchangeAdapter, events: list[ExecutionReport]) -> None:
+    async for event in adapter.stream_execution_events():
+        events.append(event)
+
+
+def test_standin_streams_partial_fills_and_tracks_positions():
+    config = BinanceStandInConfig(partial_fill_rate=1.0, fill_steps=2, fill_interval_ms=1, prices={"BTCUSDT": 65000.0}, seed=1)
+
+    async def _run():
+        async with serve_in_background(config, port=0) as (exchange, rest_base, ws_base):
+            adapter = BinanceExchangeAdapter("test_key", "test_secret", use_testnet=True)
+            point_adapter(adapter, rest_base, ws_base)
+            adapter.market_data.update_mark("perp", "BTCUSDT", 65000.0)
+            events: list[ExecutionReport] = []
+            consumer = asyncio.create_task(_collect(adapter, events))
+            try:
+                for _ in range(200):
+                    if exchange.subscribers() == 2:
+                        break
+                    await asyncio.sleep(0.01)
+                report = await adapter.place_order(_intent("standin-1", "perp", side=-1))
+                for _ in range(200):
+                    if any(e.status == "filled" for e in events):
+                        break
+                    await asyncio.sleep(0.01)
+                positions = await adapter.fetch_positions()
+            finally:
+                consumer.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await consumer
+                await adapter.close()
+            return report, events, positions
+
+    report, events, positions = asyncio.run(_run())
+    assert report.status == "partially_filled"
+    assert [(e.intent_id, e.status) for e in events] == [("standin-1", "partially_filled"), ("standin-1", "filled")]
+    assert events[-1].filled_qty == pytest.approx(0.01)
+    assert positions == [{"market": "perp", "symbol": "BTCUSDT", "qty": pytest.approx(-0.01), "notional_usd": pytest.approx(650)}]
+
+
+def test_standin_injects_order_errors():
+    async def _run():
+        async with serve_in_background(BinanceStandInConfig(reject_rate=1.0), port=0) as (exchange, rest_base, ws_base):
+            adapter = BinanceExchangeAdapter("test_key", "test_secret", use_testnet=True)
+            point_adapter(adapter, rest_base, ws_base)
+            try:
+                with pytest.raises(httpx.HTTPStatusError) as exc_info:
+                    await adapter.place_order(_intent("standin-2", "spot"))
+            finally:
+                await adapter.close()
+            return exc_info.value.response, exchange.outcomes
+
+    response, outcomes = asyncio.run(_run())
+    assert response.status_code == 400
+    assert response.json()["code"] == -2010
+    assert outcomes == {"rejected": 1}
+
+
+def test_warmup_opens_pools_and_corrects_clock_offset():
+    async def _run():
+        config = BinanceStandInConfig(clock_offset_ms=8000, prices={"BTCUSDT": 65000.0})
+        async with serve_in_background(config, port=0) as (exchange, rest_base, ws_base):
+            adapter = BinanceExchangeAdapter("test_key", "test_secret", use_testnet=True, warm_connections=2)
+            point_adapter(adapter, rest_base, ws_base)
+            adapter.market_data.update_mark("perp", "BTCUSDT", 65000.0)
+            try:
+                with pytest.raises(httpx.HTTPStatusError) as exc_info:
+                    await adapter.place_order(_intent("clock-1", "perp"))
+                await adapter.warmup()
+                report = await adapter.place_order(_intent("clock-2", "perp"))
+                metrics = adapter.connection_metrics()
+            finally:
+                await adapter.close()
+            return exc_info.value.response.json(), report, metrics
+
+    stale, report, metrics = asyncio.run(_run())
+    assert stale["code"] == -1021
+    assert report.status == "filled"
+    assert metrics["clock"]["samples"] == 4
+    assert metrics["clock"]["offset_ms"] == pytest.approx(8000, abs=250)
+    # Both markets point at the same local stand-in here, so its pool is shared.
+    assert metrics["pools"]["perp"]["connections"] >= 2
+
+
+def test_standin_account_events_drive_position_sync():
+    from apps.position_sync_service import PositionSyncService
+    from common_types import AppSettings
+    from common_types.bus import InMemoryEventBus
+    from feature_store import MemoryTradingStateStore
+
+    config = BinanceStandInConfig(prices={"BTCUSDT": 65000.0}, seed=1)
+
+    async def _run():
+        async with serve_in_background(config, port=0) as (exchange, rest_base, ws_base):
+            adapter = BinanceExchangeAdapter("test_key", "test_secret", use_testnet=True)
+            point_adapter(adapter, rest_base, ws_base)
+            adapter.market_data.update_mark("perp", "BTCUSDT", 65000.0)
+            settings = AppSettings(bus_backend="memory", execution_mode="live", account_equity_usd=100000)
+            state = MemoryTradingStateStore()
+            svc = PositionSyncService(settings, adapter, state, InMemoryEventBus())
+            await svc.run_once()
+            consumer = asyncio.create_task(svc.consume_account_events(adapter.stream_account_events))
+            try:
+                for _ in range(200):
+                    if exchange.subscribers() == 2:
+                        break
+                    await asyncio.sleep(0.01)
+                await adapter.place_order(_intent("standin-3", "perp"))
+                for _ in range(200):
+                    if svc.events_applied:
+                        break
+                    await asyncio.sleep(0.01)
+            finally:
+                consumer.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await consumer
+                await adapter.close()
+            return svc, await state.get_exposure_view(["BTCUSDT"])
+
+    svc, view = asyncio.run(_run())
+    assert svc.events_applied == 1
+    assert view.symbol["BTCUSDT"] == pytest.approx(650)
+    assert view.market["perp"] == pytest.approx(650)
+    assert view.total == pytest.approx(650)
@@ -2,14 +2,16 @@ import asyncio
 from datetime import datetime, timezone
 
 from apps.execution_service import ExecutionService
+from benchmarks.redis_standin import RedisStandIn
+from common_types import InMemoryEventBus, Streams
 from common_types.models import ExecutionReport
 from exchange_adapters import SimulatedExchangeAdapter
+from feature_store import MemoryDedupStore, RedisDedupStore
 
 
-def test_execution_service_deduplicates_intent():
-    service = ExecutionService(SimulatedExchangeAdapter())
-    payload = {
-        "intent_id": "intent-1",
+def _spot_intent(intent_id: str) -> dict:
+    return {
+        "intent_id": intent_id,
         "event_id": "e1",
         "symbol": "BTCUSDT",
         "market": "spot",
@@ -19,6 +21,11 @@ def test_execution_service_deduplicates_intent():
         "reason": "test",
     }
 
+
+def test_execution_service_deduplicates_intent():
+    service = ExecutionService(SimulatedExchangeAdapter())
+    payload = _spot_intent("intent-1")
+
     first = asyncio.run(service.handle(payload))
     second = asyncio.run(service.handle(payload))
 
@@ -46,3 +53,188 @@ def test_execution_service_deduplicates_adapter_events():
 
     assert one is not None
     assert two is None
+
+
+def test_execution_service_claims_survive_restart_with_shared_store():
+    client = RedisStandIn()
+    payloads = [_spot_intent(f"intent-{idx}") for idx in range(3)]
+
+    first = ExecutionService(SimulatedExchangeAdapter(), dedup=RedisDedupStore("redis://standin", client=client))
+    out = asyncio.run(first.handle_batch(payloads[:2]))
+    assert len(out) == 2
+    assert client.round_trips == 1
+
+    restarted = ExecutionService(SimulatedExchangeAdapter(), dedup=RedisDedupStore("redis://standin", client=client))
+    replay = asyncio.run(restarted.handle_batch(payloads))
+    assert [payload["intent_id"] for _, payload in replay] == ["intent-2"]
+
+
+def test_memory_dedup_store_is_bounded_and_expires():
+    store = MemoryDedupStore(max_items=2)
+    assert asyncio.run(store.seen_or_add_many(["a", "b", "a", "c"], ttl_sec=60)) == [False, False, True, False]
+    assert len(store) == 2
+    # "b" was least recently seen and has been evicted.
+    assert asyncio.run(store.seen_or_add("b", ttl_sec=60)) is False
+    assert store.seen_or_add_nowait("x", ttl_sec=0) is False
+    assert store.seen_or_add_nowait("x", ttl_sec=0) is False
+
+
+class _SlowAdapter(SimulatedExchangeAdapter):
+    def __init__(self):
+        super().__init__()
+        self.active: dict[str, int] = {}
+        self.max_active = 0
+        self.max_active_per_symbol = 0
+        self.order: list[str] = []
+
+    async def place_order(self, intent):
+        self.active[intent.symbol] = self.active.get(intent.symbol, 0) + 1
+        self.max_active = max(self.max_active, sum(self.active.values()))
+        self.max_active_per_symbol = max(self.max_active_per_symbol, self.active[intent.symbol])
+        await asyncio.sleep(0.02)
+        self.order.append(intent.intent_id)
+        self.active[intent.symbol] -= 1
+        return await super().place_order(intent)
+
+
+class _BatchAdapter(SimulatedExchangeAdapter):
+    def __init__(self):
+        super().__init__(seed=1)
+        self.batches: list[list[str]] = []
+        self.single: list[str] = []
+
+    async def place_order(self, intent):
+        self.single.append(intent.intent_id)
+        return await super().place_order(intent)
+
+    async def place_orders(self, intents):
+        self.batches.append([intent.intent_id for intent in intents])
+        results = await super().place_orders(intents)
+        if len(self.batches) == 1:
+            results[1] = RuntimeError("batch item failed")
+        return results
+
+
+def test_execution_service_coalesces_perp_intents_and_keeps_failed_claims():
+    adapter = _BatchAdapter()
+    service = ExecutionService(adapter)
+    payloads = [_spot_intent(f"intent-{idx}") | {"market": "perp"} for idx in range(3)] + [_spot_intent("intent-3")]
+
+    first = asyncio.run(service.handle_batch(payloads))
+    retried = asyncio.run(service.handle_batch(payloads))
+
+    reports = {payload["intent_id"]: payload["status"] for stream, payload in first if stream == Streams.EXECUTION_REPORT}
+    assert adapter.batches == [["intent-0", "intent-1", "intent-2"]]
+    # The placed orders keep their reports; the failed item is reported and keeps its claim.
+    assert reports["intent-1"] == "rejected"
+    assert all(reports[i] != "rejected" for i in ("intent-0", "intent-2", "intent-3"))
+    assert [stream for stream, _ in first].count(Streams.RISK_ALERT) == 1
+    assert adapter.single == ["intent-3"]
+    assert retried == []
+
+
+def test_dispatcher_runs_symbols_concurrently_and_keeps_per_symbol_order():
+    async def _run():
+        bus = InMemoryEventBus()
+        adapter = _SlowAdapter()
+        service = ExecutionService(adapter, bus=bus, max_concurrency=4)
+        symbols = ["BTCUSDT", "ETHUSDT", "SOLUSDT", "BNBUSDT"]
+        for idx in range(12):
+            await service.handle(_spot_intent(f"intent-{idx}") | {"symbol": symbols[idx % 4]})
+        assert service.metrics()["queued"] + service.metrics()["in_flight"] == 12
+        await service.dispatcher.drain()
+
+        reports = await bus.read(Streams.EXECUTION_REPORT, last_id="0-0")
+        assert len(reports) == 12
+        assert adapter.max_active == 4
+        assert adapter.max_active_per_symbol == 1
+        btc = [i for i in adapter.order if int(i.split("-")[1]) % 4 == 0]
+        assert btc == ["intent-0", "intent-4", "intent-8"]
+        assert service.metrics()["completed"] == 12
+
+    asyncio.run(_run())
+
+
+class _FlakyAdapter(SimulatedExchangeAdapter):
+    def __init__(self, fail: set[str]):
+        super().__init__(seed=1)
+        self.fail = fail
+        self.calls: list[str] = []
+
+    async def place_order(self, intent):
+        self.calls.append(intent.intent_id)
+        if intent.intent_id in self.fail:
+            self.fail.discard(intent.intent_id)
+            raise RuntimeError("exchange unavailable")
+        return await super().place_order(intent)
+
+
+def test_batch_failure_after_a_placement_keeps_its_report():
+    adapter = _FlakyAdapter({"i1"})
+    service = ExecutionService(adapter)
+    payloads = [_spot_intent(f"i{idx}") for idx in range(3)]
+
+    first = asyncio.run(service.handle_batch(payloads))
+    replay = asyncio.run(service.handle_batch(payloads))
+
+    reports = [payload for stream, payload in first if stream == Streams.EXECUTION_REPORT]
+    assert [(r["intent_id"], r["status"]) for r in reports][0] == ("i0", "filled")
+    assert [r["intent_id"] for r in reports].count("i0") == 1
+    assert next(r for r in reports if r["intent_id"] == "i1")["status"] == "rejected"
+    assert [stream for stream, _ in first].count(Streams.RISK_ALERT) == 1
+    assert adapter.calls == ["i0", "i1", "i2"]
+    # The rejected intent is not placed again, and no report is emitted twice.
+    assert replay == []
+
+
+def test_dispatcher_retries_and_reports_orders_it_cannot_place():
+    async def _run():
+        bus = InMemoryEventBus()
+        adapter = _FlakyAdapter({"d0"})
+        service = ExecutionService(adapter, bus=bus, max_concurrency=2)
+        service.dispatcher.retry_backoff_sec = 0.0
+        await service.handle(_spot_intent("d0"))
+        await service.dispatcher.drain()
+        service.dispatcher.max_retries = 0
+        adapter.fail.add("d1")
+        await service.handle(_spot_intent("d1"))
+        await service.dispatcher.drain()
+
+        reports = [entry.data for entry in await bus.read(Streams.EXECUTION_REPORT, last_id="0-0")]
+        alerts = await bus.read(Streams.RISK_ALERT, last_id="0-0")
+        assert [(r["intent_id"], r["status"]) for r in reports] == [("d0", "filled"), ("d1", "rejected")]
+        assert len(alerts) == 1 and "d1" in alerts[0].data["message"]
+        assert adapter.calls == ["d0", "d0", "d1"]
+        assert (service.metrics()["retried"], service.metrics()["failed"]) == (1, 1)
+        # The reported intent keeps its claim, so a replay cannot place it after its terminal report.
+        assert await service.handle(_spot_intent("d0")) == []
+        assert await service.dedup.seen_or_add("intent:d1", 60)
+
+    asyncio.run(_run())
+
+
+def test_dispatcher_claims_intents_only_when_it_places_them():
+    async def _run():
+        client = RedisStandIn()
+        crashed = ExecutionService(
+            _SlowAdapter(), dedup=RedisDedupStore("redis://standin", client=client), bus=InMemoryEventBus(), max_concurrency=2
+        )
+        await crashed.handle_batch([_spot_intent(f"q{idx}") for idx in range(3)])
+        # The process dies before any lane runs: the queued intents were acked but never claimed.
+        for task in crashed.dispatcher._lane_tasks.values():
+            task.cancel()
+
+        bus = InMemoryEventBus()
+        adapter = _SlowAdapter()
+        restarted = ExecutionService(
+            adapter, dedup=RedisDedupStore("redis://standin", client=client), bus=bus, max_concurrency=2
+        )
+        for idx in (0, 1, 2, 1):
+            await restarted.handle(_spot_intent(f"q{idx}"))
+        await restarted.dispatcher.drain()
+
+        assert adapter.order == ["q0", "q1", "q2"]
+        assert len(await bus.read(Streams.EXECUTION_REPORT, last_id="0-0")) == 3
+        assert restarted.metrics()["duplicates"] == 1
+
+    asyncio.run(_run())
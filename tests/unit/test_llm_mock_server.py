@@ -0,0 +1,81 @@
+import asyncio
+import json
+
+from fastapi.testclient import TestClient
+
+from apps.llm_signal_service import LLMProvider, LLMSignalService
+from benchmarks.llm_load_test import percentile, run_load, synthetic_entity_events
+from benchmarks.llm_mock_server import MockLLMConfig, build_app
+from common_types import AppSettings, EntityEvent
+
+
+def _post(client: TestClient, prompt: str):
+    return client.post(
+        "/v1/chat/completions",
+        json={"model": "qwen-plus", "messages": [{"role": "user", "content": prompt}]},
+    )
+
+
+def test_mock_server_returns_signal_json():
+    client = TestClient(build_app(MockLLMConfig(latency_dist="constant", latency_ms=0, seed=1)))
+
+    resp = _post(client, "Symbol: BTCUSDT\nTitle: test")
+
+    assert resp.status_code == 200
+    parsed = json.loads(resp.json()["choices"][0]["message"]["content"])
+    assert set(parsed) == {"side", "strength", "confidence", "horizon_min", "rationale"}
+
+
+def test_mock_server_answers_batch_prompt_per_event_and_symbol():
+    settings = AppSettings(bus_backend="memory")
+    events = [EntityEvent.model_validate(payload) for payload in synthetic_entity_events(3, max_symbols=2)]
+    prompt = LLMProvider(settings)._batch_prompt(events)
+    client = TestClient(build_app(MockLLMConfig(latency_dist="constant", latency_ms=0, seed=1)))
+
+    items = json.loads(_post(client, prompt).json()["choices"][0]["message"]["content"])
+
+    assert {(item["event_id"], item["symbol"]) for item in items} == {
+        (event.event_id, symbol) for event in events for symbol in event.symbols
+    }
+
+
+def test_mock_server_injects_errors_rate_limits_and_malformed_output():
+    errors = TestClient(build_app(MockLLMConfig(latency_ms=0, error_rate=1.0)))
+    limited = TestClient(build_app(MockLLMConfig(latency_ms=0, rate_limit_rate=1.0)))
+    malformed = TestClient(build_app(MockLLMConfig(latency_ms=0, malformed_rate=1.0, seed=3)))
+
+    assert _post(errors, "x").status_code == 500
+    assert _post(limited, "x").status_code == 429
+    text = _post(malformed, "x").json()["choices"][0]["message"]["content"]
+    assert LLMProvider(AppSettings(bus_backend="memory"))._parse_json_text(text) is None
+
+
+def test_run_load_reports_latency_and_fallback_rate():
+    settings = AppSettings(bus_backend="memory", openai_api_key="")
+    service = LLMSignalService(settings, LLMProvider(settings))
+
+    report = asyncio.run(run_load(service, synthetic_entity_events(10), qps=200, duration_sec=0.05))
+
+    assert report.sent == 10
+    assert report.completed == 10
+    assert report.fallback_rate == 1.0
+    assert report.p50_ms <= report.p99_ms
+
+
+def test_run_load_batches_arrivals_and_counts_only_signals():
+    settings = AppSettings(bus_backend="memory", openai_api_key="")
+    service = LLMSignalService(settings, LLMProvider(settings))
+    events = synthetic_entity_events(10)
+
+    report = asyncio.run(run_load(service, events, qps=200, duration_sec=0.05, batch_size=4, batch_wait_ms=1000))
+
+    assert (report.sent, report.completed, report.batches) == (10, 10, 3)
+    assert report.signals == sum(len(event["symbols"]) for event in events)
+    assert report.fallback_rate == 1.0
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([], 99) == 0.0
@@ -0,0 +1,254 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from apps.llm_signal_service import IncrementalSignalParser, LLMProvider, LLMSignalService
+from common_types import AppSettings, EntityEvent
+from common_types.bus import InMemoryEventBus
+from common_types.worker import run_batch_stream_worker
+
+
+class FakeCompletions:
+    def __init__(self, content: str):
+        self.content = content
+        self.calls: list[dict] = []
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        message = SimpleNamespace(content=self.content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def _provider_with_reply(settings: AppSettings, content: str) -> tuple[LLMProvider, FakeCompletions]:
+    provider = LLMProvider(settings)
+    completions = FakeCompletions(content)
+    provider._client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return provider, completions
+
+
+def _entity(event_id: str, symbols: list[str], title: str = "Bitcoin partnership drives adoption") -> dict:
+    return {
+        "event_id": event_id,
+        "symbols": symbols,
+        "tags": [],
+        "regions": [],
+        "relevance_score": 0.8,
+        "title": title,
+        "content": "sample content",
+    }
+
+
+def test_handle_batch_splits_array_reply_into_signals():
+    settings = AppSettings(bus_backend="memory")
+    reply = json.dumps(
+        [
+            {"event_id": "e1", "symbol": "BTCUSDT", "side": 1, "strength": 0.7, "confidence": 0.8,
+             "horizon_min": 90, "rationale": "btc up"},
+            {"event_id": "e1", "symbol": "ETHUSDT", "side": 0, "strength": 0.1, "confidence": 0.5,
+             "horizon_min": 60, "rationale": "eth flat"},
+            {"event_id": "e2", "symbol": "SOLUSDT", "side": -1, "strength": 0.6, "confidence": 0.9,
+             "horizon_min": 30, "rationale": "sol down"},
+        ]
+    )
+    provider, completions = _provider_with_reply(settings, f"```json\n{reply}\n```")
+    service = LLMSignalService(settings, provider)
+
+    out = asyncio.run(service.handle_batch([_entity("e1", ["BTCUSDT", "ETHUSDT"]), _entity("e2", ["SOLUSDT"])]))
+
+    assert len(completions.calls) == 1
+    signals = {(payload["event_id"], payload["symbol"]): payload for _, payload in out}
+    assert signals[("e1", "BTCUSDT")]["side"] == 1
+    assert signals[("e1", "ETHUSDT")]["rationale"] == "eth flat"
+    assert signals[("e2", "SOLUSDT")]["horizon_min"] == 30
+    assert all(stream == "signal.raw" for stream, _ in out)
+
+
+def test_handle_batch_falls_back_to_heuristic_for_missing_pairs():
+    settings = AppSettings(bus_backend="memory")
+    reply = json.dumps({"results": [{"event_id": "e1", "symbol": "BTCUSDT", "side": 1, "strength": 0.7,
+                                     "confidence": 0.8, "horizon_min": 90, "rationale": "btc up"}]})
+    provider, _ = _provider_with_reply(settings, reply)
+    service = LLMSignalService(settings, provider)
+
+    out = asyncio.run(service.handle_batch([_entity("e1", ["BTCUSDT"]), _entity("e2", ["ETHUSDT"])]))
+
+    signals = {payload["event_id"]: payload for _, payload in out}
+    assert signals["e1"]["rationale"] == "btc up"
+    assert signals["e2"]["rationale"].startswith("heuristic")
+
+
+def test_infer_batch_retries_a_transient_failure_before_falling_back():
+    settings = AppSettings(bus_backend="memory")
+    reply = json.dumps([{"event_id": "e1", "symbol": "BTCUSDT", "side": 1, "strength": 0.7, "confidence": 0.8,
+                         "horizon_min": 90, "rationale": "btc up"}])
+    provider, completions = _provider_with_reply(settings, reply)
+    create = completions.create
+
+    async def flaky(**kwargs):
+        if not completions.calls:
+            completions.calls.append(kwargs)
+            raise RuntimeError("503 upstream unavailable")
+        return await create(**kwargs)
+
+    completions.create = flaky
+
+    results = asyncio.run(provider.infer_batch([EntityEvent.model_validate(_entity("e1", ["BTCUSDT"]))]))
+
+    assert len(completions.calls) == 2
+    assert results[("e1", "BTCUSDT")]["rationale"] == "btc up"
+
+
+def test_batch_worker_groups_records_up_to_max_batch():
+    async def scenario() -> list[int]:
+        bus = InMemoryEventBus()
+        for idx in range(5):
+            await bus.publish("news.entity", {"n": idx})
+
+        sizes: list[int] = []
+
+        async def handler(payloads: list[dict]) -> list[tuple[str, dict]]:
+            sizes.append(len(payloads))
+            return []
+
+        task = asyncio.create_task(
+            run_batch_stream_worker(
+                service_name="test",
+                bus=bus,
+                input_stream="news.entity",
+                handler=handler,
+                max_batch=2,
+                max_wait_ms=10,
+                idle_sleep_sec=0.01,
+            )
+        )
+        await asyncio.sleep(0.1)
+        task.cancel()
+        return sizes
+
+    assert asyncio.run(scenario()) == [2, 2, 1]
+
+
+def test_batch_worker_skips_a_poison_record_and_moves_on():
+    async def scenario():
+        bus = InMemoryEventBus()
+        await bus.publish("news.entity", {"bad": 1})
+        for i in range(3):
+            await bus.publish("news.entity", {"event_id": f"e{i}"})
+        calls: list[int] = []
+
+        async def handler(payloads: list[dict]) -> list[tuple[str, dict]]:
+            calls.append(len(payloads))
+            return [("signal", {"event_id": payload["event_id"]}) for payload in payloads]
+
+        task = asyncio.create_task(
+            run_batch_stream_worker(
+                service_name="test",
+                bus=bus,
+                input_stream="news.entity",
+                handler=handler,
+                max_batch=4,
+                max_wait_ms=10,
+                idle_sleep_sec=0.01,
+            )
+        )
+        await asyncio.sleep(0.1)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        published = await bus.read("signal", last_id="0-0")
+        return calls, [record.data["event_id"] for record in published]
+
+    calls, published = asyncio.run(scenario())
+    assert calls == [4, 1, 1, 1, 1]
+    assert published == ["e0", "e1", "e2"]
+
+
+class FakeStreamingCompletions:
+    def __init__(self, pieces: list[str]):
+        self.pieces = pieces
+
+    async def create(self, **kwargs):
+        assert kwargs["stream"] is True
+
+        async def chunks():
+            for piece in self.pieces:
+                delta = SimpleNamespace(content=piece)
+                yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+        return chunks()
+
+
+def test_incremental_parser_waits_for_complete_numbers():
+    parser = IncrementalSignalParser()
+    parser.feed('{"side": -1, "strength": 0.')
+    assert parser.fields == {"side": -1.0}
+    parser.feed('65, "confidence": 0.8')
+    assert not parser.has_core
+    parser.feed(', "horizon_min": 45, "rationale": "exploit drains bridge"}')
+    assert parser.has_core
+    assert parser.fields["strength"] == 0.65
+    assert parser.fields["horizon_min"] == 45.0
+
+
+def test_streaming_publishes_provisional_signal_before_rationale():
+    settings = AppSettings(bus_backend="memory", llm_streaming=True)
+    provider = LLMProvider(settings)
+    text = '{"side": 1, "strength": 0.7, "confidence": 0.85, "horizon_min": 120, "rationale": "ETF inflows keep rising"}'
+    provider._client = SimpleNamespace(
+        chat=SimpleNamespace(completions=FakeStreamingCompletions([text[i : i + 5] for i in range(0, len(text), 5)]))
+    )
+    bus = InMemoryEventBus()
+    service = LLMSignalService(settings, provider, bus=bus)
+
+    out = asyncio.run(service.handle(_entity("e1", ["BTCUSDT"])))
+    published = asyncio.run(bus.read("signal.raw", "0-0"))
+
+    assert len(published) == 1
+    assert published[0].data["side"] == 1
+    assert published[0].data["confidence"] == 0.85
+    assert published[0].data["rationale"] == "provisional"
+    assert [stream for stream, _ in out] == ["signal.rationale"]
+    assert out[0][1]["rationale"] == "ETF inflows keep rising"
+
+
+def test_streaming_without_core_fields_falls_back_to_full_signal():
+    settings = AppSettings(bus_backend="memory", llm_streaming=True)
+    provider = LLMProvider(settings)
+    provider._client = SimpleNamespace(chat=SimpleNamespace(completions=FakeStreamingCompletions(["not json"])))
+    service = LLMSignalService(settings, provider)
+
+    out = asyncio.run(service.handle(_entity("e1", ["BTCUSDT"])))
+
+    assert len(out) == 1
+    assert out[0][0] == "signal.raw"
+    assert out[0][1]["rationale"].startswith("heuristic")
+
+
+def test_streaming_replay_does_not_republish_the_provisional_signal():
+    settings = AppSettings(bus_backend="memory", llm_streaming=True)
+    provider = LLMProvider(settings)
+    calls = {"n": 0}
+
+    async def infer_stream(title, content, symbol, on_core):
+        calls["n"] += 1
+        await on_core({"side": -1, "strength": 0.6, "confidence": 0.9, "horizon_min": 240})
+        if calls["n"] == 1:
+            raise RuntimeError("connection reset after the core fields")
+        return {"side": -1, "strength": 0.6, "confidence": 0.9, "horizon_min": 240, "rationale": "bridge exploit"}
+
+    provider.infer_stream = infer_stream
+    bus = InMemoryEventBus()
+    service = LLMSignalService(settings, provider, bus=bus)
+
+    try:
+        asyncio.run(service.handle(_entity("e1", ["ETHUSDT"])))
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("expected the first attempt to fail")
+    out = asyncio.run(service.handle(_entity("e1", ["ETHUSDT"])))
+    published = asyncio.run(bus.read("signal.raw", "0-0"))
+
+    assert len(published) == 1
+    assert published[0].data["horizon_min"] == 240
+    assert out[0][1]["signal_generated_at"] == published[0].data["generated_at"]
+    assert out[0][1]["horizon_min"] == 240
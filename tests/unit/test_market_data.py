@@ -0,0 +1,147 @@
+import asyncio
+import json
+
+import websockets
+
+from common_types.models import OrderIntent
+from common_types.universe import UniverseSnapshot
+from exchange_adapters import BinanceMarketDataFeed, MarketDataCache
+from exchange_adapters.binance import BinanceExchangeAdapter
+
+
+def _intent() -> OrderIntent:
+    return OrderIntent(
+        intent_id="intent-1",
+        event_id="evt-1",
+        symbol="BTCUSDT",
+        market="perp",
+        side=1,
+        qty_usd=650,
+        max_slippage_bps=20,
+        reason="test",
+    )
+
+
+def test_market_data_feed_fills_cache_from_local_websocket():
+    frames = {
+        "perp": [
+            {"stream": "btcusdt@markPrice@1s", "data": {"e": "markPriceUpdate", "s": "BTCUSDT", "p": "65000.5"}},
+            {"stream": "btcusdt@bookTicker", "data": {"e": "bookTicker", "s": "BTCUSDT", "b": "64999", "a": "65001"}},
+        ],
+        "spot": [{"stream": "btcusdt@bookTicker", "data": {"u": 1, "s": "BTCUSDT", "b": "64990", "a": "65010"}}],
+    }
+    requested: list[str] = []
+
+    async def _handler(ws):
+        requested.append(ws.request.path)
+        market = "perp" if "markPrice" in ws.request.path else "spot"
+        for frame in frames[market]:
+            await ws.send(json.dumps(frame))
+        await ws.wait_closed()
+
+    async def _run():
+        async with websockets.serve(_handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            cache = MarketDataCache(max_age_sec=5)
+            feed = BinanceMarketDataFeed(
+                cache,
+                {"BTCUSDT"},
+                spot_ws_base=f"ws://127.0.0.1:{port}/spot",
+                perp_ws_base=f"ws://127.0.0.1:{port}/perp",
+            )
+            task = asyncio.create_task(feed.run())
+            for _ in range(100):
+                if cache.price("spot", "BTCUSDT") and cache.get("perp", "BTCUSDT") and cache.get("perp", "BTCUSDT").bid:
+                    break
+                await asyncio.sleep(0.01)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            return cache
+
+    cache = asyncio.run(_run())
+    assert cache.price("perp", "BTCUSDT") == 65000.5
+    assert cache.price("spot", "BTCUSDT") == 65000.0
+    assert any("btcusdt@markPrice@1s" in path for path in requested)
+    assert cache.price("perp", "BTCUSDT", max_age_sec=-1) is None
+
+
+def test_market_data_feed_resubscribes_when_the_universe_changes():
+    requested: list[str] = []
+
+    async def _handler(ws):
+        path = ws.request.path
+        requested.append(path)
+        if "/spot" in path:
+            for symbol in ("BTCUSDT", "ETHUSDT"):
+                if f"{symbol.lower()}@bookTicker" in path:
+                    await ws.send(json.dumps({"stream": "x", "data": {"u": 1, "s": symbol, "b": "10", "a": "12"}}))
+        await ws.wait_closed()
+
+    async def _run():
+        async with websockets.serve(_handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            adapter = BinanceExchangeAdapter("test_key", "test_secret", use_testnet=True)
+            adapter.apply_universe(UniverseSnapshot.from_symbols({"BTCUSDT"}, version=1))
+            adapter.market_feed.spot_ws_base = f"ws://127.0.0.1:{port}/spot"
+            adapter.market_feed.perp_ws_base = f"ws://127.0.0.1:{port}/perp"
+            task = asyncio.create_task(adapter.run_market_data({"BTCUSDT"}))
+            for _ in range(100):
+                if adapter.market_data.price("spot", "BTCUSDT"):
+                    break
+                await asyncio.sleep(0.01)
+            adapter.apply_universe(UniverseSnapshot.from_symbols({"ETHUSDT"}, version=1))
+            assert adapter.market_feed.symbols == ["BTCUSDT"]
+            adapter.apply_universe(UniverseSnapshot.from_symbols({"BTCUSDT", "ETHUSDT"}, version=2))
+            for _ in range(100):
+                if adapter.market_data.price("spot", "ETHUSDT"):
+                    break
+                await asyncio.sleep(0.01)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            return adapter
+
+    adapter = asyncio.run(_run())
+    assert adapter.market_data.price("spot", "ETHUSDT") == 11.0
+    assert sum("ethusdt@bookTicker" in path for path in requested) == 2
+    assert not adapter.market_feed.set_symbols({"ethusdt", "btcusdt"})
+
+
+def test_market_data_feed_follows_newer_universe_versions_only():
+    feed = BinanceMarketDataFeed(MarketDataCache(), {"BTCUSDT"})
+    delisted = UniverseSnapshot.from_symbols({"BTCUSDT", "ETHUSDT"}, version=3)
+    delisted.symbols["ETHUSDT"].spot.status = delisted.symbols["ETHUSDT"].perp.status = "BREAK"
+
+    assert feed.apply_universe(UniverseSnapshot.from_symbols({"BTCUSDT", "SOLUSDT"}, version=2))
+    assert not feed.apply_universe(UniverseSnapshot.from_symbols({"BTCUSDT"}, version=1))
+    assert feed.symbols == ["BTCUSDT", "SOLUSDT"]
+    # Symbols that are no longer tradable in either market are dropped from the subscription.
+    assert feed.apply_universe(delisted)
+    assert feed.symbols == ["BTCUSDT"]
+    assert not feed.apply_universe(UniverseSnapshot.from_symbols({"BTCUSDT"}, version=4))
+
+
+def test_binance_perp_order_uses_cached_mark_and_falls_back_to_rest_when_stale():
+    cache = MarketDataCache(max_age_sec=5)
+    adapter = BinanceExchangeAdapter("test_key", "test_secret", use_testnet=True, market_data=cache)
+    rest_calls: list[str] = []
+
+    async def fake_fetch_mark_price(symbol: str) -> float:
+        rest_calls.append(symbol)
+        return 50000.0
+
+    async def fake_request(**kwargs):
+        return {"orderId": 7, "executedQty": kwargs["params"]["quantity"], "avgPrice": "0", "status": "FILLED"}
+
+    adapter._fetch_mark_price = fake_fetch_mark_price  # type: ignore
+    adapter._request = fake_request  # type: ignore
+
+    cache.update_mark("perp", "BTCUSDT", 65000.0)
+    report = asyncio.run(adapter.place_order(_intent()))
+    assert rest_calls == []
+    assert report.avg_price == 65000.0
+    assert report.filled_qty == 0.01
+
+    cache.update_mark("perp", "BTCUSDT", 65000.0, at=0.0)
+    report = asyncio.run(adapter.place_order(_intent()))
+    assert rest_calls == ["BTCUSDT"]
+    assert report.avg_price == 50000.0
@@ -0,0 +1,64 @@
+import asyncio
+
+from apps.portfolio_service import PortfolioService
+from common_types import AppSettings
+
+
+def _signal(event_id: str, symbol: str, side: int, strength: float) -> dict:
+    return {
+        "event_id": event_id,
+        "symbol": symbol,
+        "side": side,
+        "strength": strength,
+        "confidence": 0.9,
+        "horizon_min": 60,
+        "ttl_sec": 3600,
+        "rationale": "test",
+    }
+
+
+def test_batch_nets_opposite_signals_into_one_intent():
+    settings = AppSettings(bus_backend="memory", account_equity_usd=100000, risk_per_trade_pct=0.005)
+    svc = PortfolioService(settings)
+
+    out = asyncio.run(
+        svc.handle_batch(
+            [
+                _signal("e1", "BTCUSDT", 1, 0.9),
+                _signal("e2", "BTCUSDT", -1, 0.5),
+                _signal("e3", "ETHUSDT", -1, 0.6),
+            ]
+        )
+    )
+
+    intents = {payload["symbol"]: payload for _, payload in out}
+    assert set(intents) == {"BTCUSDT", "ETHUSDT"}
+    assert intents["BTCUSDT"]["side"] == 1
+    assert intents["BTCUSDT"]["market"] == "spot"
+    assert intents["BTCUSDT"]["event_id"] == "e1"
+    assert abs(intents["BTCUSDT"]["qty_usd"] - 500 * (0.9 - 0.5)) < 1e-6
+    assert intents["ETHUSDT"]["market"] == "perp"
+
+
+def test_batch_drops_fully_offset_positions_and_respects_risk_budget():
+    settings = AppSettings(
+        bus_backend="memory",
+        account_equity_usd=100000,
+        risk_per_trade_pct=0.005,
+        portfolio_batch_risk_budget_pct=0.004,
+    )
+    svc = PortfolioService(settings)
+
+    out = asyncio.run(
+        svc.handle_batch(
+            [
+                _signal("e1", "BTCUSDT", 1, 0.8),
+                _signal("e2", "BTCUSDT", -1, 0.8),
+                _signal("e3", "ETHUSDT", 1, 1.0),
+                _signal("e4", "SOLUSDT", -1, 1.0),
+            ]
+        )
+    )
+
+    assert {payload["symbol"] for _, payload in out} == {"ETHUSDT", "SOLUSDT"}
+    assert abs(sum(payload["qty_usd"] for _, payload in out) - 400.0) < 1e-6
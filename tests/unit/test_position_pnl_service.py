@@ -0,0 +1,194 @@
+import asyncio
+import contextlib
+import itertools
+from datetime import datetime, timezone
+
+import pytest
+
+from apps.position_pnl_service import PositionPnLService
+from common_types.models import OrderIntent
+from exchange_adapters import SimulatedExchangeAdapter
+
+_order_ids = itertools.count(1)
+
+
+def _report(symbol: str, side: int, qty: float, price: float, market: str = "perp", fee: float = 0.0) -> dict:
+    return {
+        "order_id": f"{market}:{symbol}:{next(_order_ids)}",
+        "intent_id": "intent-1",
+        "symbol": symbol,
+        "market": market,
+        "side": side,
+        "status": "filled",
+        "filled_qty": qty,
+        "avg_price": price,
+        "fee": fee,
+        "ts": datetime.now(timezone.utc),
+    }
+
+
+def test_position_book_keeps_running_exposure_and_evicts_flat_positions():
+    svc = PositionPnLService()
+
+    asyncio.run(svc.handle(_report("BTCUSDT", 1, 1.0, 100.0)))
+    asyncio.run(svc.handle(_report("BTCUSDT", 1, 1.0, 200.0)))
+    asyncio.run(svc.handle(_report("ETHUSDT", -1, 2.0, 50.0, market="spot")))
+    assert svc.book.position("perp", "BTCUSDT") == (2.0, 150.0)
+    assert (svc.book.gross, svc.book.net) == (400.0, 200.0)
+    assert svc.book.market_gross == [100.0, 300.0]
+
+    # Selling 3 closes the long at 250 and opens a 1 short at the fill price.
+    out = asyncio.run(svc.handle(_report("BTCUSDT", -1, 3.0, 250.0, fee=1.0)))
+    assert svc.book.position("perp", "BTCUSDT") == (-1.0, 250.0)
+    assert out[0][1]["realized"] == pytest.approx(199.0)
+    assert out[0][1]["exposure"] == pytest.approx(350.0)
+
+    asyncio.run(svc.handle(_report("BTCUSDT", 1, 1.0, 240.0, fee=1.0)))
+    out = asyncio.run(svc.handle(_report("ETHUSDT", 1, 2.0, 40.0, market="spot")))
+    assert len(svc.book) == 0
+    assert svc.positions == {}
+    assert (svc.book.gross, svc.book.net, svc.book.market_gross) == (0.0, 0.0, [0.0, 0.0])
+    # Fees accumulate instead of only the latest one being deducted.
+    assert out[0][1]["realized"] == pytest.approx(200 + 10 + 20 - 2)
+
+
+def test_mark_to_market_revalues_open_positions_from_price_ticks():
+    from exchange_adapters import MarketDataCache
+
+    svc = PositionPnLService(starting_equity=10_000)
+    cache = MarketDataCache(max_age_sec=60)
+    svc.watch(cache)
+
+    asyncio.run(svc.handle(_report("BTCUSDT", 1, 2.0, 100.0)))
+    asyncio.run(svc.handle(_report("ETHUSDT", -1, 10.0, 50.0, market="spot")))
+    cache.update_mark("perp", "BTCUSDT", 150.0)
+    svc.on_price("spot", "ETHUSDT", 40.0)
+    # Ticks for symbols with no open position are ignored.
+    cache.update_book("perp", "SOLUSDT", 10.0, 10.2)
+
+    up = svc.snapshot()
+    assert up.unrealized == pytest.approx(100.0 + 100.0)
+    assert up.drawdown == 0.0
+    assert svc.mtm.equity == pytest.approx(10_200)
+
+    cache.update_mark("perp", "BTCUSDT", 50.0)
+    down = svc.snapshot()
+    assert down.unrealized == pytest.approx(-100.0 + 100.0)
+    assert down.drawdown == pytest.approx(200 / 10_200)
+    assert svc.mtm.peak_equity == pytest.approx(10_200)
+
+
+def test_risk_kill_switch_counts_unrealized_losses():
+    from apps.risk_service import RiskService
+    from common_types import AppSettings
+    from feature_store import MemoryTradingStateStore
+
+    settings = AppSettings(bus_backend="memory", account_equity_usd=100_000, max_daily_drawdown_pct=0.02)
+    risk = RiskService(settings, MemoryTradingStateStore())
+    svc = PositionPnLService(starting_equity=100_000)
+
+    asyncio.run(svc.handle(_report("BTCUSDT", 1, 10.0, 1_000.0)))
+    svc.on_price("perp", "BTCUSDT", 900.0)
+    assert asyncio.run(risk.handle_pnl_snapshot(svc.snapshot().model_dump(mode="json"))) == []
+    svc.on_price("perp", "BTCUSDT", 790.0)
+    alerts = asyncio.run(risk.handle_pnl_snapshot(svc.snapshot().model_dump(mode="json")))
+    assert risk.kill_switch is True
+    assert alerts[0][1]["drawdown"] == pytest.approx(2_100 / 100_000)
+
+
+def test_snapshots_are_coalesced_but_drawdown_jumps_publish_at_once():
+    now = [0.0]
+    svc = PositionPnLService(starting_equity=1000.0, snapshot_interval_sec=1.0, drawdown_step=0.01, clock=lambda: now[0])
+
+    assert len(asyncio.run(svc.handle(_report("BTCUSDT", 1, 1.0, 100.0)))) == 1
+    # A burst inside the interval only updates state.
+    for _ in range(5):
+        assert asyncio.run(svc.handle(_report("BTCUSDT", 1, 1.0, 100.0))) == []
+    assert svc.coalesced == 5
+
+    # 6 long at 100 marked at 97 is a 1.8% drawdown: past the 1% step, so it goes out mid-interval.
+    svc.on_price("perp", "BTCUSDT", 97.0)
+    out = asyncio.run(svc.handle_batch([_report("ETHUSDT", 1, 1.0, 10.0), _report("ETHUSDT", 1, 1.0, 10.0)]))
+    assert out[0][1]["unrealized"] == pytest.approx(-18.0)
+    assert out[0][1]["drawdown"] == pytest.approx(0.018)
+    assert svc.emitted == 2
+
+    # The timer flushes the latest state once the interval has passed.
+    asyncio.run(svc.handle(_report("ETHUSDT", -1, 2.0, 11.0)))
+    assert svc._coalesce(pending=False) == []
+    now[0] = 1.5
+    flushed = svc._coalesce(pending=False)
+    assert flushed[0][1]["realized"] == pytest.approx(2.0)
+    assert not svc._dirty
+
+
+def test_coalesced_fills_skip_the_full_revaluation():
+    now = [0.0]
+    svc = PositionPnLService(starting_equity=1000.0, snapshot_interval_sec=1.0, drawdown_step=0.01, clock=lambda: now[0])
+    fills = [("BTCUSDT", 1, 2.0, 100.0), ("ETHUSDT", -1, 3.0, 10.0), ("BTCUSDT", -1, 3.0, 104.0), ("ETHUSDT", 1, 3.0, 9.0)]
+    for fill in fills:
+        asyncio.run(svc.handle(_report(*fill)))
+        svc.on_price("perp", "BTCUSDT", 101.0)
+        svc.on_price("spot", "BTCUSDT", 50.0)
+
+    # Only the first snapshot went out, so only it paid for a full pass over the book.
+    assert (svc.emitted, svc.coalesced, svc.mtm.revaluations) == (1, 3, 1)
+    # The running sum tracks the flip to short 1 BTC at 104 marked at 101; ETH closed flat.
+    assert svc.book.upnl == pytest.approx(svc.book.unrealized()) == pytest.approx(3.0)
+    assert svc.mtm.unrealized == pytest.approx(3.0)
+
+
+def test_snapshot_timer_stays_quiet_until_a_fill_or_mark_changes():
+    svc = PositionPnLService(snapshot_interval_sec=0.01)
+    asyncio.run(svc.handle(_report("BTCUSDT", 1, 1.0, 100.0)))
+    published: list[dict] = []
+
+    async def _publish(stream: str, payload: dict) -> None:
+        published.append(payload)
+
+    async def _run(ticks: list[float]) -> None:
+        task = asyncio.create_task(svc.run_snapshots(_publish))
+        for price in ticks:
+            svc.on_price("perp", "BTCUSDT", price)
+            await asyncio.sleep(0.12)
+        await asyncio.sleep(0.12)
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    # An open position with an unchanged mark publishes nothing between fills.
+    asyncio.run(_run([100.0]))
+    assert published == []
+    asyncio.run(_run([101.0]))
+    assert [p["unrealized"] for p in published] == [pytest.approx(1.0)]
+
+
+def test_cumulative_order_updates_from_the_simulator_are_booked_once():
+    now = [1000.0]
+    adapter = SimulatedExchangeAdapter(seed=1, volatility_bps=0, level_depth_usd=10_000, clock=lambda: now[0])
+    intent = OrderIntent(
+        intent_id="i1", event_id="e1", symbol="BTCUSDT", market="perp", side=1, qty_usd=50_000, max_slippage_bps=2, reason="test"
+    )
+    svc = PositionPnLService()
+
+    async def _run():
+        report = await adapter.place_order(intent)
+        await svc.handle(report.model_dump(mode="json"))
+        stream = adapter.stream_execution_events()
+        for _ in range(50):
+            now[0] += 0.5
+            event = await asyncio.wait_for(stream.__anext__(), timeout=1)
+            await svc.handle(event)
+            # A repeated update carries the same cumulative fill and adds nothing.
+            await svc.handle(event)
+            if event["status"] == "filled":
+                break
+        await stream.aclose()
+        return event
+
+    final = asyncio.run(_run())
+    qty, avg_cost = svc.book.position("perp", "BTCUSDT")
+    assert qty == pytest.approx(asyncio.run(adapter.fetch_positions())[0]["qty"])
+    assert qty == pytest.approx(final["filled_qty"])
+    assert avg_cost == pytest.approx(final["avg_price"])
+    assert svc.fees == pytest.approx(final["fee"])
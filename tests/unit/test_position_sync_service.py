@@ -70,3 +70,48 @@ def test_position_sync_skips_when_not_live_mode():
     result = asyncio.run(svc.run_once())
     assert result["skipped"] is True
     assert asyncio.run(state.get_total_exposure()) == 0.0
+
+
+def test_account_events_write_only_changed_symbols_as_deltas():
+    settings = AppSettings(bus_backend="memory", execution_mode="live", account_equity_usd=100000)
+    state = MemoryTradingStateStore()
+    adapter = FakeAdapter(
+        [
+            {"market": "spot", "symbol": "BTCUSDT", "qty": 0.1, "notional_usd": 6500},
+            {"market": "perp", "symbol": "ETHUSDT", "qty": -1.2, "notional_usd": 3600},
+        ]
+    )
+    svc = PositionSyncService(settings, adapter, state, InMemoryEventBus(), clock=lambda: 1.0)
+    asyncio.run(svc.run_once())
+    # A reservation risk made for another symbol since the audit is left alone.
+    asyncio.run(state.add_symbol_exposure("SOLUSDT", 500))
+
+    perp = {"market": "perp", "symbol": "ETHUSDT", "qty": 0.5, "notional_usd": 1500}
+    spot = {"market": "spot", "symbol": "BTCUSDT", "qty": 0.2}
+    result = asyncio.run(svc.apply_account_event({"event_type": "account", "event_ms": 2000, "positions": [perp, spot]}))
+    assert result["symbols"] == ["BTCUSDT", "ETHUSDT"]
+
+    view = asyncio.run(state.get_exposure_view(["BTCUSDT", "ETHUSDT", "SOLUSDT"]))
+    # The spot balance is valued at the audited unit price of 65000.
+    assert view.symbol == {"BTCUSDT": 13000.0, "ETHUSDT": 1500.0, "SOLUSDT": 500.0}
+    assert view.market == {"spot": 13000.0, "perp": 1500.0}
+    assert view.side == {"long": 14500.0, "short": 0.0}
+    assert view.total == 14500.0
+
+    closed = {"market": "perp", "symbol": "ETHUSDT", "qty": 0.0, "notional_usd": 0.0}
+    asyncio.run(svc.apply_account_event({"event_type": "account", "event_ms": 3000, "positions": [closed]}))
+    assert asyncio.run(state.get_symbol_exposure("ETHUSDT")) == 0.0
+    assert asyncio.run(state.get_total_exposure()) == 13000.0
+
+    # A new asset has no audited price: nothing is written for it and an audit is requested instead.
+    unpriced = {"market": "spot", "symbol": "DOGEUSDT", "qty": 1000.0}
+    skipped = asyncio.run(svc.apply_account_event({"event_type": "account", "event_ms": 3500, "positions": [unpriced]}))
+    assert skipped["applied"] is False
+    assert svc._audit_requested.is_set()
+    assert asyncio.run(state.get_symbol_exposure("DOGEUSDT")) == 0.0
+    assert asyncio.run(state.get_total_exposure()) == 13000.0
+
+    # Events older than the last audit are already reflected in it.
+    stale = asyncio.run(svc.apply_account_event({"event_type": "account", "event_ms": 500, "positions": [perp]}))
+    assert stale["applied"] is False
+    assert svc.events_stale == 1
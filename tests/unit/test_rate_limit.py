@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+from exchange_adapters.rate_limit import (
+    PRIORITY_ACCOUNT,
+    PRIORITY_BACKGROUND,
+    PRIORITY_ORDER,
+    BinanceRateLimiter,
+    RateLimitExceeded,
+)
+
+
+class _Clock:
+    def __init__(self, now: float):
+        self.now = now
+        self.slept: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def _limiter(clock: _Clock) -> BinanceRateLimiter:
+    return BinanceRateLimiter(
+        weight_limits={"1m": 100},
+        order_limits={"10s": 5},
+        clock=clock,
+        sleep=clock.sleep,
+    )
+
+
+def test_limiter_tracks_headers_and_delays_low_priority_near_the_limit():
+    clock = _Clock(now=1_000_040.0)
+    limiter = _limiter(clock)
+    limiter.update({"X-MBX-USED-WEIGHT-1M": "75", "X-MBX-ORDER-COUNT-10S": "2"})
+
+    metrics = limiter.metrics()
+    assert metrics["weight"]["1m"]["used"] == 75
+    assert metrics["weight"]["1m"]["headroom_pct"] == pytest.approx(0.25)
+    assert metrics["orders"]["10s"]["used"] == 2
+
+    # Orders may use the full budget; account polls stop at 80% and wait for the next minute.
+    asyncio.run(limiter.acquire(PRIORITY_ORDER, weight=1, is_order=True))
+    assert clock.slept == []
+    asyncio.run(limiter.acquire(PRIORITY_ACCOUNT, weight=20))
+    assert clock.slept == [pytest.approx(40.0)]
+    assert limiter.metrics()["weight"]["1m"]["used"] == 20
+    assert limiter.delayed == 1
+
+    limiter.update({"x-mbx-used-weight-1m": "59"})
+    asyncio.run(limiter.acquire(PRIORITY_BACKGROUND, weight=2))
+    assert len(clock.slept) == 2
+
+
+def test_limiter_backs_off_after_429_and_fails_orders_fast():
+    clock = _Clock(now=2_000_000.0)
+    limiter = _limiter(clock)
+    limiter.update({"Retry-After": "30"}, status_code=429)
+
+    with pytest.raises(RateLimitExceeded):
+        asyncio.run(limiter.acquire(PRIORITY_ORDER, is_order=True))
+
+    asyncio.run(limiter.acquire(PRIORITY_ACCOUNT))
+    assert clock.slept == [30.0]
+    assert limiter.metrics()["banned_for_sec"] == 0.0
+
+
+def test_limiter_rejects_orders_past_the_order_count_limit():
+    clock = _Clock(now=3_000_000.0)
+    limiter = _limiter(clock)
+    for _ in range(5):
+        asyncio.run(limiter.acquire(PRIORITY_ORDER, is_order=True))
+    with pytest.raises(RateLimitExceeded):
+        asyncio.run(limiter.acquire(PRIORITY_ORDER, is_order=True))
+    clock.now += 10
+    asyncio.run(limiter.acquire(PRIORITY_ORDER, is_order=True))
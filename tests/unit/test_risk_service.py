@@ -113,3 +113,37 @@ def test_risk_rejects_when_short_side_limit_is_exhausted():
     assert out1[0][0] == "order.approved"
     assert out2[0][0] == "order.rejected"
     assert out2[0][1]["reason_code"] == "SIDE_EXPOSURE_LIMIT"
+
+
+def test_risk_batch_caps_sequentially_and_persists_once():
+    settings = AppSettings(
+        bus_backend="memory",
+        account_equity_usd=100000,
+        max_symbol_exposure_pct=0.05,
+        max_total_exposure_pct=0.5,
+        max_spot_exposure_pct=0.5,
+        max_long_exposure_pct=0.5,
+    )
+    state = MemoryTradingStateStore()
+    svc = RiskService(settings, state)
+
+    def _intent(intent_id: str, qty_usd: float) -> dict:
+        return {
+            "intent_id": intent_id,
+            "event_id": "e1",
+            "symbol": "BTCUSDT",
+            "market": "spot",
+            "side": 1,
+            "qty_usd": qty_usd,
+            "max_slippage_bps": 20,
+            "reason": "batch",
+        }
+
+    out = asyncio.run(svc.handle_order_intents([_intent("b1", 3000), _intent("b2", 3000), _intent("b3", 100)]))
+
+    assert [stream for stream, _ in out] == ["order.approved", "order.approved", "order.rejected"]
+    assert out[1][1]["qty_usd"] == 2000
+    assert out[2][1]["reason_code"] == "SYMBOL_EXPOSURE_LIMIT"
+    assert asyncio.run(state.get_symbol_exposure("BTCUSDT")) == 5000
+    assert asyncio.run(state.get_total_exposure()) == 5000
+    assert asyncio.run(state.get_side_exposure(1)) == 5000
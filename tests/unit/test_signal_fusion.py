@@ -3,6 +3,7 @@ from datetime import datetime, timedelta, timezone
 
 from apps.signal_fusion_service import SignalFusionService
 from common_types import AppSettings
+from feature_store import ConsistentHashRing, FusionBook, MemoryFusionStateStore
 
 
 def test_signal_fusion_filters_low_confidence():
@@ -57,3 +58,137 @@ def test_signal_fusion_blocks_conflict_signal():
 
     assert len(out1) == 1
     assert out2 == []
+
+
+def _signal(event_id: str, side: int, strength: float, confidence: float, generated_at: datetime) -> dict:
+    return {
+        "event_id": event_id,
+        "symbol": "BTCUSDT",
+        "side": side,
+        "strength": strength,
+        "confidence": confidence,
+        "horizon_min": 60,
+        "ttl_sec": 3600,
+        "rationale": event_id,
+        "generated_at": generated_at,
+    }
+
+
+def test_signal_fusion_agreeing_signals_strengthen_each_other():
+    settings = AppSettings(bus_backend="memory", min_signal_confidence=0.65)
+    svc = SignalFusionService(settings)
+
+    now = datetime.now(timezone.utc)
+    out1 = asyncio.run(svc.handle(_signal("e1", 1, 0.5, 0.8, now)))
+    out2 = asyncio.run(svc.handle(_signal("e2", 1, 0.5, 0.8, now + timedelta(seconds=30))))
+
+    first = out1[0][1]["strength"]
+    second = out2[0][1]["strength"]
+    assert round(first, 6) == round(0.5 * (0.8 + 0.2 * 0.8), 6)
+    assert second > first
+    assert out2[0][1]["rationale"].startswith("fused n=2:")
+
+
+def test_signal_fusion_lets_much_stronger_opposite_signal_through():
+    settings = AppSettings(bus_backend="memory", min_signal_confidence=0.65)
+    svc = SignalFusionService(settings)
+
+    now = datetime.now(timezone.utc)
+    asyncio.run(svc.handle(_signal("e1", 1, 0.3, 0.7, now)))
+    out = asyncio.run(svc.handle(_signal("e2", -1, 0.9, 0.9, now + timedelta(minutes=1))))
+
+    assert len(out) == 1
+    assert out[0][1]["side"] == -1
+
+
+def test_fusion_book_decays_and_evicts_idle_symbols():
+    book = FusionBook(capacity=4, half_life_sec=60, evict_epsilon=1e-3)
+
+    book.update("BTCUSDT", 0.0, 1.0)
+    buffer = book.get("BTCUSDT")
+    assert abs(buffer.net_at(60.0, book.decay_rate) - 0.5) < 1e-9
+
+    book.update("ETHUSDT", 3600.0, 1.0)
+    assert "BTCUSDT" not in book
+    assert "ETHUSDT" in book
+
+
+def test_signal_ring_buffer_drops_oldest_contribution_when_full():
+    book = FusionBook(capacity=2, half_life_sec=1e9)
+
+    book.update("BTCUSDT", 0.0, 1.0)
+    book.update("BTCUSDT", 1.0, 0.5)
+    buffer = book.update("BTCUSDT", 2.0, -0.25)
+
+    assert buffer.size == 2
+    assert abs(buffer.net - 0.25) < 1e-6
+    assert abs(buffer.gross - 0.75) < 1e-6
+
+
+def test_redis_fusion_script_matches_the_memory_book():
+    import pytest
+
+    pytest.importorskip("lupa")
+    from benchmarks.redis_standin import RedisStandIn
+    from feature_store import RedisFusionStateStore
+
+    now = [0.0]
+    client = RedisStandIn(clock=lambda: now[0])
+    redis_store = RedisFusionStateStore("redis://standin", capacity=3, half_life_sec=60, evict_epsilon=1e-3, client=client)
+    memory_store = MemoryFusionStateStore(capacity=3, half_life_sec=60, evict_epsilon=1e-3)
+    # Decay between updates, an out-of-order timestamp, and enough updates to wrap the ring twice.
+    updates = [(0.0, 1.0), (30.0, -0.5), (60.0, 0.8), (45.0, 0.2), (120.0, -1.0), (121.0, 0.3), (300.0, 0.6)]
+
+    for ts, contribution in updates:
+        got = asyncio.run(redis_store.update("btcusdt", ts, contribution))
+        want = asyncio.run(memory_store.update("BTCUSDT", ts, contribution))
+        assert got.size == want.size
+        assert got.net == pytest.approx(want.net, abs=1e-12)
+        assert got.gross == pytest.approx(want.gross, abs=1e-12)
+    assert got.size == 3
+    assert int(client._cmd_hgetall("fusion:{BTCUSDT}")["head"]) == len(updates) % 3
+
+    # Once a full buffer would have decayed below epsilon the key expires and the symbol starts over.
+    now[0] += redis_store._ttl_sec + 1
+    fresh = asyncio.run(redis_store.update("BTCUSDT", 10_000.0, 0.4))
+    assert (fresh.size, fresh.net, fresh.gross) == (1, 0.4, 0.4)
+
+
+def test_consistent_hash_ring_moves_few_symbols_when_replica_added():
+    symbols = [f"SYM{idx}USDT" for idx in range(2000)]
+    two = ConsistentHashRing(["fusion-a", "fusion-b"])
+    three = ConsistentHashRing(["fusion-a", "fusion-b", "fusion-c"])
+
+    owners = {two.owner(symbol) for symbol in symbols}
+    moved = sum(1 for symbol in symbols if two.owner(symbol) != three.owner(symbol))
+
+    assert owners == {"fusion-a", "fusion-b"}
+    assert moved < len(symbols) * 0.5
+    assert all(three.owner(symbol) == "fusion-c" for symbol in symbols if two.owner(symbol) != three.owner(symbol))
+
+
+def test_sharded_replicas_share_state_and_split_symbols():
+    store = MemoryFusionStateStore()
+    replicas = [
+        SignalFusionService(
+            AppSettings(bus_backend="memory", fusion_replicas="fusion-a,fusion-b", fusion_replica_id=replica_id),
+            store,
+        )
+        for replica_id in ("fusion-a", "fusion-b")
+    ]
+
+    now = datetime.now(timezone.utc)
+    symbols = [f"SYM{idx}USDT" for idx in range(16)]
+    for symbol in symbols:
+        payload = {**_signal("e1", 1, 0.7, 0.8, now), "symbol": symbol}
+        handled = [len(asyncio.run(svc.handle(payload))) for svc in replicas]
+        assert sorted(handled) == [0, 1]
+
+    # A conflicting signal is blocked even if a restarted replica picks it up, because state lives in the store.
+    restarted = SignalFusionService(
+        AppSettings(bus_backend="memory", fusion_replicas="fusion-a,fusion-b", fusion_replica_id="fusion-a"),
+        store,
+    )
+    symbol = next(s for s in symbols if restarted.owns(s))
+    opposite = {**_signal("e2", -1, 0.65, 0.82, now + timedelta(minutes=5)), "symbol": symbol}
+    assert asyncio.run(restarted.handle(opposite)) == []
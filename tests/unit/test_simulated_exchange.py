@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+
+from common_types.models import ExecutionReport, OrderIntent
+from exchange_adapters import SimulatedExchangeAdapter
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _intent(idx: int, qty_usd: float = 100.0, side: int = 1, slippage_bps: int = 20) -> OrderIntent:
+    return OrderIntent(
+        intent_id=f"intent-{idx}",
+        event_id="e1",
+        symbol="BTCUSDT",
+        market="perp",
+        side=side,
+        qty_usd=qty_usd,
+        max_slippage_bps=slippage_bps,
+        reason="test",
+    )
+
+
+def test_simulated_exchange_is_deterministic_for_a_seed_and_clock():
+    def _run():
+        clock = _Clock()
+        adapter = SimulatedExchangeAdapter(seed=7, clock=clock)
+        prices = []
+        for idx in range(20):
+            clock.now += 0.5
+            prices.append(asyncio.run(adapter.place_order(_intent(idx, side=1 if idx % 2 else -1))).avg_price)
+        return prices
+
+    first, second = _run(), _run()
+    assert first == second
+    assert len(set(first)) > 2
+
+
+def test_simulated_exchange_charges_spread_depth_and_fees():
+    clock = _Clock()
+    adapter = SimulatedExchangeAdapter(seed=1, volatility_bps=0, level_depth_usd=10_000, clock=clock)
+
+    small = asyncio.run(adapter.place_order(_intent(1, qty_usd=1_000)))
+    large = asyncio.run(adapter.place_order(_intent(2, qty_usd=30_000, slippage_bps=50)))
+    sell = asyncio.run(adapter.place_order(_intent(3, qty_usd=1_000, side=-1)))
+
+    assert small.status == "filled"
+    assert small.avg_price == pytest.approx(65000 * 1.0001)
+    assert small.fee == pytest.approx(small.filled_qty * small.avg_price * 0.0004)
+    # The second buy starts where the first left the ask side and walks three more levels.
+    assert large.status == "filled"
+    assert large.avg_price > small.avg_price
+    assert sell.avg_price == pytest.approx(65000 * 0.9999)
+
+
+def test_simulated_exchange_rests_remainder_and_streams_fills_as_book_refills():
+    clock = _Clock()
+    adapter = SimulatedExchangeAdapter(seed=1, volatility_bps=0, level_depth_usd=10_000, resilience_sec=1.0, clock=clock)
+
+    report = asyncio.run(adapter.place_order(_intent(1, qty_usd=50_000, slippage_bps=2)))
+    assert report.status == "partially_filled"
+    # Levels sit at 1 and 2 bps from mid, so a 2 bps limit reaches two 10k levels.
+    assert report.filled_qty * 65000 == pytest.approx(20_000, rel=1e-3)
+
+    queued = asyncio.run(adapter.place_order(_intent(2, qty_usd=1_000, slippage_bps=2)))
+    assert queued.status == "new"
+
+    async def _drain():
+        events = []
+        stream = adapter.stream_execution_events()
+        while len(events) < 50:
+            clock.now += 0.5
+            event = await asyncio.wait_for(stream.__anext__(), timeout=1)
+            events.append(event)
+            if event["intent_id"] == "intent-2" and event["status"] == "filled":
+                break
+        await stream.aclose()
+        return events
+
+    events = asyncio.run(_drain())
+    first_done = next(i for i, e in enumerate(events) if e["intent_id"] == "intent-1" and e["status"] == "filled")
+    second_done = next(i for i, e in enumerate(events) if e["intent_id"] == "intent-2" and e["status"] == "filled")
+    assert first_done < second_done
+    assert events[first_done]["filled_qty"] * 65000 == pytest.approx(50_000, rel=1e-6)
+    assert all(ExecutionReport.model_validate(event).order_id.startswith("paper-") for event in events)
+
+    positions = asyncio.run(adapter.fetch_positions())
+    assert positions[0]["qty"] * 65000 == pytest.approx(51_000, rel=1e-6)
+
+
+def test_simulated_exchange_expires_and_cancels_resting_orders():
+    clock = _Clock()
+    adapter = SimulatedExchangeAdapter(seed=1, volatility_bps=0, level_depth_usd=10_000, rest_ttl_sec=1.0, clock=clock)
+
+    expiring = asyncio.run(adapter.place_order(_intent(1, qty_usd=50_000, slippage_bps=2)))
+    clock.now += 0.01
+    assert adapter.poll() == 1
+    clock.now += 5
+    assert adapter.poll() == 0
+    cancelled = asyncio.run(adapter.place_order(_intent(2, qty_usd=50_000, slippage_bps=2)))
+
+    assert asyncio.run(adapter.cancel_order(cancelled.order_id)) is True
+    assert asyncio.run(adapter.cancel_order(expiring.order_id)) is False
+    statuses = [adapter._events.get_nowait()["status"] for _ in range(adapter._events.qsize())]
+    assert statuses[-2:] == ["canceled", "canceled"]
+
+
+def test_simulated_exchange_place_orders_matches_in_submission_order():
+    clock = _Clock()
+    adapter = SimulatedExchangeAdapter(seed=1, volatility_bps=0, level_depth_usd=10_000, clock=clock)
+
+    reports = asyncio.run(adapter.place_orders([_intent(1, qty_usd=10_000), _intent(2, qty_usd=10_000)]))
+
+    assert [report.intent_id for report in reports] == ["intent-1", "intent-2"]
+    assert reports[0].avg_price == pytest.approx(65000 * 1.0001)
+    assert reports[1].avg_price == pytest.approx(65000 * 1.0002)
@@ -1,6 +1,7 @@
 import asyncio
 
-from feature_store import MemoryTradingStateStore
+from benchmarks.redis_standin import RedisStandIn
+from feature_store import MemoryTradingStateStore, RedisTradingStateStore
 
 
 def test_memory_state_replace_snapshot_clears_old_values():
@@ -27,3 +28,24 @@ def test_memory_state_replace_snapshot_clears_old_values():
     assert asyncio.run(state.get_side_exposure(1)) == 0.0
     assert asyncio.run(state.get_side_exposure(-1)) == 500
     assert asyncio.run(state.get_total_exposure()) == 500
+
+
+def test_redis_state_exposure_view_and_deltas_use_one_round_trip_each():
+    client = RedisStandIn()
+    state = RedisTradingStateStore("redis://standin", client=client)
+
+    asyncio.run(
+        state.apply_exposure_deltas(
+            symbol_deltas={"BTCUSDT": 1000, "ETHUSDT": 250},
+            market_deltas={"spot": 1000, "perp": 250},
+            side_deltas={"long": 1000, "short": 250},
+            total_delta=1250,
+        )
+    )
+    view = asyncio.run(state.get_exposure_view(["btcusdt", "SOLUSDT"]))
+
+    assert client.round_trips == 2
+    assert view.symbol == {"BTCUSDT": 1000, "SOLUSDT": 0.0}
+    assert view.market == {"spot": 1000, "perp": 250}
+    assert view.side == {"long": 1000, "short": 250}
+    assert view.total == 1250
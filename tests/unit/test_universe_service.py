@@ -0,0 +1,110 @@
+import asyncio
+
+from apps.risk_service import RiskService
+from apps.universe_service import UniverseRefresher, UniverseService
+from common_types import AppSettings, Streams
+from common_types.universe import UniverseSnapshot
+from exchange_adapters.exchange_info import build_universe_snapshot, parse_exchange_info
+from feature_store import MemoryTradingStateStore, MemoryUniverseStore
+
+
+def _spot_info(status_by_symbol: dict[str, str]) -> dict:
+    return {
+        "symbols": [
+            {
+                "symbol": symbol,
+                "status": status,
+                "filters": [
+                    {"filterType": "PRICE_FILTER", "tickSize": "0.01"},
+                    {"filterType": "LOT_SIZE", "minQty": "0.0001", "maxQty": "9000", "stepSize": "0.0001"},
+                    {"filterType": "NOTIONAL", "minNotional": "5.0"},
+                ],
+            }
+            for symbol, status in status_by_symbol.items()
+        ]
+    }
+
+
+def _signal(symbol: str) -> dict:
+    return {
+        "event_id": "e1",
+        "symbol": symbol,
+        "side": 1,
+        "strength": 0.8,
+        "confidence": 0.9,
+        "horizon_min": 60,
+        "ttl_sec": 3600,
+        "rationale": "test",
+    }
+
+
+def _intent(symbol: str, qty_usd: float = 1000.0) -> dict:
+    return {
+        "intent_id": "i1",
+        "event_id": "e1",
+        "symbol": symbol,
+        "market": "spot",
+        "side": 1,
+        "qty_usd": qty_usd,
+        "max_slippage_bps": 20,
+        "reason": "test",
+    }
+
+
+def test_parse_exchange_info_reads_filters_and_skips_halted_symbols():
+    spot = parse_exchange_info("spot", _spot_info({"BTCUSDT": "TRADING", "ETHUSDT": "HALT"}))
+    perp = parse_exchange_info(
+        "perp",
+        {
+            "symbols": [
+                {"symbol": "BTCUSDT", "status": "TRADING", "contractType": "PERPETUAL", "filters": []},
+                {"symbol": "BTCUSDT_240628", "status": "TRADING", "contractType": "CURRENT_QUARTER", "filters": []},
+            ]
+        },
+    )
+    assert spot["BTCUSDT"].step_size == 0.0001
+    assert spot["BTCUSDT"].min_notional == 5.0
+    assert "BTCUSDT_240628" not in perp
+
+    snapshot = build_universe_snapshot({"BTCUSDT", "ETHUSDT", "DOGEUSDT"}, spot, perp, version=3)
+    assert snapshot.is_tradable("BTCUSDT", "perp")
+    assert not snapshot.is_tradable("ETHUSDT")
+    assert snapshot.entry("DOGEUSDT") is None
+
+
+def test_universe_service_hot_reloads_whitelist_without_restart():
+    async def _run():
+        settings = AppSettings(bus_backend="memory", universe_symbols="BTCUSDT")
+        store = MemoryUniverseStore()
+        refresher = UniverseRefresher(settings, store)
+        service = UniverseService(settings)
+
+        assert await service.handle(_signal("SOLUSDT")) == []
+
+        service.apply_snapshot(await refresher.refresh_once())
+        await store.set_whitelist({"BTCUSDT", "SOLUSDT"})
+        updated = await refresher.refresh_once()
+        service.apply_snapshot(updated)
+
+        assert updated.version == 2
+        assert len(await service.handle(_signal("SOLUSDT"))) == 1
+        # Unchanged content does not bump the version.
+        assert (await refresher.refresh_once()).version == 2
+
+    asyncio.run(_run())
+
+
+def test_risk_rejects_halted_symbol_and_below_min_notional():
+    spot = parse_exchange_info("spot", _spot_info({"BTCUSDT": "TRADING", "ETHUSDT": "BREAK"}))
+    universe = build_universe_snapshot({"BTCUSDT", "ETHUSDT"}, spot, {}, version=1)
+    settings = AppSettings(bus_backend="memory", account_equity_usd=100000)
+    svc = RiskService(settings, MemoryTradingStateStore(), universe=universe)
+
+    halted = asyncio.run(svc.handle_order_intent(_intent("ETHUSDT")))
+    assert halted[0][1]["reason_code"] == "SYMBOL_NOT_TRADING"
+
+    tiny = asyncio.run(svc.handle_order_intent(_intent("BTCUSDT", qty_usd=2.0)))
+    assert tiny[0][1]["reason_code"] == "BELOW_MIN_NOTIONAL"
+
+    svc.apply_universe(UniverseSnapshot.from_symbols({"BTCUSDT", "ETHUSDT"}, version=2))
+    assert asyncio.run(svc.handle_order_intent(_intent("ETHUSDT")))[0][0] == Streams.ORDER_APPROVED